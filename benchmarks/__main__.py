@@ -0,0 +1,54 @@
+# benchmarks.__main__.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The main module of benchmarks runs the micro-benchmarks of the 
+    package Stopwatch and prints the cost of each operation.
+'''
+
+import watch
+import fast
+import threadsafe
+import timing
+import columnar
+import persist
+import exposition
+import snapshot
+
+
+# define main function
+
+def main():
+    watch.benchmarks()
+    fast.benchmarks()
+    threadsafe.benchmarks()
+    timing.benchmarks()
+    columnar.benchmarks()
+    persist.benchmarks()
+    exposition.benchmarks()
+    snapshot.benchmarks()
+
+
+# define virtual main function
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# benchmarks.columnar.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures the batch operations of a StopwatchManager 
+    and of a ColumnarStopwatchManager holding many stopwatches.
+'''
+
+from measure import measure
+
+from stopwatch import StopwatchManager
+from stopwatch import ColumnarStopwatchManager
+from stopwatch.columnar import numpy
+
+
+# define measure_manager function
+
+def measure_manager(
+    benchmark_name: str,
+    benchmark_manager,
+    stopwatch_count: int
+):
+    for count in range(stopwatch_count):
+        benchmark_manager.create('benchmarks::watch' + str(count))
+
+    measure(benchmark_name + ' starts()+stops()', 
+        lambda: (benchmark_manager.starts(), benchmark_manager.stops()), 100)
+    measure(benchmark_name + ' get_watchs()', benchmark_manager.get_watchs, 100)
+
+
+# define benchmarks function
+
+def benchmarks():
+    stopwatch_count: int = 10000
+
+    measure_manager('StopwatchManager x10000', StopwatchManager(), stopwatch_count)
+    measure_manager('Columnar (array) x10000', 
+        ColumnarStopwatchManager(use_numpy = False), stopwatch_count)
+
+    if numpy is not None:
+        measure_manager('Columnar (numpy) x10000', 
+            ColumnarStopwatchManager(use_numpy = True), stopwatch_count)
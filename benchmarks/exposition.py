@@ -0,0 +1,63 @@
+# benchmarks.exposition.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures StopwatchManager.render_openmetrics for a manager with 
+    many stopwatches: the first render, a render of an unchanged manager and 
+    a render after a few stopwatches changed.
+'''
+
+import time
+
+from measure import measure
+
+from stopwatch import StopwatchManager
+
+
+# define benchmarks function
+
+def benchmarks():
+    benchmark_manager: StopwatchManager = StopwatchManager(
+        stopwatch_histogram_buckets = [0.001, 0.01, 0.1, 1.0]
+    )
+
+    for count in range(50000):
+        benchmark_manager.create('benchmarks::watch' + str(count)).record(count * 1000)
+
+    benchmark_cost: int = time.perf_counter_ns()
+    benchmark_manager.render_openmetrics()
+    benchmark_cost = time.perf_counter_ns() - benchmark_cost
+
+    print('{BENCHMARK_NAME:<48} {BENCHMARK_COST:>12.1f} ns'.format(
+        BENCHMARK_NAME = 'render_openmetrics 50k, first',
+        BENCHMARK_COST = benchmark_cost
+    ))
+
+    measure('render_openmetrics 50k, unchanged', benchmark_manager.render_openmetrics, 1000)
+
+    def render_changed():
+        for count in range(10):
+            benchmark_manager.get('benchmarks::watch' + str(count * 4999)).record(1000)
+
+        benchmark_manager.render_openmetrics()
+
+    measure('render_openmetrics 50k, 10 changed', render_changed, 10)
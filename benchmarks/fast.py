@@ -0,0 +1,64 @@
+# benchmarks.fast.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures the per-call overhead of Stopwatch 
+    and FastStopwatch on the timing hot path.
+'''
+
+import time
+
+from measure import measure
+
+from stopwatch import Stopwatch
+from stopwatch import FastStopwatch
+
+
+# define benchmarks function
+
+def benchmarks():
+    clock_cost: float = measure('time.perf_counter_ns()', time.perf_counter_ns)
+
+    test_stopwatch: Stopwatch = Stopwatch(compact_laps = True)
+    test_stopwatch.start()
+
+    measure('Stopwatch.lap()', test_stopwatch.lap)
+
+    test_stopwatch.stop()
+
+    measure('Stopwatch.start() + Stopwatch.stop()', 
+        lambda: (test_stopwatch.start(), test_stopwatch.stop()))
+
+    test_fast_stopwatch: FastStopwatch = FastStopwatch()
+    test_fast_stopwatch.start()
+
+    fast_lap_cost: float = measure('FastStopwatch.lap()', test_fast_stopwatch.lap)
+
+    test_fast_stopwatch.stop()
+
+    measure('FastStopwatch.start() + FastStopwatch.stop()', 
+        lambda: (test_fast_stopwatch.start(), test_fast_stopwatch.stop()))
+
+    print('{BENCHMARK_NAME:<48} {BENCHMARK_COST:>12.1f} ns'.format(
+        BENCHMARK_NAME = 'FastStopwatch.lap() overhead over the clock',
+        BENCHMARK_COST = fast_lap_cost - clock_cost
+    ))
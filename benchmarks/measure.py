@@ -0,0 +1,59 @@
+# benchmarks.measure.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements the measuring helpers shared by the package benchmarks.
+'''
+
+import timeit
+
+
+# define measure function
+
+def measure(
+    benchmark_name: str,
+    benchmark_function,
+    benchmark_number: int = 1000000
+) -> float:
+    '''
+    Measure and print the average cost (in nanoseconds) of a function call.
+
+    The best of three runs is reported to reduce scheduling noise.
+
+    Args:
+        benchmark_name, str: The name printed with the result.
+        benchmark_function, callable: The function to be measured, without arguments.
+        benchmark_number, int: The number of calls per run.
+
+    Returns:
+        Returns the average cost (in nanoseconds) of a call.
+    '''
+
+    benchmark_cost: float = min(timeit.repeat(benchmark_function, 
+        repeat = 3, number = benchmark_number)) / benchmark_number * 1e9
+
+    print('{BENCHMARK_NAME:<48} {BENCHMARK_COST:>12.1f} ns'.format(
+        BENCHMARK_NAME = benchmark_name,
+        BENCHMARK_COST = benchmark_cost
+    ))
+
+    return benchmark_cost
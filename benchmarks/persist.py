@@ -0,0 +1,93 @@
+# benchmarks.persist.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures the save and load throughput of StopwatchManager.dump 
+    and load against pickle, for a manager with many stopwatches and laps.
+'''
+
+import io
+import time
+import pickle
+
+from stopwatch import Stopwatch
+from stopwatch import StopwatchManager
+
+
+# define measure_format function
+
+def measure_format(
+    benchmark_name: str,
+    dump_function,
+    load_function
+):
+    dump_file: io.BytesIO = io.BytesIO()
+
+    dump_count: int = time.perf_counter_ns()
+    dump_function(dump_file)
+    dump_count = time.perf_counter_ns() - dump_count
+
+    dump_file.seek(0)
+
+    load_count: int = time.perf_counter_ns()
+    load_function(dump_file)
+    load_count = time.perf_counter_ns() - load_count
+
+    print('{BENCHMARK_NAME:<32} {DUMP_SIZE:>10.1f} MB {DUMP_COST:>10.1f} ms save {LOAD_COST:>10.1f} ms load'.format(
+        BENCHMARK_NAME = benchmark_name,
+        DUMP_SIZE = len(dump_file.getvalue()) / 1e6,
+        DUMP_COST = dump_count / 1e6,
+        LOAD_COST = load_count / 1e6
+    ))
+
+
+# define create_manager function
+
+def create_manager(
+    compact_laps: bool
+) -> StopwatchManager:
+    benchmark_manager: StopwatchManager = StopwatchManager()
+
+    for count in range(1000):
+        benchmark_stopwatch: Stopwatch = Stopwatch(compact_laps = compact_laps)
+
+        for lap_count in range(1000):
+            benchmark_stopwatch.record(lap_count)
+
+        benchmark_manager.add('benchmarks::watch' + str(count), benchmark_stopwatch)
+
+    return benchmark_manager
+
+
+# define benchmarks function
+
+def benchmarks():
+    for compact_laps in (False, True):
+        benchmark_manager: StopwatchManager = create_manager(compact_laps)
+        benchmark_suffix: str = ', compact' if compact_laps else ''
+
+        measure_format('pickle 1000x1000 laps' + benchmark_suffix, 
+            lambda dump_file: pickle.dump(benchmark_manager, dump_file, pickle.HIGHEST_PROTOCOL), 
+            pickle.load)
+        measure_format('dump 1000x1000 laps' + benchmark_suffix, 
+            benchmark_manager.dump, 
+            lambda load_file: StopwatchManager().load(load_file))
@@ -0,0 +1,59 @@
+# benchmarks.snapshot.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures StopwatchManager.snapshot for a manager with many 
+    stopwatches, against reading every stopwatch through its getters.
+'''
+
+from measure import measure
+
+from stopwatch import StopwatchManager
+
+
+# define benchmarks function
+
+def benchmarks():
+    benchmark_manager: StopwatchManager = StopwatchManager()
+
+    for count in range(10000):
+        benchmark_manager.create('benchmarks::watch' + str(count)).record(count * 1000)
+
+    benchmark_names: list = ['benchmarks::watch' + str(count) for count in range(10000)]
+
+    def read_getters():
+        for benchmark_name in benchmark_names:
+            benchmark_stopwatch = benchmark_manager.get(benchmark_name)
+            benchmark_stopwatch.get_status()
+            benchmark_stopwatch.get_watch_ns()
+            benchmark_stopwatch.get_lap_statistics()
+
+    measure('getters 10k', read_getters, 10)
+    measure('snapshot 10k, unchanged', benchmark_manager.snapshot, 10)
+
+    def snapshot_changed():
+        for count in range(100):
+            benchmark_manager.get(benchmark_names[count * 97]).record(1000)
+
+        benchmark_manager.snapshot()
+
+    measure('snapshot 10k, 100 changed', snapshot_changed, 10)
@@ -0,0 +1,126 @@
+# benchmarks.threadsafe.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures the throughput of create, get and remove calls made 
+    by many threads on a globally locked StopwatchManager and on a 
+    ConcurrentStopwatchManager.
+'''
+
+import time
+import threading
+
+from stopwatch import StopwatchManager
+from stopwatch import ConcurrentStopwatchManager
+
+
+# define LockedStopwatchManager class
+
+class LockedStopwatchManager:
+    '''
+    A StopwatchManager guarded by a single global lock, used as the baseline.
+    '''
+
+    def __init__(self):
+        self.__manager: StopwatchManager = StopwatchManager()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def create(self, stopwatch_name: str):
+        with self.__lock:
+            return self.__manager.create(stopwatch_name)
+
+    def get(self, stopwatch_name: str):
+        with self.__lock:
+            return self.__manager.get(stopwatch_name)
+
+    def remove(self, stopwatch_name: str):
+        with self.__lock:
+            self.__manager.remove(stopwatch_name)
+
+
+# define run_worker function
+
+def run_worker(
+    benchmark_manager,
+    worker_index: int,
+    operation_count: int
+):
+    stopwatch_prefix: str = 'benchmarks::worker' + str(worker_index) + '::'
+
+    for count in range(operation_count):
+        stopwatch_name: str = stopwatch_prefix + str(count)
+
+        benchmark_manager.create(stopwatch_name)
+        benchmark_manager.get(stopwatch_name)
+        benchmark_manager.remove(stopwatch_name)
+
+
+# define measure_contention function
+
+def measure_contention(
+    benchmark_name: str,
+    benchmark_manager,
+    thread_count: int = 8,
+    operation_count: int = 20000
+) -> float:
+    '''
+    Measure and print the throughput (in operations per second) of 
+        create, get and remove calls made by several threads.
+
+    Args:
+        benchmark_name, str: The name printed with the result.
+        benchmark_manager, object: The manager to be measured.
+        thread_count, int: The number of threads.
+        operation_count, int: The number of create, get and remove rounds per thread.
+
+    Returns:
+        Returns the throughput (in operations per second).
+    '''
+
+    benchmark_threads: list = [threading.Thread(target = run_worker, 
+        args = (benchmark_manager, worker_index, operation_count)) 
+        for worker_index in range(thread_count)]
+
+    benchmark_start: float = time.perf_counter()
+
+    for benchmark_thread in benchmark_threads:
+        benchmark_thread.start()
+
+    for benchmark_thread in benchmark_threads:
+        benchmark_thread.join()
+
+    benchmark_throughput: float = thread_count * operation_count * 3 / (
+        time.perf_counter() - benchmark_start)
+
+    print('{BENCHMARK_NAME:<48} {BENCHMARK_THROUGHPUT:>12.0f} ops/s'.format(
+        BENCHMARK_NAME = benchmark_name,
+        BENCHMARK_THROUGHPUT = benchmark_throughput
+    ))
+
+    return benchmark_throughput
+
+
+# define benchmarks function
+
+def benchmarks():
+    measure_contention('StopwatchManager + global lock, 8 threads', LockedStopwatchManager())
+    measure_contention('ConcurrentStopwatchManager, 8 threads', ConcurrentStopwatchManager())
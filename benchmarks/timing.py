@@ -0,0 +1,74 @@
+# benchmarks.timing.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures the cost of the timed decorator and context 
+    manager, enabled and disabled, against an uninstrumented call.
+'''
+
+import stopwatch.timing
+
+from measure import measure
+
+from stopwatch import timed
+from stopwatch import Stopwatch
+from stopwatch import StopwatchManager
+from stopwatch import FixedRateSampler
+
+
+# define run_function function
+
+def run_function():
+    pass
+
+
+# define run_block function
+
+def run_block(benchmark_manager: StopwatchManager):
+    with timed('benchmarks::block', benchmark_manager):
+        pass
+
+
+# define benchmarks function
+
+def benchmarks():
+    benchmark_manager: StopwatchManager = StopwatchManager()
+
+    measure('uninstrumented call', run_function)
+
+    stopwatch.timing.disable()
+
+    try:
+        measure('@timed call, disabled', timed('benchmarks::function', benchmark_manager)(run_function))
+        measure('with timed() block, disabled', lambda: run_block(benchmark_manager))
+    finally:
+        stopwatch.timing.enable()
+
+    benchmark_manager.add('benchmarks::function', Stopwatch(max_laps = 1024))
+    benchmark_manager.add('benchmarks::block', Stopwatch(max_laps = 1024))
+
+    measure('@timed call, enabled', timed('benchmarks::function', benchmark_manager)(run_function))
+    measure('with timed() block, enabled', lambda: run_block(benchmark_manager))
+
+    benchmark_manager.add('benchmarks::sampled', Stopwatch(max_laps = 1024, sampler = FixedRateSampler(0.01)))
+
+    measure('@timed call, 1% sampled', timed('benchmarks::sampled', benchmark_manager)(run_function))
@@ -0,0 +1,95 @@
+# benchmarks.watch.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module measures the construction cost and the memory 
+    footprint of Stopwatch instances.
+'''
+
+import sys
+import tracemalloc
+
+from measure import measure
+
+from stopwatch import Stopwatch
+
+
+# define measure_footprint function
+
+def measure_footprint(
+    benchmark_name: str,
+    benchmark_function,
+    benchmark_number: int = 100000
+) -> float:
+    '''
+    Measure and print the average memory (in bytes) retained per created object.
+
+    Args:
+        benchmark_name, str: The name printed with the result.
+        benchmark_function, callable: The function that creates an object, without arguments.
+        benchmark_number, int: The number of objects created.
+
+    Returns:
+        Returns the average memory (in bytes) retained per object.
+    '''
+
+    tracemalloc.start()
+
+    benchmark_objects: list = [benchmark_function() for count in range(benchmark_number)]
+    benchmark_footprint: float = (tracemalloc.get_traced_memory()[0] - 
+        sys.getsizeof(benchmark_objects)) / benchmark_number
+
+    tracemalloc.stop()
+
+    print('{BENCHMARK_NAME:<48} {BENCHMARK_FOOTPRINT:>12.1f} B'.format(
+        BENCHMARK_NAME = benchmark_name,
+        BENCHMARK_FOOTPRINT = benchmark_footprint
+    ))
+
+    return benchmark_footprint
+
+
+# define create_lapped_stopwatch function
+
+def create_lapped_stopwatch() -> Stopwatch:
+    test_stopwatch: Stopwatch = Stopwatch()
+
+    test_stopwatch.start()
+    test_stopwatch.lap()
+    test_stopwatch.stop()
+
+    return test_stopwatch
+
+
+# define benchmarks function
+
+def benchmarks():
+    measure('Stopwatch()', Stopwatch)
+    measure('Stopwatch(compact_laps = True)', lambda: Stopwatch(compact_laps = True))
+
+    print('{BENCHMARK_NAME:<48} {BENCHMARK_FOOTPRINT:>12} B'.format(
+        BENCHMARK_NAME = 'sys.getsizeof(Stopwatch())',
+        BENCHMARK_FOOTPRINT = sys.getsizeof(Stopwatch())
+    ))
+
+    measure_footprint('Stopwatch() footprint', Stopwatch)
+    measure_footprint('Stopwatch() footprint after one lap', create_lapped_stopwatch)
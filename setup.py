@@ -37,7 +37,12 @@ setuptools.setup(
     packages = [
         'stopwatch'
     ],
-    python_requires = '>=3.6',
+    python_requires = '>=3.8',
+    extras_require = {
+        'numpy': [
+            'numpy'
+        ]
+    },
     zip_safe = False,
     classifiers = (
         'Programming Language :: Python :: 3',
@@ -34,11 +34,40 @@ from stopwatch.version import Version
 from stopwatch.errors import StatusError
 from stopwatch.errors import LapNameError
 from stopwatch.errors import StopwatchNameError
+from stopwatch.errors import FormatError
 
 from stopwatch.watch import Stopwatch
 from stopwatch.watch import StopwatchStatus
 
+from stopwatch.fast import FastStopwatch
+from stopwatch.local import ThreadLocalStopwatch
+from stopwatch.local import TaskLocalStopwatch
+from stopwatch.spans import SpanStopwatch
+from stopwatch.spans import SpanNode
+
+from stopwatch.sampling import FixedRateSampler
+from stopwatch.sampling import AdaptiveSampler
+from stopwatch.sampling import ReservoirSampler
+
 from stopwatch.manager import StopwatchManager
+from stopwatch.threadsafe import ConcurrentStopwatchManager
+from stopwatch.shared import SharedStopwatchManager
+from stopwatch.columnar import ColumnarStopwatchManager
+
+from stopwatch.journal import LapJournal
+from stopwatch.journal import LapJournalReader
+
+from stopwatch.export import StopwatchExporter
+from stopwatch.export import AsyncStopwatchExporter
+from stopwatch.export import ExportSink
+from stopwatch.export import FileSink
+from stopwatch.export import StatsdSink
+from stopwatch.export import PrometheusSink
+
+from stopwatch.snapshot import StopwatchSnapshot
+from stopwatch.snapshot import SnapshotField
+
+from stopwatch.timing import timed
 
 
 # define __all__ variable
@@ -49,11 +78,40 @@ __all__: list = [
     'StatusError',
     'LapNameError',
     'StopwatchNameError',
+    'FormatError',
 
     'Stopwatch',
     'StopwatchStatus',
+
+    'FastStopwatch',
+    'ThreadLocalStopwatch',
+    'TaskLocalStopwatch',
+    'SpanStopwatch',
+    'SpanNode',
     
+    'FixedRateSampler',
+    'AdaptiveSampler',
+    'ReservoirSampler',
+
     'StopwatchManager',
+    'ConcurrentStopwatchManager',
+    'SharedStopwatchManager',
+    'ColumnarStopwatchManager',
+
+    'LapJournal',
+    'LapJournalReader',
+
+    'StopwatchExporter',
+    'AsyncStopwatchExporter',
+    'ExportSink',
+    'FileSink',
+    'StatsdSink',
+    'PrometheusSink',
+
+    'StopwatchSnapshot',
+    'SnapshotField',
+
+    'timed',
 ]
 
 
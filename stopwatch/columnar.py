@@ -0,0 +1,1034 @@
+# stopwatch.columnar.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements a column-oriented (struct-of-arrays) 
+    Stopwatch manager for very large numbers of stopwatches.
+'''
+
+import time
+import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import MAX_STOPWATCH_PRECISION
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.errors import StatusError
+from stopwatch.errors import StopwatchNameError
+from stopwatch.errors import MaxLimitError
+
+
+# define ColumnarField enum
+
+class ColumnarField:
+    '''
+    An enumerator of the columns of a ColumnarStopwatchManager.
+
+    Members:
+        Used, int: Whether the slot holds a stopwatch.
+        Status, int: The StopwatchStatus of the stopwatch.
+        Start, int: The clock reading of the last start.
+        Last, int: The clock reading of the last record.
+        Total, int: The total time of completed start and stop cycles.
+        LapCount, int: The number of records.
+        LapTotal, int: The sum of record durations.
+    '''
+
+    Used: int = 0
+    Status: int = 1
+    Start: int = 2
+    Last: int = 3
+    Total: int = 4
+    LapCount: int = 5
+    LapTotal: int = 6
+
+    Count: int = 7
+
+
+# define create_column function
+
+def create_column(
+    column_capacity: int,
+    use_numpy: bool
+):
+    '''
+    Allocate a zero-filled int64 column.
+
+    Args:
+        column_capacity, int: The number of slots.
+        use_numpy, bool: Whether to allocate a NumPy array instead of an array.array.
+
+    Returns:
+        Returns the allocated column.
+    '''
+
+    if use_numpy:
+        return numpy.zeros(column_capacity, dtype = numpy.int64)
+
+    return array.array('q', bytes(8 * column_capacity))
+
+
+# define grow_column function
+
+def grow_column(
+    column,
+    column_capacity: int
+):
+    '''
+    Grow a column to a larger number of slots, the new slots are zero.
+
+    Args:
+        column, array.array or numpy.ndarray: The column to be grown.
+        column_capacity, int: The new number of slots.
+
+    Returns:
+        Returns the grown column, which may be a new object.
+    '''
+
+    if isinstance(column, array.array):
+        column.frombytes(bytes(8 * (column_capacity - len(column))))
+        return column
+
+    grown_column = numpy.zeros(column_capacity, dtype = numpy.int64)
+    grown_column[:len(column)] = column
+
+    return grown_column
+
+
+# define StopwatchView class
+
+class StopwatchView:
+    '''
+    A thin handle on one stopwatch of a ColumnarStopwatchManager.
+
+    The view holds no timing state itself, every method reads or writes 
+        the columns of the manager. A view must not be used after its 
+        stopwatch has been removed, since the slot may be reused.
+    '''
+
+    __slots__ = (
+        '__view_manager',
+        '__view_slot',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        view_manager: 'ColumnarStopwatchManager',
+        view_slot: int
+    ):
+        '''
+        Constructs an instance of the StopwatchView class object.
+
+        Use ColumnarStopwatchManager.get or create instead of constructing it directly.
+
+        Args:
+            view_manager, ColumnarStopwatchManager: The manager that holds the columns.
+            view_slot, int: The slot of the stopwatch in the columns.
+        '''
+
+        self.__view_manager: ColumnarStopwatchManager = view_manager
+        self.__view_slot: int = view_slot
+
+
+    # define get_status function
+
+    def get_status(self) -> int:
+        '''
+        Get the status of the Stopwatch.
+
+        Returns:
+            Returns the current state of Stopwatch whose value is indicated using 
+                the StopwatchStatus enumerator.
+        '''
+
+        return self.__view_manager._get_slot_value(self.__view_slot, ColumnarField.Status)
+
+
+    # define start function
+
+    def start(self):
+        '''
+        Start running Stopwatch.
+
+        Raises:
+            StatusError: Stopwatch has started.
+        '''
+
+        self.__view_manager._start_slot(self.__view_slot, time.perf_counter_ns())
+
+
+    # define stop function
+
+    def stop(self) -> float:
+        '''
+        Stop running Stopwatch.
+
+        Returns:
+            Returns the total time (in seconds) that Stopwatch will count 
+                from the first time to the stop time.
+
+        Raises:
+            StatusError: Stopwatch has stopped or never started.
+        '''
+
+        self.__view_manager._stop_slot(self.__view_slot, time.perf_counter_ns())
+        return self.get_watch()
+
+
+    # define lap function
+
+    def lap(self) -> int:
+        '''
+        Record the interval from the last record (or the start) to the current time.
+
+        Only the number and the sum of records are kept.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            StatusError: Stopwatch has not started.
+        '''
+
+        return self.__view_manager._lap_slot(self.__view_slot, time.perf_counter_ns())
+
+
+    # define reset function
+
+    def reset(self):
+        '''
+        Reset Stopwatch.
+
+        Raises:
+            StatusError: Stopwatch has not stopped.
+        '''
+
+        if self.get_status() != StopwatchStatus.Stopped:
+            raise StatusError('stopwatch has started')
+
+        self.__view_manager._reset_slot(self.__view_slot)
+
+
+    # define get_lap_count function
+
+    def get_lap_count(self) -> int:
+        '''
+        Get the number of timed records.
+
+        Returns:
+            The number of timed records.
+        '''
+
+        return self.__view_manager._get_slot_value(self.__view_slot, ColumnarField.LapCount)
+
+
+    # define get_average_of_laps function
+
+    def get_average_of_laps(self,
+        average_precision: int = None
+    ) -> float:
+        '''
+        Get the average (in seconds) of all timing records.
+
+        Args:
+            average_precision, int: average precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                manager will be used.
+
+        Returns:
+            Returns the average (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        average_precision = self.__view_manager._get_precision(average_precision, 'average_precision')
+        lap_count: int = self.get_lap_count()
+
+        if lap_count == 0:
+            return 0
+
+        return round(self.__view_manager._get_slot_value(self.__view_slot, ColumnarField.LapTotal) / 
+            lap_count / NANOSECONDS_PER_SECOND, average_precision)
+
+
+    # define get_watch function
+
+    def get_watch(self,
+        watch_precision: int = None
+    ) -> float:
+        '''
+        Gets the statistical time (in seconds) that Stopwatch is from start to finish.
+
+        Args:
+            watch_precision, int: Watch precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                manager will be used.
+
+        Returns:
+            Returns the statistical time (in seconds) that Stopwatch is from start to finish.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        watch_precision = self.__view_manager._get_precision(watch_precision, 'watch_precision')
+        return round(self.get_watch_ns() / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_watch_ns function
+
+    def get_watch_ns(self) -> int:
+        '''
+        Gets the statistical time (in nanoseconds) that Stopwatch is from start to finish.
+
+        Returns:
+            Returns the statistical time (in nanoseconds) with a data type of int.
+        '''
+
+        return self.__view_manager._get_slot_watch_ns(self.__view_slot, time.perf_counter_ns())
+
+
+# define ColumnarStopwatchManager class
+
+class ColumnarStopwatchManager:
+    '''
+    Column-oriented Stopwatch multi-instance manager.
+
+    Instead of one Stopwatch object per name, the manager keeps the start 
+        counts, totals, statuses and lap aggregates of all stopwatches in 
+        parallel int64 columns indexed through a name to slot map, and hands 
+        out StopwatchView handles. Batch methods (starts, stops, resets, 
+        get_watchs) are single vectorized passes over the columns when NumPy 
+        is installed, and tight loops over array.array columns otherwise.
+    '''
+
+    # define __init__ function
+
+    def __init__(self,
+        max_stopwatch_count: int = None,
+        default_precision: int = 3,
+        use_numpy: bool = None
+    ):
+        '''
+        Constructs an instance of the ColumnarStopwatchManager class object.
+
+        Args:
+            max_stopwatch_count, int: The maximum number of stopwatches that can be 
+                accommodated. If this parameter is not supplied or the value is None, 
+                the number of stopwatches is not limited.
+            default_precision, int: The default precision (number of decimal places) 
+                of the stopwatches, whose value should be less than or equal to the 
+                constant MAX_STOPWATCH_PRECISION.
+            use_numpy, bool: Whether to store the columns in NumPy arrays. If this 
+                parameter is not supplied or the value is None, NumPy is used when 
+                it is installed.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if max_stopwatch_count and not isinstance(max_stopwatch_count, int):
+            raise ValueError('<max_stopwatch_count> value invalid')
+
+        if not default_precision or not isinstance(default_precision, int):
+            raise ValueError('<default_precision> value invalid')
+
+        if default_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<default_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif not isinstance(use_numpy, bool) or (use_numpy and numpy is None):
+            raise ValueError('<use_numpy> value invalid')
+
+        self.__max_stopwatch_count: int = max_stopwatch_count
+        self.__stopwatch_precision: int = default_precision
+        self.__use_numpy: bool = use_numpy
+
+        self.__stopwatch_slots: dict = dict()
+        self.__free_slots: list = list()
+        self.__slot_count: int = 0
+        self.__slot_capacity: int = 64
+
+        self.__columns: list = [create_column(self.__slot_capacity, use_numpy) 
+            for field_index in range(ColumnarField.Count)]
+
+
+    # define get_columns function
+
+    def get_columns(self) -> list:
+        '''
+        Get the columns of the manager, indexed by the ColumnarField enumerator.
+
+        The columns are returned without copying and cover the first 
+            get_slot_count slots. They are replaced when the manager grows, 
+            so they should not be kept across calls to create.
+
+        Returns:
+            Returns a list of int64 columns (NumPy arrays or array.array).
+        '''
+
+        return self.__columns
+
+
+    # define get_slot_count function
+
+    def get_slot_count(self) -> int:
+        '''
+        Get the number of slots in use or freed, that is the used length of every column.
+
+        Returns:
+            Returns the number of slots.
+        '''
+
+        return self.__slot_count
+
+
+    # define get_slot function
+
+    def get_slot(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Get the column slot of a stopwatch by name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the slot of the stopwatch.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        try:
+            return self.__stopwatch_slots[stopwatch_name]
+        except KeyError:
+            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+
+
+    # define get function
+
+    def get(self,
+        stopwatch_name: str
+    ) -> StopwatchView:
+        '''
+        Get a StopwatchView by name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns a StopwatchView of the specified stopwatch.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        return StopwatchView(self, self.get_slot(stopwatch_name))
+
+
+    # define create function
+
+    def create(self,
+        stopwatch_name: str
+    ) -> StopwatchView:
+        '''
+        Create a stopwatch.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns a StopwatchView of the created stopwatch.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is already a stopwatch with the same name.
+            MaxLimitError: The number of stopwatches has exceeded the limit of the 
+                constructor method max_stopwatch_count parameter.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        if stopwatch_name in self.__stopwatch_slots:
+            raise StopwatchNameError('stopwatch name already exists: ' + stopwatch_name)
+
+        if self.__max_stopwatch_count:
+            if len(self.__stopwatch_slots) >= self.__max_stopwatch_count:
+                raise MaxLimitError('max stopwatch instance limit')
+
+        if self.__free_slots:
+            stopwatch_slot: int = self.__free_slots.pop()
+        else:
+            if self.__slot_count >= self.__slot_capacity:
+                self.__slot_capacity *= 2
+                self.__columns = [grow_column(column, self.__slot_capacity) for column in self.__columns]
+
+            stopwatch_slot: int = self.__slot_count
+            self.__slot_count += 1
+
+        self.__columns[ColumnarField.Used][stopwatch_slot] = 1
+        self.__stopwatch_slots[stopwatch_name] = stopwatch_slot
+
+        return StopwatchView(self, stopwatch_slot)
+
+
+    # define create_and_start function
+
+    def create_and_start(self,
+        stopwatch_name: str
+    ) -> StopwatchView:
+        '''
+        Create and start a stopwatch.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns a StopwatchView of the created stopwatch.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is already a stopwatch with the same name.
+            MaxLimitError: The number of stopwatches has exceeded the limit of the 
+                constructor method max_stopwatch_count parameter.
+        '''
+
+        stopwatch_view: StopwatchView = self.create(stopwatch_name)
+        stopwatch_view.start()
+
+        return stopwatch_view
+
+
+    # define remove function
+
+    def remove(self,
+        stopwatch_name: str
+    ):
+        '''
+        Remove the stopwatch with the specified name, its slot is cleared and reused.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        stopwatch_slot: int = self.get_slot(stopwatch_name)
+
+        for column in self.__columns:
+            column[stopwatch_slot] = 0
+
+        del self.__stopwatch_slots[stopwatch_name]
+        self.__free_slots.append(stopwatch_slot)
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all stopwatches.
+        '''
+
+        self.__stopwatch_slots.clear()
+        self.__free_slots.clear()
+        self.__slot_count = 0
+
+        self.__columns = [create_column(self.__slot_capacity, self.__use_numpy) 
+            for field_index in range(ColumnarField.Count)]
+
+
+    # define has function
+
+    def has(self,
+        stopwatch_name: str
+    ) -> bool:
+        '''
+        Check if the stopwatch with the specified name exists.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            There is a return of True; there is no return to False.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        return stopwatch_name in self.__stopwatch_slots
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Gets the number of stopwatches.
+
+        Returns:
+            Returns the number of stopwatches.
+        '''
+
+        return len(self.__stopwatch_slots)
+
+
+    # define get_names function
+
+    def get_names(self) -> list:
+        '''
+        Gets the names of all stopwatches.
+
+        Returns:
+            Returns a list of names.
+        '''
+
+        return list(self.__stopwatch_slots.keys())
+
+
+    # define __select_slots function
+
+    def __select_slots(self,
+        stopwatch_names: list,
+        field_index: int,
+        field_value: int
+    ):
+        '''
+        Select the slots of a batch or all of the stopwatches whose field has a value.
+
+        Args:
+            stopwatch_names, list: A list of unique names. If the value is None, 
+                all stopwatches are selected.
+            field_index, int: The ColumnarField member to be compared.
+            field_value, int: The value the field should have.
+
+        Returns:
+            Returns the selected slots (a NumPy index array or a list).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        field_column = self.__columns[field_index]
+
+        if stopwatch_names:
+            stopwatch_slots: list = sorted(set(self.get_slot(stopwatch_name) 
+                for stopwatch_name in stopwatch_names))
+
+            if self.__use_numpy:
+                stopwatch_slots = numpy.array(stopwatch_slots, dtype = numpy.intp)
+                return stopwatch_slots[field_column[stopwatch_slots] == field_value]
+
+            return [stopwatch_slot for stopwatch_slot in stopwatch_slots 
+                if field_column[stopwatch_slot] == field_value]
+
+        used_column = self.__columns[ColumnarField.Used]
+
+        if self.__use_numpy:
+            return numpy.flatnonzero((used_column[:self.__slot_count] == 1) & 
+                (field_column[:self.__slot_count] == field_value))
+
+        return [stopwatch_slot for stopwatch_slot in range(self.__slot_count) 
+            if used_column[stopwatch_slot] and field_column[stopwatch_slot] == field_value]
+
+
+    # define starts function
+
+    def starts(self,
+        stopwatch_names: list = None
+    ) -> int:
+        '''
+        Start a specified batch or all of the stopwatches at one clock reading.
+
+        Stopwatches that have started are skipped.
+
+        Args:
+            stopwatch_names, list: A list of unique names. If this parameter is not 
+                supplied or the value is None, all stopwatches are started.
+
+        Returns:
+            Returns the number of stopwatches that actually started.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        stopwatch_slots = self.__select_slots(stopwatch_names, ColumnarField.Status, StopwatchStatus.Stopped)
+        stopwatch_start_count: int = time.perf_counter_ns()
+
+        start_column = self.__columns[ColumnarField.Start]
+        status_column = self.__columns[ColumnarField.Status]
+
+        if self.__use_numpy:
+            start_column[stopwatch_slots] = stopwatch_start_count
+            status_column[stopwatch_slots] = StopwatchStatus.Started
+        else:
+            for stopwatch_slot in stopwatch_slots:
+                start_column[stopwatch_slot] = stopwatch_start_count
+                status_column[stopwatch_slot] = StopwatchStatus.Started
+
+        return len(stopwatch_slots)
+
+
+    # define stops function
+
+    def stops(self,
+        stopwatch_names: list = None
+    ) -> int:
+        '''
+        Stop a specified batch or all of the stopwatches at one clock reading.
+
+        Stopwatches that have stopped are skipped.
+
+        Args:
+            stopwatch_names, list: A list of unique names. If this parameter is not 
+                supplied or the value is None, all stopwatches are stopped.
+
+        Returns:
+            Returns the number of stopwatches that were actually stopped.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        stopwatch_slots = self.__select_slots(stopwatch_names, ColumnarField.Status, StopwatchStatus.Started)
+        stopwatch_stop_count: int = time.perf_counter_ns()
+
+        start_column = self.__columns[ColumnarField.Start]
+        total_column = self.__columns[ColumnarField.Total]
+        status_column = self.__columns[ColumnarField.Status]
+
+        if self.__use_numpy:
+            total_column[stopwatch_slots] += stopwatch_stop_count - start_column[stopwatch_slots]
+            status_column[stopwatch_slots] = StopwatchStatus.Stopped
+        else:
+            for stopwatch_slot in stopwatch_slots:
+                total_column[stopwatch_slot] += stopwatch_stop_count - start_column[stopwatch_slot]
+                status_column[stopwatch_slot] = StopwatchStatus.Stopped
+
+        return len(stopwatch_slots)
+
+
+    # define resets function
+
+    def resets(self,
+        stopwatch_names: list = None
+    ):
+        '''
+        Stop and reset a specified batch or all of the stopwatches.
+
+        Args:
+            stopwatch_names, list: A list of unique names. If this parameter is not 
+                supplied or the value is None, all stopwatches are reset.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        self.stops(stopwatch_names)
+
+        stopwatch_slots = self.__select_slots(stopwatch_names, ColumnarField.Used, 1)
+
+        if self.__use_numpy:
+            for field_index in (ColumnarField.Start, ColumnarField.Last, ColumnarField.Total, 
+                ColumnarField.LapCount, ColumnarField.LapTotal):
+                self.__columns[field_index][stopwatch_slots] = 0
+        else:
+            for stopwatch_slot in stopwatch_slots:
+                self._reset_slot(stopwatch_slot)
+
+
+    # define get_watchs_ns function
+
+    def get_watchs_ns(self,
+        stopwatch_names: list = None
+    ) -> int:
+        '''
+        Gets the exact total duration (in nanoseconds) of a specified batch 
+            or all of the stopwatches, including running cycles.
+
+        Args:
+            stopwatch_names, list: A list of unique names. If this parameter is not 
+                supplied or the value is None, all stopwatches are summed.
+
+        Returns:
+            Returns the total time (in nanoseconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        stopwatch_slots = self.__select_slots(stopwatch_names, ColumnarField.Used, 1)
+        stopwatch_count: int = time.perf_counter_ns()
+
+        start_column = self.__columns[ColumnarField.Start]
+        total_column = self.__columns[ColumnarField.Total]
+        status_column = self.__columns[ColumnarField.Status]
+
+        if self.__use_numpy:
+            started_slots = stopwatch_slots[status_column[stopwatch_slots] == StopwatchStatus.Started]
+
+            # Sum the differences, a sum of clock readings overflows int64.
+            return int(total_column[stopwatch_slots].sum()) + \
+                int((stopwatch_count - start_column[started_slots]).sum())
+
+        watch_total: int = 0
+
+        for stopwatch_slot in stopwatch_slots:
+            watch_total += total_column[stopwatch_slot]
+
+            if status_column[stopwatch_slot] == StopwatchStatus.Started:
+                watch_total += stopwatch_count - start_column[stopwatch_slot]
+
+        return watch_total
+
+
+    # define get_watchs function
+
+    def get_watchs(self,
+        stopwatch_names: list = None,
+        watch_precision: int = None
+    ) -> float:
+        '''
+        Gets the total duration (in seconds) of a specified batch or all of the stopwatches.
+
+        The total is summed exactly in nanoseconds and rounded once.
+
+        Args:
+            stopwatch_names, list: A list of unique names. If this parameter is not 
+                supplied or the value is None, all stopwatches are summed.
+            watch_precision, int: Watch precision (number of decimal places).
+                If not provided or not, the default precision will be used.
+
+        Returns:
+            Returns the total time (in seconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such stopwatch.
+        '''
+
+        watch_precision = self._get_precision(watch_precision, 'watch_precision')
+        return round(self.get_watchs_ns(stopwatch_names) / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define _get_precision function
+
+    def _get_precision(self,
+        precision: int,
+        precision_name: str
+    ) -> int:
+        '''
+        Validate a precision parameter, falling back to the default precision.
+
+        Args:
+            precision, int: The precision (number of decimal places) or None.
+            precision_name, str: The parameter name used in error messages.
+
+        Returns:
+            Returns the precision to be used.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not precision:
+            return self.__stopwatch_precision
+        if not isinstance(precision, int):
+            raise ValueError('<' + precision_name + '> value invalid')
+        if precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<' + precision_name + '> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        return precision
+
+
+    # define _get_slot_value function
+
+    def _get_slot_value(self,
+        stopwatch_slot: int,
+        field_index: int
+    ) -> int:
+        '''
+        Read a field of a slot.
+
+        Args:
+            stopwatch_slot, int: The slot of the stopwatch.
+            field_index, int: The ColumnarField member to be read.
+
+        Returns:
+            Returns the value of the field.
+        '''
+
+        return int(self.__columns[field_index][stopwatch_slot])
+
+
+    # define _start_slot function
+
+    def _start_slot(self,
+        stopwatch_slot: int,
+        start_count: int
+    ):
+        '''
+        Start the stopwatch of a slot.
+
+        Args:
+            stopwatch_slot, int: The slot of the stopwatch.
+            start_count, int: The clock reading to start from.
+
+        Raises:
+            StatusError: Stopwatch has started.
+        '''
+
+        if self.__columns[ColumnarField.Status][stopwatch_slot] != StopwatchStatus.Stopped:
+            raise StatusError('stopwatch has started')
+
+        self.__columns[ColumnarField.Start][stopwatch_slot] = start_count
+        self.__columns[ColumnarField.Status][stopwatch_slot] = StopwatchStatus.Started
+
+
+    # define _stop_slot function
+
+    def _stop_slot(self,
+        stopwatch_slot: int,
+        stop_count: int
+    ):
+        '''
+        Stop the stopwatch of a slot.
+
+        Args:
+            stopwatch_slot, int: The slot of the stopwatch.
+            stop_count, int: The clock reading to stop at.
+
+        Raises:
+            StatusError: Stopwatch has stopped or never started.
+        '''
+
+        if self.__columns[ColumnarField.Status][stopwatch_slot] != StopwatchStatus.Started:
+            raise StatusError('stopwatch has stopped')
+
+        self.__columns[ColumnarField.Total][stopwatch_slot] += \
+            stop_count - int(self.__columns[ColumnarField.Start][stopwatch_slot])
+        self.__columns[ColumnarField.Status][stopwatch_slot] = StopwatchStatus.Stopped
+
+
+    # define _lap_slot function
+
+    def _lap_slot(self,
+        stopwatch_slot: int,
+        lap_count: int
+    ) -> int:
+        '''
+        Record a lap on the stopwatch of a slot.
+
+        Args:
+            stopwatch_slot, int: The slot of the stopwatch.
+            lap_count, int: The clock reading of the lap.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            StatusError: Stopwatch has not started.
+        '''
+
+        if self.__columns[ColumnarField.Status][stopwatch_slot] != StopwatchStatus.Started:
+            raise StatusError('stopwatch did not start')
+
+        if self.__columns[ColumnarField.LapCount][stopwatch_slot]:
+            last_count: int = int(self.__columns[ColumnarField.Last][stopwatch_slot])
+        else:
+            last_count: int = int(self.__columns[ColumnarField.Start][stopwatch_slot])
+
+        self.__columns[ColumnarField.Last][stopwatch_slot] = lap_count
+        self.__columns[ColumnarField.LapCount][stopwatch_slot] += 1
+        self.__columns[ColumnarField.LapTotal][stopwatch_slot] += lap_count - last_count
+
+        return lap_count - last_count
+
+
+    # define _reset_slot function
+
+    def _reset_slot(self,
+        stopwatch_slot: int
+    ):
+        '''
+        Clear the timing fields of a slot.
+
+        Args:
+            stopwatch_slot, int: The slot of the stopwatch.
+        '''
+
+        for field_index in (ColumnarField.Start, ColumnarField.Last, ColumnarField.Total, 
+            ColumnarField.LapCount, ColumnarField.LapTotal):
+            self.__columns[field_index][stopwatch_slot] = 0
+
+
+    # define _get_slot_watch_ns function
+
+    def _get_slot_watch_ns(self,
+        stopwatch_slot: int,
+        watch_count: int
+    ) -> int:
+        '''
+        Compute the total time of the stopwatch of a slot.
+
+        Args:
+            stopwatch_slot, int: The slot of the stopwatch.
+            watch_count, int: The current clock reading.
+
+        Returns:
+            Returns the total time (in nanoseconds).
+        '''
+
+        watch_total: int = int(self.__columns[ColumnarField.Total][stopwatch_slot])
+
+        if self.__columns[ColumnarField.Status][stopwatch_slot] == StopwatchStatus.Started:
+            watch_total += watch_count - int(self.__columns[ColumnarField.Start][stopwatch_slot])
+
+        return watch_total
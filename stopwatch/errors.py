@@ -89,3 +89,17 @@ class MaxLimitError(Error):
     '''
 
     pass
+
+
+# define FormatError exception class
+
+class FormatError(Error):
+    '''
+    The saved Stopwatch data is invalid.
+
+    For example, loading a file that was not written by dump, that was 
+        written by a newer format version, or that is truncated will 
+        cause this exception.
+    '''
+
+    pass
@@ -0,0 +1,1125 @@
+# stopwatch.export.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements background exporters, which periodically 
+    collect the Stopwatch instances of a manager and hand the batches to 
+    pluggable sinks (a file, a StatsD agent or a Prometheus text file), so 
+    that the timed code never serializes or sends anything itself.
+'''
+
+import os
+import abc
+import json
+import time
+import queue
+import socket
+import asyncio
+import threading
+
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.manager import StopwatchManager
+
+from stopwatch.exposition import escape_label
+
+from stopwatch.errors import StatusError
+from stopwatch.errors import StopwatchNameError
+
+
+# define STATSD_NAME_TABLE const
+
+STATSD_NAME_TABLE: dict = str.maketrans({character: '_' for character in ':|@# \t\n'})
+
+
+# define ExportField enum
+
+class ExportField:
+    '''
+    An enumerator of the fields of an exported record.
+
+    Members:
+        Name, int: The unique name of the Stopwatch instance.
+        Watch, int: The total time (in nanoseconds).
+        LapCount, int: The (estimated, if sampled) number of timing records.
+        LapTotal, int: The sum of the kept record durations (in nanoseconds).
+        LapMin, int: The shortest record duration (in nanoseconds).
+        LapMax, int: The longest record duration (in nanoseconds).
+    '''
+
+    Name: int = 0
+    Watch: int = 1
+    LapCount: int = 2
+    LapTotal: int = 3
+    LapMin: int = 4
+    LapMax: int = 5
+
+    Count: int = 6
+
+
+# define ExportBatch class
+
+class ExportBatch:
+    '''
+    The records of the Stopwatch instances of a manager collected at one time.
+    '''
+
+    __slots__ = (
+        '__export_time',
+        '__export_records',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        export_time: int,
+        export_records: list
+    ):
+        '''
+        Constructs an instance of the ExportBatch class object.
+
+        Args:
+            export_time, int: The wall-clock time (in nanoseconds since the epoch) 
+                of the collection.
+            export_records, list: A list of record tuples, whose fields are 
+                indicated using the ExportField enumerator.
+        '''
+
+        self.__export_time: int = export_time
+        self.__export_records: list = export_records
+
+
+    # define get_time function
+
+    def get_time(self) -> int:
+        '''
+        Get the wall-clock time of the collection.
+
+        Returns:
+            Returns the time (in nanoseconds since the epoch).
+        '''
+
+        return self.__export_time
+
+
+    # define get_records function
+
+    def get_records(self) -> list:
+        '''
+        Get the records of the batch.
+
+        Returns:
+            Returns a list of record tuples, whose fields are indicated using 
+                the ExportField enumerator.
+        '''
+
+        return self.__export_records
+
+
+# define collect_batch function
+
+def collect_batch(
+    stopwatch_manager: StopwatchManager,
+    stopwatch_names: list = None
+) -> ExportBatch:
+    '''
+    Collect the records of a specified batch or all of the Stopwatch instances 
+        of a manager.
+
+    Names that are no longer in the manager, for example because the Stopwatch 
+        instance was removed after the exporter was created, are skipped.
+
+    Args:
+        stopwatch_manager, StopwatchManager: The manager to be collected.
+        stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+            If this parameter is not supplied or the value is None, all Stopwatch 
+            instances are collected.
+
+    Returns:
+        Returns an ExportBatch instance.
+    '''
+
+    export_records: list = list()
+
+    try:
+        stopwatch_instances: list = stopwatch_manager._select(stopwatch_names)
+    except StopwatchNameError:
+        stopwatch_instances = list()
+
+        for stopwatch_name in stopwatch_names:
+            try:
+                stopwatch_instances.extend(stopwatch_manager._select([stopwatch_name]))
+            except StopwatchNameError:
+                pass
+
+    for stopwatch_name, stopwatch_instance in stopwatch_instances:
+        lap_statistics = stopwatch_instance.get_lap_statistics()
+
+        export_records.append((
+            stopwatch_name,
+            stopwatch_instance.get_watch_ns(),
+            stopwatch_instance.get_estimated_lap_count(),
+            lap_statistics.get_total(),
+            lap_statistics.get_min(),
+            lap_statistics.get_max(),
+        ))
+
+    return ExportBatch(time.time_ns(), export_records)
+
+
+# define offer_batch function
+
+def offer_batch(
+    export_queue,
+    export_batch: ExportBatch
+) -> bool:
+    '''
+    Put a batch into a bounded queue without waiting. If the queue is full, the 
+        oldest batch is dropped instead, since a newer batch supersedes it.
+
+    Args:
+        export_queue, queue.Queue or asyncio.Queue: The queue of a sink.
+        export_batch, ExportBatch: The batch to be queued.
+
+    Returns:
+        Returns False if a batch was dropped, otherwise True.
+    '''
+
+    try:
+        export_queue.put_nowait(export_batch)
+        return True
+    except (queue.Full, asyncio.QueueFull):
+        pass
+
+    try:
+        export_queue.get_nowait()
+    except (queue.Empty, asyncio.QueueEmpty):
+        pass
+
+    try:
+        export_queue.put_nowait(export_batch)
+    except (queue.Full, asyncio.QueueFull):
+        pass
+
+    return False
+
+
+# define render_prometheus function
+
+def render_prometheus(
+    export_batch: ExportBatch,
+    metric_prefix: str = 'stopwatch'
+) -> str:
+    '''
+    Render a batch in the Prometheus text exposition format.
+
+    Args:
+        export_batch, ExportBatch: The batch to be rendered.
+        metric_prefix, str: The prefix of the metric names.
+
+    Returns:
+        Returns the rendered text.
+    '''
+
+    export_lines: list = list()
+
+    for export_field, metric_name, metric_type, metric_help, metric_scale in (
+        (ExportField.Watch, '_watch_seconds_total', 'counter', 'Total time measured by the stopwatch.', NANOSECONDS_PER_SECOND),
+        (ExportField.LapCount, '_laps_total', 'counter', 'Number of timing records.', None),
+        (ExportField.LapTotal, '_lap_seconds_total', 'counter', 'Sum of the timing record durations.', NANOSECONDS_PER_SECOND),
+        (ExportField.LapMin, '_lap_seconds_min', 'gauge', 'Shortest timing record duration.', NANOSECONDS_PER_SECOND),
+        (ExportField.LapMax, '_lap_seconds_max', 'gauge', 'Longest timing record duration.', NANOSECONDS_PER_SECOND),
+    ):
+        metric_name = metric_prefix + metric_name
+
+        export_lines.append('# HELP ' + metric_name + ' ' + metric_help)
+        export_lines.append('# TYPE ' + metric_name + ' ' + metric_type)
+
+        for export_record in export_batch.get_records():
+            export_lines.append('{NAME}{{stopwatch="{LABEL}"}} {VALUE}'.format(
+                NAME = metric_name,
+                LABEL = escape_label(export_record[ExportField.Name]),
+                VALUE = export_record[export_field] / metric_scale if metric_scale else export_record[export_field]
+            ))
+
+    return '\n'.join(export_lines) + '\n'
+
+
+# define render_statsd function
+
+def render_statsd(
+    export_batch: ExportBatch,
+    metric_prefix: str = 'stopwatch.'
+) -> list:
+    '''
+    Render a batch as StatsD gauge lines, durations are in milliseconds.
+
+    Args:
+        export_batch, ExportBatch: The batch to be rendered.
+        metric_prefix, str: The prefix of the metric names.
+
+    Returns:
+        Returns a list of lines.
+    '''
+
+    export_lines: list = list()
+
+    for export_record in export_batch.get_records():
+        metric_name: str = metric_prefix + export_record[ExportField.Name].translate(STATSD_NAME_TABLE)
+
+        export_lines.append('{NAME}.watch:{VALUE}|g'.format(NAME = metric_name, 
+            VALUE = export_record[ExportField.Watch] / 1000000))
+        export_lines.append('{NAME}.laps:{VALUE}|g'.format(NAME = metric_name, 
+            VALUE = export_record[ExportField.LapCount]))
+        export_lines.append('{NAME}.lap_max:{VALUE}|g'.format(NAME = metric_name, 
+            VALUE = export_record[ExportField.LapMax] / 1000000))
+
+    return export_lines
+
+
+# define ExportSink class
+
+class ExportSink(abc.ABC):
+    '''
+    The abstract base class of export sinks, a subclass implements write.
+
+    A sink is only called from the export worker of its own queue, so it does 
+        not need to be thread-safe, and it may block without delaying the 
+        timed code or the other sinks.
+    '''
+
+    __slots__ = ()
+
+    # define write function
+
+    @abc.abstractmethod
+    def write(self,
+        export_batch: ExportBatch
+    ):
+        '''
+        Write a batch.
+
+        Args:
+            export_batch, ExportBatch: The batch to be written.
+        '''
+
+
+    # define close function
+
+    def close(self):
+        '''
+        Release the resources of the sink.
+        '''
+
+        pass
+
+
+# define FileSink class
+
+class FileSink(ExportSink):
+    '''
+    An export sink that appends every batch to a file as a JSON line.
+    '''
+
+    __slots__ = (
+        '__export_file',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        file_path: str
+    ):
+        '''
+        Constructs an instance of the FileSink class object.
+
+        Args:
+            file_path, str: The path of the file, which is created if it does not exist.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not file_path or not isinstance(file_path, str):
+            raise ValueError('<file_path> value invalid')
+
+        self.__export_file = open(file_path, 'a', encoding = 'utf-8')
+
+
+    # define write function
+
+    def write(self,
+        export_batch: ExportBatch
+    ):
+        '''
+        Append a batch to the file.
+
+        Args:
+            export_batch, ExportBatch: The batch to be written.
+        '''
+
+        self.__export_file.write(json.dumps({
+            'time': export_batch.get_time(),
+            'records': [{
+                'name': export_record[ExportField.Name],
+                'watch_ns': export_record[ExportField.Watch],
+                'lap_count': export_record[ExportField.LapCount],
+                'lap_total_ns': export_record[ExportField.LapTotal],
+                'lap_min_ns': export_record[ExportField.LapMin],
+                'lap_max_ns': export_record[ExportField.LapMax],
+            } for export_record in export_batch.get_records()]
+        }) + '\n')
+
+        self.__export_file.flush()
+
+
+    # define close function
+
+    def close(self):
+        '''
+        Close the file.
+        '''
+
+        self.__export_file.close()
+
+
+# define StatsdSink class
+
+class StatsdSink(ExportSink):
+    '''
+    An export sink that sends every batch as StatsD gauge lines over UDP, 
+        packing as many lines into a datagram as fit.
+
+    The socket is non-blocking, a datagram that cannot be sent is dropped.
+    '''
+
+    __slots__ = (
+        '__statsd_address',
+        '__statsd_socket',
+        '__metric_prefix',
+        '__max_packet_size',
+        '__drop_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        statsd_host: str = '127.0.0.1',
+        statsd_port: int = 8125,
+        metric_prefix: str = 'stopwatch.',
+        max_packet_size: int = 1432
+    ):
+        '''
+        Constructs an instance of the StatsdSink class object.
+
+        Args:
+            statsd_host, str: The host of the StatsD agent.
+            statsd_port, int: The UDP port of the StatsD agent.
+            metric_prefix, str: The prefix of the metric names.
+            max_packet_size, int: The maximum size (in bytes) of a datagram.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not statsd_host or not isinstance(statsd_host, str):
+            raise ValueError('<statsd_host> value invalid')
+
+        if not isinstance(statsd_port, int) or statsd_port < 1 or statsd_port > 65535:
+            raise ValueError('<statsd_port> value invalid')
+
+        if not isinstance(metric_prefix, str):
+            raise ValueError('<metric_prefix> value invalid')
+
+        if not isinstance(max_packet_size, int) or max_packet_size < 64:
+            raise ValueError('<max_packet_size> value invalid')
+
+        statsd_family, statsd_type, statsd_protocol, statsd_name, self.__statsd_address = socket.getaddrinfo(
+            statsd_host, statsd_port, type = socket.SOCK_DGRAM)[0]
+
+        self.__statsd_socket: socket.socket = socket.socket(statsd_family, socket.SOCK_DGRAM)
+        self.__statsd_socket.setblocking(False)
+
+        self.__metric_prefix: str = metric_prefix
+        self.__max_packet_size: int = max_packet_size
+        self.__drop_count: int = 0
+
+
+    # define get_drop_count function
+
+    def get_drop_count(self) -> int:
+        '''
+        Get the number of datagrams that could not be sent.
+
+        Returns:
+            Returns the number of dropped datagrams.
+        '''
+
+        return self.__drop_count
+
+
+    # define __send function
+
+    def __send(self,
+        statsd_packet: bytes
+    ):
+        '''
+        Send a datagram, or drop it if it cannot be sent.
+
+        Args:
+            statsd_packet, bytes: The datagram.
+        '''
+
+        try:
+            self.__statsd_socket.sendto(statsd_packet, self.__statsd_address)
+        except OSError:
+            self.__drop_count += 1
+
+
+    # define write function
+
+    def write(self,
+        export_batch: ExportBatch
+    ):
+        '''
+        Send a batch.
+
+        Args:
+            export_batch, ExportBatch: The batch to be written.
+        '''
+
+        statsd_packet: bytes = b''
+
+        for export_line in render_statsd(export_batch, self.__metric_prefix):
+            export_line = export_line.encode('utf-8')
+
+            if statsd_packet and len(statsd_packet) + 1 + len(export_line) > self.__max_packet_size:
+                self.__send(statsd_packet)
+                statsd_packet = b''
+
+            statsd_packet = statsd_packet + b'\n' + export_line if statsd_packet else export_line
+
+        if statsd_packet:
+            self.__send(statsd_packet)
+
+
+    # define close function
+
+    def close(self):
+        '''
+        Close the socket.
+        '''
+
+        self.__statsd_socket.close()
+
+
+# define PrometheusSink class
+
+class PrometheusSink(ExportSink):
+    '''
+    An export sink that keeps the latest batch in a file in the Prometheus text 
+        exposition format, for example for the textfile collector of the 
+        node exporter.
+
+    The file is replaced atomically, so a scrape never reads a partial file.
+    '''
+
+    __slots__ = (
+        '__file_path',
+        '__metric_prefix',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        file_path: str,
+        metric_prefix: str = 'stopwatch'
+    ):
+        '''
+        Constructs an instance of the PrometheusSink class object.
+
+        Args:
+            file_path, str: The path of the file.
+            metric_prefix, str: The prefix of the metric names.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not file_path or not isinstance(file_path, str):
+            raise ValueError('<file_path> value invalid')
+
+        if not metric_prefix or not isinstance(metric_prefix, str):
+            raise ValueError('<metric_prefix> value invalid')
+
+        self.__file_path: str = file_path
+        self.__metric_prefix: str = metric_prefix
+
+
+    # define write function
+
+    def write(self,
+        export_batch: ExportBatch
+    ):
+        '''
+        Replace the file with a batch.
+
+        Args:
+            export_batch, ExportBatch: The batch to be written.
+        '''
+
+        temporary_path: str = self.__file_path + '.' + str(os.getpid()) + '.tmp'
+
+        with open(temporary_path, 'w', encoding = 'utf-8') as export_file:
+            export_file.write(render_prometheus(export_batch, self.__metric_prefix))
+
+        os.replace(temporary_path, self.__file_path)
+
+
+# define check_exporter_args function
+
+def check_exporter_args(
+    stopwatch_manager: StopwatchManager,
+    export_sinks: list,
+    export_interval: float,
+    queue_size: int,
+    stopwatch_names: list
+):
+    '''
+    Check the constructor parameters shared by the exporters.
+
+    Raises:
+        ValueError: The data type or value of the parameter is invalid.
+    '''
+
+    if not isinstance(stopwatch_manager, StopwatchManager):
+        raise ValueError('<stopwatch_manager> value invalid')
+
+    if not export_sinks or not isinstance(export_sinks, list) or not all(
+        isinstance(export_sink, ExportSink) for export_sink in export_sinks):
+        raise ValueError('<export_sinks> value invalid')
+
+    if not isinstance(export_interval, (int, float)) or export_interval <= 0:
+        raise ValueError('<export_interval> value invalid')
+
+    if not isinstance(queue_size, int) or queue_size < 1:
+        raise ValueError('<queue_size> value invalid')
+
+    if stopwatch_names and not isinstance(stopwatch_names, list):
+        raise ValueError('<stopwatch_names> value invalid')
+
+
+# define StopwatchExporter class
+
+class StopwatchExporter:
+    '''
+    A background exporter thread.
+
+    Every export_interval seconds the exporter collects the manager into a 
+        batch and offers it to a bounded queue per sink, each sink being 
+        written by its own worker thread. A sink that falls behind loses its 
+        oldest batches instead of blocking the collection or the other 
+        sinks, and an exception raised by a sink or by a background 
+        collection is counted and ignored.
+    '''
+
+    __slots__ = (
+        '__stopwatch_manager',
+        '__stopwatch_names',
+        '__export_sinks',
+        '__export_interval',
+        '__export_queues',
+        '__export_threads',
+        '__export_event',
+        '__export_count',
+        '__drop_count',
+        '__error_count',
+        '__count_lock',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        stopwatch_manager: StopwatchManager,
+        export_sinks: list,
+        export_interval: float = 10.0,
+        queue_size: int = 16,
+        stopwatch_names: list = None
+    ):
+        '''
+        Constructs an instance of the StopwatchExporter class object.
+
+        Args:
+            stopwatch_manager, StopwatchManager: The manager to be exported.
+            export_sinks, list: A list of ExportSink instances, which are closed 
+                when the exporter stops.
+            export_interval, float: The interval (in seconds) between collections.
+            queue_size, int: The maximum number of batches waiting for each sink.
+            stopwatch_names, list: A list of unique names for the Stopwatch instances 
+                to be exported. If this parameter is not supplied or the value is None, 
+                all Stopwatch instances are exported.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        check_exporter_args(stopwatch_manager, export_sinks, export_interval, queue_size, stopwatch_names)
+
+        self.__stopwatch_manager: StopwatchManager = stopwatch_manager
+        self.__stopwatch_names: list = stopwatch_names
+        self.__export_sinks: list = list(export_sinks)
+        self.__export_interval: float = export_interval
+
+        self.__export_queues: list = [queue.Queue(queue_size) for export_sink in export_sinks]
+        self.__export_threads: list = None
+        self.__export_event: threading.Event = threading.Event()
+
+        self.__export_count: int = 0
+        self.__drop_count: int = 0
+        self.__error_count: int = 0
+        self.__count_lock: threading.Lock = threading.Lock()
+
+
+    # define start function
+
+    def start(self):
+        '''
+        Start the collector and sink worker threads, which are daemon threads.
+
+        Raises:
+            StatusError: The exporter has already started, or it has stopped 
+                and closed the sinks.
+        '''
+
+        if self.__export_threads is not None:
+            raise StatusError('exporter has started' if self.__export_threads else 'exporter has stopped')
+
+        self.__export_threads = [threading.Thread(target = self.__run_collector, 
+            name = 'stopwatch-exporter', daemon = True)]
+
+        for export_sink, export_queue in zip(self.__export_sinks, self.__export_queues):
+            self.__export_threads.append(threading.Thread(target = self.__run_sink, 
+                args = (export_sink, export_queue), name = 'stopwatch-export-sink', daemon = True))
+
+        for export_thread in self.__export_threads:
+            export_thread.start()
+
+
+    # define stop function
+
+    def stop(self):
+        '''
+        Stop the exporter after a final collection, wait until the sinks have 
+            written the queued batches and close the sinks.
+
+        Raises:
+            StatusError: The exporter has not started, or it has already stopped.
+        '''
+
+        if not self.__export_threads:
+            raise StatusError('exporter did not start' if self.__export_threads is None else 'exporter has stopped')
+
+        self.__export_event.set()
+        self.__export_threads[0].join()
+
+        self.__collect()
+
+        for export_queue in self.__export_queues:
+            export_queue.put(None)
+
+        for export_thread in self.__export_threads[1:]:
+            export_thread.join()
+
+        for export_sink in self.__export_sinks:
+            export_sink.close()
+
+        # An empty list marks a stopped exporter, whose sinks are closed.
+        self.__export_threads = list()
+
+
+    # define export function
+
+    def export(self) -> bool:
+        '''
+        Collect the manager now and offer the batch to the sinks, without waiting.
+
+        Returns:
+            Returns False if a queued batch was dropped, otherwise True.
+        '''
+
+        export_batch: ExportBatch = collect_batch(self.__stopwatch_manager, self.__stopwatch_names)
+        export_result: bool = True
+
+        export_drop_count: int = 0
+
+        for export_queue in self.__export_queues:
+            if not offer_batch(export_queue, export_batch):
+                export_drop_count += 1
+                export_result = False
+
+        # The counters are updated by the caller, the collector and the sink threads.
+        with self.__count_lock:
+            self.__drop_count += export_drop_count
+            self.__export_count += 1
+
+        return export_result
+
+
+    # define get_export_count function
+
+    def get_export_count(self) -> int:
+        '''
+        Get the number of collected batches.
+
+        Returns:
+            Returns the number of batches.
+        '''
+
+        return self.__export_count
+
+
+    # define get_drop_count function
+
+    def get_drop_count(self) -> int:
+        '''
+        Get the number of batches dropped because a sink queue was full.
+
+        Returns:
+            Returns the number of dropped batches, counted once per sink.
+        '''
+
+        return self.__drop_count
+
+
+    # define get_error_count function
+
+    def get_error_count(self) -> int:
+        '''
+        Get the number of failed background collections and of batches that 
+            a sink failed to write.
+
+        Returns:
+            Returns the number of failures.
+        '''
+
+        return self.__error_count
+
+
+    # define __run_collector function
+
+    def __run_collector(self):
+        '''
+        Collect the manager every export_interval seconds until the exporter stops.
+        '''
+
+        while not self.__export_event.wait(self.__export_interval):
+            self.__collect()
+
+
+    # define __collect function
+
+    def __collect(self):
+        '''
+        Export from the background, counting an exception instead of raising it.
+        '''
+
+        try:
+            self.export()
+        except Exception:
+            with self.__count_lock:
+                self.__error_count += 1
+
+
+    # define __run_sink function
+
+    def __run_sink(self,
+        export_sink: ExportSink,
+        export_queue: queue.Queue
+    ):
+        '''
+        Write the queued batches to a sink until the stop sentinel is received.
+
+        Args:
+            export_sink, ExportSink: The sink.
+            export_queue, queue.Queue: The queue of the sink.
+        '''
+
+        while True:
+            export_batch: ExportBatch = export_queue.get()
+
+            if export_batch is None:
+                return
+
+            try:
+                export_sink.write(export_batch)
+            except Exception:
+                with self.__count_lock:
+                    self.__error_count += 1
+
+
+# define AsyncStopwatchExporter class
+
+class AsyncStopwatchExporter:
+    '''
+    A background exporter task for asyncio applications.
+
+    The collection runs as a task on the event loop, each sink has a bounded 
+        asyncio.Queue and a writer task that calls the sink in the default 
+        executor, so a blocking sink never stalls the loop. As with 
+        StopwatchExporter, a full queue drops its oldest batch.
+    '''
+
+    __slots__ = (
+        '__stopwatch_manager',
+        '__stopwatch_names',
+        '__export_sinks',
+        '__export_interval',
+        '__queue_size',
+        '__export_queues',
+        '__export_tasks',
+        '__export_count',
+        '__drop_count',
+        '__error_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        stopwatch_manager: StopwatchManager,
+        export_sinks: list,
+        export_interval: float = 10.0,
+        queue_size: int = 16,
+        stopwatch_names: list = None
+    ):
+        '''
+        Constructs an instance of the AsyncStopwatchExporter class object.
+
+        Args:
+            stopwatch_manager, StopwatchManager: The manager to be exported.
+            export_sinks, list: A list of ExportSink instances, which are closed 
+                when the exporter stops.
+            export_interval, float: The interval (in seconds) between collections.
+            queue_size, int: The maximum number of batches waiting for each sink.
+            stopwatch_names, list: A list of unique names for the Stopwatch instances 
+                to be exported. If this parameter is not supplied or the value is None, 
+                all Stopwatch instances are exported.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        check_exporter_args(stopwatch_manager, export_sinks, export_interval, queue_size, stopwatch_names)
+
+        self.__stopwatch_manager: StopwatchManager = stopwatch_manager
+        self.__stopwatch_names: list = stopwatch_names
+        self.__export_sinks: list = list(export_sinks)
+        self.__export_interval: float = export_interval
+        self.__queue_size: int = queue_size
+
+        self.__export_queues: list = None
+        self.__export_tasks: list = None
+
+        self.__export_count: int = 0
+        self.__drop_count: int = 0
+        self.__error_count: int = 0
+
+
+    # define start function
+
+    def start(self):
+        '''
+        Start the collector and sink writer tasks on the running event loop.
+
+        Raises:
+            StatusError: The exporter has already started, or it has stopped 
+                and closed the sinks.
+            RuntimeError: There is no running event loop.
+        '''
+
+        if self.__export_tasks is not None:
+            raise StatusError('exporter has started' if self.__export_tasks else 'exporter has stopped')
+
+        asyncio.get_running_loop()
+
+        self.__export_queues = [asyncio.Queue(self.__queue_size) for export_sink in self.__export_sinks]
+        self.__export_tasks = [asyncio.ensure_future(self.__run_collector())]
+
+        for export_sink, export_queue in zip(self.__export_sinks, self.__export_queues):
+            self.__export_tasks.append(asyncio.ensure_future(self.__run_sink(export_sink, export_queue)))
+
+
+    # define stop function
+
+    async def stop(self):
+        '''
+        Stop the exporter after a final collection, wait until the sinks have 
+            written the queued batches and close the sinks.
+
+        Raises:
+            StatusError: The exporter has not started, or it has already stopped.
+        '''
+
+        if not self.__export_tasks:
+            raise StatusError('exporter did not start' if self.__export_tasks is None else 'exporter has stopped')
+
+        self.__export_tasks[0].cancel()
+
+        try:
+            await self.__export_tasks[0]
+        except asyncio.CancelledError:
+            pass
+
+        self.__collect()
+
+        for export_queue in self.__export_queues:
+            await export_queue.put(None)
+
+        await asyncio.gather(*self.__export_tasks[1:])
+
+        for export_sink in self.__export_sinks:
+            export_sink.close()
+
+        # An empty list marks a stopped exporter, whose sinks are closed.
+        self.__export_tasks = list()
+
+
+    # define export function
+
+    def export(self) -> bool:
+        '''
+        Collect the manager now and offer the batch to the sinks, without waiting.
+
+        It must be called from the thread of the event loop.
+
+        Returns:
+            Returns False if a queued batch was dropped, otherwise True.
+
+        Raises:
+            StatusError: The exporter has not started.
+        '''
+
+        if self.__export_queues is None:
+            raise StatusError('exporter did not start')
+
+        export_batch: ExportBatch = collect_batch(self.__stopwatch_manager, self.__stopwatch_names)
+        export_result: bool = True
+
+        for export_queue in self.__export_queues:
+            if not offer_batch(export_queue, export_batch):
+                self.__drop_count += 1
+                export_result = False
+
+        self.__export_count += 1
+        return export_result
+
+
+    # define get_export_count function
+
+    def get_export_count(self) -> int:
+        '''
+        Get the number of collected batches.
+
+        Returns:
+            Returns the number of batches.
+        '''
+
+        return self.__export_count
+
+
+    # define get_drop_count function
+
+    def get_drop_count(self) -> int:
+        '''
+        Get the number of batches dropped because a sink queue was full.
+
+        Returns:
+            Returns the number of dropped batches, counted once per sink.
+        '''
+
+        return self.__drop_count
+
+
+    # define get_error_count function
+
+    def get_error_count(self) -> int:
+        '''
+        Get the number of failed background collections and of batches that 
+            a sink failed to write.
+
+        Returns:
+            Returns the number of failures.
+        '''
+
+        return self.__error_count
+
+
+    # define __run_collector function
+
+    async def __run_collector(self):
+        '''
+        Collect the manager every export_interval seconds until the exporter stops.
+        '''
+
+        while True:
+            await asyncio.sleep(self.__export_interval)
+            self.__collect()
+
+
+    # define __collect function
+
+    def __collect(self):
+        '''
+        Export from the background, counting an exception instead of raising it.
+        '''
+
+        try:
+            self.export()
+        except Exception:
+            self.__error_count += 1
+
+
+    # define __run_sink function
+
+    async def __run_sink(self,
+        export_sink: ExportSink,
+        export_queue: asyncio.Queue
+    ):
+        '''
+        Write the queued batches to a sink until the stop sentinel is received.
+
+        Args:
+            export_sink, ExportSink: The sink.
+            export_queue, asyncio.Queue: The queue of the sink.
+        '''
+
+        export_loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            export_batch: ExportBatch = await export_queue.get()
+
+            if export_batch is None:
+                return
+
+            try:
+                await export_loop.run_in_executor(None, export_sink.write, export_batch)
+            except Exception:
+                self.__error_count += 1
@@ -0,0 +1,286 @@
+# stopwatch.exposition.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements the OpenMetrics text exposition of the 
+    Stopwatch instances of a manager, which is rendered incrementally: the 
+    text of a Stopwatch is only rendered again after it changed.
+'''
+
+import re
+import threading
+
+from stopwatch.watch import Stopwatch
+from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+
+# define METRIC_PREFIX_PATTERN const
+
+METRIC_PREFIX_PATTERN: re.Pattern = re.compile('[a-zA-Z_:][a-zA-Z0-9_:]*')
+
+
+# define EXPOSITION_BLOCK_SIZE const
+
+EXPOSITION_BLOCK_SIZE: int = 1024    # Number of instances whose samples are joined into a cached block.
+
+
+# define exposition header consts
+
+COUNTER_HEADER: str = (
+    '# TYPE {PREFIX}_seconds counter\n'
+    '# UNIT {PREFIX}_seconds seconds\n'
+    '# HELP {PREFIX}_seconds Total time measured by the stopwatch.\n'
+)
+
+HISTOGRAM_HEADER: str = (
+    '# TYPE {PREFIX}_lap_seconds histogram\n'
+    '# UNIT {PREFIX}_lap_seconds seconds\n'
+    '# HELP {PREFIX}_lap_seconds Durations of the timing records.\n'
+)
+
+
+# define escape_label function
+
+def escape_label(
+    label_value: str
+) -> str:
+    '''
+    Escape a Prometheus or OpenMetrics label value.
+
+    Args:
+        label_value, str: The label value.
+
+    Returns:
+        Returns the escaped label value.
+    '''
+
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# define render_watch_metrics function
+
+def render_watch_metrics(
+    stopwatch_name: str,
+    stopwatch_instance: Stopwatch,
+    metric_prefix: str
+) -> tuple:
+    '''
+    Render the samples of a Stopwatch instance.
+
+    The lap histogram is rendered from the buckets kept by the Stopwatch, or 
+        from its lap statistics as a single unbounded bucket if it was 
+        constructed without histogram_buckets.
+
+    Args:
+        stopwatch_name, str: The unique name of the Stopwatch instance.
+        stopwatch_instance, Stopwatch: The Stopwatch instance.
+        metric_prefix, str: The prefix of the metric names.
+
+    Returns:
+        Returns a (counter samples, histogram samples) tuple of strings.
+    '''
+
+    metric_label: str = 'stopwatch="' + escape_label(stopwatch_name) + '"'
+    lap_histogram = stopwatch_instance.get_histogram()
+
+    if lap_histogram:
+        bucket_bounds: list = [repr(histogram_bound / NANOSECONDS_PER_SECOND) 
+            for histogram_bound in lap_histogram.get_bounds()] + ['+Inf']
+        bucket_counts: list = lap_histogram.get_counts()
+        lap_count: float = lap_histogram.get_count()
+        lap_total: float = lap_histogram.get_total()
+    else:
+        lap_statistics = stopwatch_instance.get_lap_statistics()
+
+        bucket_bounds: list = ['+Inf']
+        bucket_counts: list = [lap_statistics.get_count()]
+        lap_count: float = lap_statistics.get_count()
+        lap_total: float = lap_statistics.get_total()
+
+    histogram_lines: list = ['{PREFIX}_lap_seconds_bucket{{{LABEL},le="{BOUND}"}} {COUNT}\n'.format(
+        PREFIX = metric_prefix, LABEL = metric_label, BOUND = bucket_bound, COUNT = round(bucket_count)
+    ) for bucket_bound, bucket_count in zip(bucket_bounds, bucket_counts)]
+
+    histogram_lines.append('{PREFIX}_lap_seconds_count{{{LABEL}}} {COUNT}\n'.format(
+        PREFIX = metric_prefix, LABEL = metric_label, COUNT = round(lap_count)))
+    histogram_lines.append('{PREFIX}_lap_seconds_sum{{{LABEL}}} {TOTAL}\n'.format(
+        PREFIX = metric_prefix, LABEL = metric_label, TOTAL = lap_total / NANOSECONDS_PER_SECOND))
+
+    return ('{PREFIX}_seconds_total{{{LABEL}}} {TOTAL}\n'.format(PREFIX = metric_prefix, LABEL = metric_label, 
+        TOTAL = stopwatch_instance.get_watch_ns() / NANOSECONDS_PER_SECOND), ''.join(histogram_lines))
+
+
+# define ExpositionCache class
+
+class ExpositionCache:
+    '''
+    The cached OpenMetrics exposition of the Stopwatch instances of a manager.
+
+    The Stopwatch instances report their changes to an observer set, so a 
+        render only visits the instances that changed since the previous 
+        render, plus those that are running (whose total keeps growing) or 
+        cannot be observed. If nothing changed, the previous text is returned 
+        without visiting any instance. A different selection key or metric 
+        prefix selects and renders everything again.
+    '''
+
+    __slots__ = (
+        '__exposition_lock',
+        '__exposition_observer',
+        '__metric_prefix',
+        '__selection_key',
+        '__stopwatch_instances',
+        '__stopwatch_indexes',
+        '__counter_samples',
+        '__histogram_samples',
+        '__counter_blocks',
+        '__histogram_blocks',
+        '__volatile_indexes',
+        '__exposition_text',
+    )
+
+    # define __init__ function
+
+    def __init__(self):
+        '''
+        Constructs an instance of the ExpositionCache class object.
+        '''
+
+        self.__exposition_lock: threading.Lock = threading.Lock()
+        self.__exposition_observer: set = set()
+
+        self.__metric_prefix: str = None
+        self.__selection_key: tuple = None
+        self.__stopwatch_instances: list = None
+        self.__stopwatch_indexes: dict = None
+        self.__counter_samples: list = None
+        self.__histogram_samples: list = None
+        self.__counter_blocks: list = None
+        self.__histogram_blocks: list = None
+        self.__volatile_indexes: list = None
+        self.__exposition_text: str = None
+
+
+    # define __render_index function
+
+    def __render_index(self,
+        stopwatch_index: int
+    ) -> bool:
+        '''
+        Render the samples of a selected Stopwatch instance.
+
+        Args:
+            stopwatch_index, int: The position of the instance in the selection.
+
+        Returns:
+            Returns True if the instance must be rendered again by the next render.
+        '''
+
+        stopwatch_name, stopwatch_instance = self.__stopwatch_instances[stopwatch_index]
+        stopwatch_observed: bool = stopwatch_instance._observe(self.__exposition_observer)
+
+        self.__counter_samples[stopwatch_index], self.__histogram_samples[stopwatch_index] = \
+            render_watch_metrics(stopwatch_name, stopwatch_instance, self.__metric_prefix)
+
+        return not stopwatch_observed or stopwatch_instance.get_status() == StopwatchStatus.Started
+
+
+    # define render function
+
+    def render(self,
+        selection_key: tuple,
+        select_instances,
+        metric_prefix: str = 'stopwatch'
+    ) -> str:
+        '''
+        Render the OpenMetrics text exposition of a selection of Stopwatch instances.
+
+        Args:
+            selection_key, tuple: A key that changes whenever the selection may have 
+                changed, the instances are only selected again if it differs from 
+                the key of the previous render.
+            select_instances, callable: A function that returns the selection as 
+                a list of (name, Stopwatch instance) tuples.
+            metric_prefix, str: The prefix of the metric names.
+
+        Returns:
+            Returns the exposition text, terminated by '# EOF'.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(metric_prefix, str) or not METRIC_PREFIX_PATTERN.fullmatch(metric_prefix):
+            raise ValueError('<metric_prefix> value invalid')
+
+        with self.__exposition_lock:
+            changed_instances: list = list()
+
+            while self.__exposition_observer:
+                try:
+                    changed_instances.append(self.__exposition_observer.pop())
+                except KeyError:
+                    break
+
+            if metric_prefix != self.__metric_prefix or selection_key != self.__selection_key:
+                stopwatch_instances: list = select_instances()
+
+                self.__metric_prefix = metric_prefix
+                self.__selection_key = selection_key
+                self.__stopwatch_instances = stopwatch_instances
+                self.__stopwatch_indexes = dict()
+
+                for stopwatch_index, (stopwatch_name, stopwatch_instance) in enumerate(stopwatch_instances):
+                    self.__stopwatch_indexes.setdefault(stopwatch_instance, list()).append(stopwatch_index)
+
+                self.__counter_samples = [None] * len(stopwatch_instances)
+                self.__histogram_samples = [None] * len(stopwatch_instances)
+                self.__counter_blocks = [None] * -(-len(stopwatch_instances) // EXPOSITION_BLOCK_SIZE)
+                self.__histogram_blocks = [None] * len(self.__counter_blocks)
+                render_indexes = range(len(stopwatch_instances))
+            elif self.__exposition_text is not None and not changed_instances and not self.__volatile_indexes:
+                return self.__exposition_text
+            else:
+                render_indexes = set(self.__volatile_indexes)
+
+                for stopwatch_instance in changed_instances:
+                    render_indexes.update(self.__stopwatch_indexes.get(stopwatch_instance, ()))
+
+            self.__volatile_indexes = [stopwatch_index for stopwatch_index in render_indexes 
+                if self.__render_index(stopwatch_index)]
+
+            for block_index in {stopwatch_index // EXPOSITION_BLOCK_SIZE for stopwatch_index in render_indexes}:
+                block_slice: slice = slice(block_index * EXPOSITION_BLOCK_SIZE, (block_index + 1) * EXPOSITION_BLOCK_SIZE)
+
+                self.__counter_blocks[block_index] = ''.join(self.__counter_samples[block_slice])
+                self.__histogram_blocks[block_index] = ''.join(self.__histogram_samples[block_slice])
+
+            self.__exposition_text = ''.join([
+                COUNTER_HEADER.format(PREFIX = metric_prefix), 
+                *self.__counter_blocks, 
+                HISTOGRAM_HEADER.format(PREFIX = metric_prefix), 
+                *self.__histogram_blocks, 
+                '# EOF\n',
+            ])
+
+            return self.__exposition_text
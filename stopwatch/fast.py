@@ -0,0 +1,317 @@
+# stopwatch.fast.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the FastStopwatch class, a lean Stopwatch 
+    for instrumenting hot paths.
+'''
+
+import time
+import array
+
+from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import MAX_STOPWATCH_PRECISION
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.errors import LapNameError
+
+
+# define perf_counter_ns alias
+
+perf_counter_ns = time.perf_counter_ns    # Avoids a module attribute lookup per call.
+
+
+# define FastStopwatch class
+
+class FastStopwatch:
+    '''
+    An unchecked stopwatch for hot paths.
+
+    The start, stop and lap methods only read the clock and store the value: 
+        there are no status checks, no record names and no rounding. Laps are 
+        kept as raw timestamps and their durations are derived when they are 
+        read. Calling start twice or stop without start is not detected and 
+        gives meaningless totals, use Stopwatch when those checks are needed.
+    '''
+
+    __slots__ = (
+        '__stopwatch_precision',
+        '__stopwatch_marks',
+        '__stopwatch_first_count',
+        '__stopwatch_start_count',
+        '__stopwatch_total_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        default_precision: int = 3
+    ):
+        '''
+        Constructs an instance of the FastStopwatch class object.
+
+        Args:
+            default_precision, int: The default precision (number of decimal places) 
+                of the stopwatch, whose value should be less than or equal to the 
+                constant MAX_STOPWATCH_PRECISION.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not default_precision or not isinstance(default_precision, int):
+            raise ValueError('<default_precision> value invalid')
+        
+        if default_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<default_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        self.__stopwatch_precision: int = default_precision
+        self.__stopwatch_marks: array.array = array.array('q')
+
+        self.__stopwatch_first_count: int = None
+        self.__stopwatch_start_count: int = None
+        self.__stopwatch_total_count: int = 0
+
+
+    # define get_status function
+
+    def get_status(self) -> int:
+        '''
+        Get the status of the Stopwatch.
+
+        Returns:
+            Returns the current state of Stopwatch whose value is indicated using 
+                the StopwatchStatus enumerator.
+        '''
+
+        return StopwatchStatus.Stopped if self.__stopwatch_start_count is None else StopwatchStatus.Started
+
+
+    # define start function
+
+    def start(self):
+        '''
+        Start running Stopwatch without checking its status.
+        '''
+
+        self.__stopwatch_start_count = perf_counter_ns()
+
+        if self.__stopwatch_first_count is None:
+            self.__stopwatch_first_count = self.__stopwatch_start_count
+
+
+    # define stop function
+
+    def stop(self):
+        '''
+        Stop running Stopwatch without checking its status.
+
+        Unlike Stopwatch.stop, nothing is returned, use get_watch to read the total.
+        '''
+
+        self.__stopwatch_total_count += perf_counter_ns() - self.__stopwatch_start_count
+        self.__stopwatch_start_count = None
+
+
+    # define lap function
+
+    def lap(self):
+        '''
+        Record the time once without checking the status of Stopwatch.
+
+        Record the interval from the last record to the current time.
+            If this is the first record, record the interval from the 
+            first start to the current.
+        '''
+
+        self.__stopwatch_marks.append(perf_counter_ns())
+
+
+    # define reset function
+
+    def reset(self):
+        '''
+        Reset Stopwatch.
+
+        Statistics such as Laps and total duration are cleared after reset.
+        '''
+
+        del self.__stopwatch_marks[:]
+        self.__stopwatch_first_count = None
+        self.__stopwatch_start_count = None
+        self.__stopwatch_total_count = 0
+
+
+    # define get_lap_ns function
+
+    def get_lap_ns(self,
+        lap_number: int
+    ) -> int:
+        '''
+        Get the statistical time (in nanoseconds) by record number.
+
+        Args:
+            lap_number, int: Record number, starting with 1.
+
+        Returns:
+            Returns the recording time (in nanoseconds) with a data type of int.
+
+        Raises:
+            LapNameError: There is no such record.
+        '''
+
+        if not isinstance(lap_number, int) or lap_number < 1 or lap_number > len(self.__stopwatch_marks):
+            raise LapNameError('no such lap: ' + str(lap_number))
+
+        if lap_number == 1:
+            return self.__stopwatch_marks[0] - self.__stopwatch_first_count
+
+        return self.__stopwatch_marks[lap_number - 1] - self.__stopwatch_marks[lap_number - 2]
+
+
+    # define get_lap_by_number function
+
+    def get_lap_by_number(self,
+        lap_number: int,
+        lap_precision: int = None
+    ) -> float:
+        '''
+        Get the statistical time (in seconds) by record number.
+
+        Args:
+            lap_number, int: Record number, starting with 1.
+            lap_precision, int: Record precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+
+        Returns:
+            Returns the recording time (in seconds) with a data type of float.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            LapNameError: There is no such record.
+        '''
+
+        if not lap_precision:
+            lap_precision = self.__stopwatch_precision
+        elif not isinstance(lap_precision, int):
+            raise ValueError('<lap_precision> value invalid')
+        elif lap_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<lap_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        return round(self.get_lap_ns(lap_number) / NANOSECONDS_PER_SECOND, lap_precision)
+
+
+    # define get_average_of_laps function
+
+    def get_average_of_laps(self,
+        average_precision: int = None
+    ) -> float:
+        '''
+        Get the average (in seconds) of all timing records.
+
+        Args:
+            average_precision, int: average precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+        
+        Returns:
+            Returns the average (in seconds) of all timing records.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not average_precision:
+            average_precision = self.__stopwatch_precision
+        if not isinstance(average_precision, int):
+            raise ValueError('<average_precision> value invalid')
+        if average_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<average_precision> value should be less than: ' + str(MAX_STOPWATCH_PRECISION))
+
+        if len(self.__stopwatch_marks) == 0:
+            return 0
+
+        return round((self.__stopwatch_marks[-1] - self.__stopwatch_first_count) / 
+            len(self.__stopwatch_marks) / NANOSECONDS_PER_SECOND, average_precision)
+
+
+    # define get_lap_count function
+
+    def get_lap_count(self) -> int:
+        '''
+        Get the number of timed records.
+
+        Returns:
+            The number of timed records.
+        '''
+
+        return len(self.__stopwatch_marks)
+
+
+    # define get_watch function
+
+    def get_watch(self,
+        watch_precision: int = None
+    ) -> float:
+        '''
+        Gets the statistical time (in seconds) that Stopwatch is from start to finish.
+
+        Args:
+            watch_precision, int: Watch precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+        
+        Returns:
+            Returns the statistical time (in seconds) that Stopwatch is from start to finish.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not watch_precision:
+            watch_precision = self.__stopwatch_precision
+        elif not isinstance(watch_precision, int):
+            raise ValueError('<watch_precision> value invalid')
+        elif watch_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<watch_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        return round(self.get_watch_ns() / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_watch_ns function
+
+    def get_watch_ns(self) -> int:
+        '''
+        Gets the statistical time (in nanoseconds) that Stopwatch is from start to finish.
+
+        Returns:
+            Returns the statistical time (in nanoseconds) with a data type of int.
+        '''
+
+        if self.__stopwatch_start_count is None:
+            return self.__stopwatch_total_count
+
+        return self.__stopwatch_total_count + (perf_counter_ns() - self.__stopwatch_start_count)
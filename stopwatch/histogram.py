@@ -0,0 +1,239 @@
+# stopwatch.histogram.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the fixed-bucket lap histogram used by the 
+    Stopwatch class for the OpenMetrics exposition.
+'''
+
+import array
+import bisect
+
+
+# define LapHistogram class
+
+class LapHistogram:
+    '''
+    A histogram of record durations over fixed bucket bounds.
+
+    Every record increments one bucket (found by bisection), so the update 
+        cost does not grow with the number of records, and the cumulative 
+        counts of the exposition format are only computed when they are read. 
+        Counts are weighted by the sampling weight of the record. All 
+        durations are in nanoseconds.
+    '''
+
+    __slots__ = (
+        '__histogram_bounds',
+        '__histogram_counts',
+        '__histogram_count',
+        '__histogram_total',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        histogram_bounds: list
+    ):
+        '''
+        Constructs an instance of the LapHistogram class object.
+
+        Args:
+            histogram_bounds, list: The inclusive upper bounds (in nanoseconds) of 
+                the buckets, in strictly increasing order. A last bucket without 
+                upper bound is always added.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(histogram_bounds, (list, tuple)) or not all(isinstance(histogram_bound, int) 
+            for histogram_bound in histogram_bounds) or any(histogram_bounds[bound_index] >= 
+            histogram_bounds[bound_index + 1] for bound_index in range(len(histogram_bounds) - 1)):
+            raise ValueError('<histogram_bounds> value invalid')
+
+        self.__histogram_bounds: list = list(histogram_bounds)
+        self.__histogram_counts: array.array = array.array('d', bytes(8 * (len(histogram_bounds) + 1)))
+        self.__histogram_count: float = 0.0
+        self.__histogram_total: float = 0.0
+
+
+    # define update function
+
+    def update(self,
+        lap_count: int,
+        lap_weight: float = None
+    ):
+        '''
+        Add a record duration to the histogram.
+
+        Args:
+            lap_count, int: Record duration (in nanoseconds).
+            lap_weight, float: The sampling weight of the record. If not provided, 
+                the record counts once.
+        '''
+
+        if lap_weight is None:
+            lap_weight = 1.0
+
+        self.__histogram_counts[bisect.bisect_left(self.__histogram_bounds, lap_count)] += lap_weight
+        self.__histogram_count += lap_weight
+        self.__histogram_total += lap_weight * lap_count
+
+
+    # define merge function
+
+    def merge(self,
+        lap_histogram: 'LapHistogram'
+    ):
+        '''
+        Merge the counts of another instance into the current instance.
+
+        Args:
+            lap_histogram, LapHistogram: The histogram to be merged, which must 
+                have the same bucket bounds.
+
+        Raises:
+            ValueError: The bucket bounds are different.
+        '''
+
+        if lap_histogram.__histogram_bounds != self.__histogram_bounds:
+            raise ValueError('<lap_histogram> value invalid')
+
+        for bucket_index, bucket_count in enumerate(lap_histogram.__histogram_counts):
+            self.__histogram_counts[bucket_index] += bucket_count
+
+        self.__histogram_count += lap_histogram.__histogram_count
+        self.__histogram_total += lap_histogram.__histogram_total
+
+
+    # define get_state function
+
+    def get_state(self) -> tuple:
+        '''
+        Get the raw state of the histogram.
+
+        Returns:
+            Returns a (bounds, counts, count, total) tuple that set_state accepts, 
+                the counts are per bucket and not cumulative.
+        '''
+
+        return (list(self.__histogram_bounds), self.__histogram_counts.tolist(), 
+            self.__histogram_count, self.__histogram_total)
+
+
+    # define set_state function
+
+    def set_state(self,
+        histogram_state: tuple
+    ):
+        '''
+        Replace the counts with a raw state, for example one read back from storage.
+
+        Args:
+            histogram_state, tuple: A (bounds, counts, count, total) tuple as returned 
+                by get_state, whose bounds must equal the bounds of the histogram.
+
+        Raises:
+            ValueError: The bucket bounds or the number of counts are different.
+        '''
+
+        histogram_bounds, histogram_counts, histogram_count, histogram_total = histogram_state
+
+        if list(histogram_bounds) != self.__histogram_bounds or len(histogram_counts) != len(self.__histogram_counts):
+            raise ValueError('<histogram_state> value invalid')
+
+        self.__histogram_counts = array.array('d', histogram_counts)
+        self.__histogram_count = histogram_count
+        self.__histogram_total = histogram_total
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Clear the histogram, the bucket bounds are kept.
+        '''
+
+        self.__histogram_counts = array.array('d', bytes(8 * len(self.__histogram_counts)))
+        self.__histogram_count = 0.0
+        self.__histogram_total = 0.0
+
+
+    # define get_bounds function
+
+    def get_bounds(self) -> list:
+        '''
+        Get the upper bounds of the buckets.
+
+        Returns:
+            Returns a list of bounds (in nanoseconds), without the unbounded last bucket.
+        '''
+
+        return list(self.__histogram_bounds)
+
+
+    # define get_counts function
+
+    def get_counts(self) -> list:
+        '''
+        Get the cumulative bucket counts, as in the exposition format.
+
+        Returns:
+            Returns a list of the numbers of records less than or equal to each 
+                bound, followed by the number of all records.
+        '''
+
+        bucket_total: float = 0.0
+        bucket_counts: list = list()
+
+        for bucket_count in self.__histogram_counts:
+            bucket_total += bucket_count
+            bucket_counts.append(bucket_total)
+
+        return bucket_counts
+
+
+    # define get_count function
+
+    def get_count(self) -> float:
+        '''
+        Get the (weighted) number of records.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return self.__histogram_count
+
+
+    # define get_total function
+
+    def get_total(self) -> float:
+        '''
+        Get the (weighted) sum of record durations.
+
+        Returns:
+            Returns the sum of record durations (in nanoseconds).
+        '''
+
+        return self.__histogram_total
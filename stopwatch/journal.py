@@ -0,0 +1,495 @@
+# stopwatch.journal.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements an append-only, memory-mapped lap journal, 
+    which keeps the timing records of a Stopwatch in a file as they are 
+    made, so that they survive a crash of the recording process and can be 
+    analysed by another process while it is still running.
+
+A journal file is a 64-byte header followed by fixed-size records of three 
+    little-endian int64 values: the wall-clock time (in nanoseconds since the 
+    epoch) when the record ended, the record duration (in nanoseconds) and 
+    the name id (-1 for anonymous records). Record names are appended to a 
+    side file (journal path + '.names') as length-prefixed UTF-8 strings, the 
+    name id being their position in it.
+'''
+
+import os
+import sys
+import mmap
+import time
+import struct
+
+from stopwatch.laps import to_lap_array
+
+from stopwatch.errors import FormatError
+
+
+# define journal layout consts
+
+JOURNAL_MAGIC: bytes = b'SWLJ'       # Magic bytes of a lap journal.
+JOURNAL_VERSION: int = 1             # Current journal format version.
+JOURNAL_HEADER_SIZE: int = 64        # Size (in bytes) of the header.
+
+
+# define JOURNAL_HEADER const
+
+JOURNAL_HEADER: struct.Struct = struct.Struct('<4sHHQ')    # magic, version, record size, record count
+
+
+# define JOURNAL_COUNT const
+
+JOURNAL_COUNT: struct.Struct = struct.Struct('<Q')    # Record count, at offset 8 of the header.
+
+
+# define JOURNAL_RECORD const
+
+JOURNAL_RECORD: struct.Struct = struct.Struct('<qqq')    # time, duration, name id
+
+
+# define JOURNAL_NAME const
+
+JOURNAL_NAME: struct.Struct = struct.Struct('<H')    # Length of an encoded name.
+
+
+# define read_journal_names function
+
+def read_journal_names(
+    names_file,
+    journal_names: list
+):
+    '''
+    Read the names appended to a names file since the last call.
+
+    A name whose bytes are not completely written yet is left for the next call.
+
+    Args:
+        names_file, file: The names file, open for binary reading at the first unread name.
+        journal_names, list: The list that the names are appended to.
+    '''
+
+    while True:
+        name_offset: int = names_file.tell()
+        name_size_bytes: bytes = names_file.read(JOURNAL_NAME.size)
+
+        if len(name_size_bytes) == JOURNAL_NAME.size:
+            name_size: int = JOURNAL_NAME.unpack(name_size_bytes)[0]
+            name_bytes: bytes = names_file.read(name_size)
+
+            if len(name_bytes) == name_size:
+                journal_names.append(name_bytes.decode('utf-8'))
+                continue
+
+        names_file.seek(name_offset)
+        return
+
+
+# define LapJournal class
+
+class LapJournal:
+    '''
+    The writing side of a lap journal.
+
+    Every record is packed directly into the memory-mapped file and then the 
+        record count in the header is updated, so a reader never sees a 
+        partially written record. The mapping is grown by chunk_count 
+        records at a time. Records reach the operating system as soon as 
+        they are written, so they survive a crash of the process; call flush 
+        to also make them durable against a crash of the machine.
+
+    An existing journal is opened for appending, so a restarted job 
+        continues the same journal.
+    '''
+
+    __slots__ = (
+        '__journal_path',
+        '__chunk_count',
+        '__journal_file',
+        '__journal_map',
+        '__names_file',
+        '__name_ids',
+        '__record_count',
+        '__record_capacity',
+        '__time_offset',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        journal_path: str,
+        chunk_count: int = 65536
+    ):
+        '''
+        Constructs an instance of the LapJournal class object.
+
+        Args:
+            journal_path, str: The path of the journal file, which is created 
+                if it does not exist.
+            chunk_count, int: The number of records the file grows by.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            FormatError: The existing file is not a lap journal.
+        '''
+
+        if not journal_path or not isinstance(journal_path, str):
+            raise ValueError('<journal_path> value invalid')
+
+        if not isinstance(chunk_count, int) or chunk_count < 1:
+            raise ValueError('<chunk_count> value invalid')
+
+        self.__journal_path: str = journal_path
+        self.__chunk_count: int = chunk_count
+
+        self.__journal_file = open(journal_path, 'r+b' if os.path.exists(journal_path) else 'w+b')
+        journal_size: int = os.fstat(self.__journal_file.fileno()).st_size
+
+        if journal_size:
+            journal_magic, journal_version, record_size, self.__record_count = JOURNAL_HEADER.unpack(
+                self.__journal_file.read(JOURNAL_HEADER.size).ljust(JOURNAL_HEADER.size, b'\0'))
+
+            if journal_magic != JOURNAL_MAGIC or journal_version != JOURNAL_VERSION or record_size != JOURNAL_RECORD.size:
+                self.__journal_file.close()
+                raise FormatError('not a lap journal: ' + journal_path)
+        else:
+            self.__record_count: int = 0
+            journal_size = JOURNAL_HEADER_SIZE + chunk_count * JOURNAL_RECORD.size
+
+            self.__journal_file.truncate(journal_size)
+            self.__journal_file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, JOURNAL_RECORD.size, 0))
+            self.__journal_file.flush()
+
+        self.__record_capacity: int = (journal_size - JOURNAL_HEADER_SIZE) // JOURNAL_RECORD.size
+        self.__journal_map: mmap.mmap = mmap.mmap(self.__journal_file.fileno(), journal_size)
+
+        self.__name_ids: dict = dict()
+        self.__names_file = open(journal_path + '.names', 'a+b')
+        self.__names_file.seek(0)
+
+        journal_names: list = list()
+        read_journal_names(self.__names_file, journal_names)
+
+        self.__names_file.seek(0, os.SEEK_END)
+        self.__name_ids = {journal_name: name_id for name_id, journal_name in enumerate(journal_names)}
+
+        self.__time_offset: int = time.time_ns() - time.perf_counter_ns()
+
+
+    # define __grow function
+
+    def __grow(self):
+        '''
+        Extend the file and the mapping by chunk_count records.
+        '''
+
+        self.__record_capacity += self.__chunk_count
+        journal_size: int = JOURNAL_HEADER_SIZE + self.__record_capacity * JOURNAL_RECORD.size
+
+        self.__journal_map.close()
+        self.__journal_file.truncate(journal_size)
+        self.__journal_map = mmap.mmap(self.__journal_file.fileno(), journal_size)
+
+
+    # define __get_name_id function
+
+    def __get_name_id(self,
+        lap_name: str
+    ) -> int:
+        '''
+        Get the id of a record name, appending it to the names file if it is new.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns the name id.
+        '''
+
+        name_id: int = self.__name_ids.get(lap_name)
+
+        if name_id is None:
+            name_bytes: bytes = lap_name.encode('utf-8')
+
+            self.__names_file.write(JOURNAL_NAME.pack(len(name_bytes)) + name_bytes)
+            self.__names_file.flush()
+
+            name_id = self.__name_ids[lap_name] = len(self.__name_ids)
+
+        return name_id
+
+
+    # define append function
+
+    def append(self,
+        lap_count: int,
+        lap_time: int = None,
+        lap_name: str = None
+    ):
+        '''
+        Append a record.
+
+        Args:
+            lap_count, int: Record duration (in nanoseconds).
+            lap_time, int: A time.perf_counter_ns() reading of when the record ended. 
+                If not provided, the clock is read.
+            lap_name, str: Record name. If the value is None, the record is anonymous.
+        '''
+
+        if self.__record_count >= self.__record_capacity:
+            self.__grow()
+
+        JOURNAL_RECORD.pack_into(self.__journal_map, 
+            JOURNAL_HEADER_SIZE + self.__record_count * JOURNAL_RECORD.size, 
+            (time.perf_counter_ns() if lap_time is None else lap_time) + self.__time_offset, 
+            lap_count, 
+            self.__get_name_id(lap_name) if lap_name else -1)
+
+        self.__record_count += 1
+        JOURNAL_COUNT.pack_into(self.__journal_map, 8, self.__record_count)
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of records in the journal.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return self.__record_count
+
+
+    # define get_path function
+
+    def get_path(self) -> str:
+        '''
+        Get the path of the journal file.
+
+        Returns:
+            Returns the path.
+        '''
+
+        return self.__journal_path
+
+
+    # define flush function
+
+    def flush(self):
+        '''
+        Write the mapped records through to the storage device.
+        '''
+
+        self.__journal_map.flush()
+
+
+    # define close function
+
+    def close(self):
+        '''
+        Flush and close the journal, it must not be used afterwards.
+        '''
+
+        self.__journal_map.flush()
+        self.__journal_map.close()
+        self.__journal_file.close()
+        self.__names_file.close()
+
+
+# define LapJournalReader class
+
+class LapJournalReader:
+    '''
+    The reading side of a lap journal.
+
+    The records are exposed as views over a read-only mapping of the file, 
+        without copying. The reader sees the records that existed when it was 
+        opened or last refreshed, call refresh to follow a writer that is 
+        still running.
+    '''
+
+    __slots__ = (
+        '__journal_file',
+        '__journal_map',
+        '__names_file',
+        '__journal_names',
+        '__record_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        journal_path: str
+    ):
+        '''
+        Constructs an instance of the LapJournalReader class object.
+
+        Args:
+            journal_path, str: The path of the journal file.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            FormatError: The file is not a lap journal.
+        '''
+
+        if not journal_path or not isinstance(journal_path, str):
+            raise ValueError('<journal_path> value invalid')
+
+        self.__journal_file = open(journal_path, 'rb')
+        self.__journal_map: mmap.mmap = None
+
+        journal_magic, journal_version, record_size, record_count = JOURNAL_HEADER.unpack(
+            self.__journal_file.read(JOURNAL_HEADER.size).ljust(JOURNAL_HEADER.size, b'\0'))
+
+        if journal_magic != JOURNAL_MAGIC or journal_version != JOURNAL_VERSION or record_size != JOURNAL_RECORD.size:
+            self.__journal_file.close()
+            raise FormatError('not a lap journal: ' + journal_path)
+
+        self.__journal_names: list = list()
+        self.__names_file = open(journal_path + '.names', 'rb') if os.path.exists(journal_path + '.names') else None
+
+        self.__record_count: int = 0
+        self.refresh()
+
+
+    # define refresh function
+
+    def refresh(self) -> int:
+        '''
+        Pick up the records and names appended since the reader was opened or last refreshed.
+
+        Views returned earlier stay valid but do not grow.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        journal_size: int = os.fstat(self.__journal_file.fileno()).st_size
+
+        if self.__journal_map is None or len(self.__journal_map) != journal_size:
+            self.__journal_map = mmap.mmap(self.__journal_file.fileno(), journal_size, access = mmap.ACCESS_READ)
+
+        self.__record_count = min(JOURNAL_COUNT.unpack_from(self.__journal_map, 8)[0], 
+            (journal_size - JOURNAL_HEADER_SIZE) // JOURNAL_RECORD.size)
+
+        if self.__names_file:
+            read_journal_names(self.__names_file, self.__journal_names)
+
+        return self.__record_count
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of records.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return self.__record_count
+
+
+    # define get_names function
+
+    def get_names(self) -> list:
+        '''
+        Get the record names, indexed by name id.
+
+        Returns:
+            Returns a list of record names.
+        '''
+
+        return list(self.__journal_names)
+
+
+    # define get_records function
+
+    def get_records(self):
+        '''
+        Get all records as a two-dimensional view of shape (count, 3), whose 
+            columns are the time, the duration and the name id.
+
+        Returns:
+            Returns an int64 NumPy array if NumPy is installed, otherwise a 
+                memoryview of format 'q', both sharing memory with the file. 
+                As a memoryview cannot have a zero dimension, an empty journal 
+                gives an empty one-dimensional memoryview.
+        '''
+
+        if sys.byteorder == 'big':
+            raise FormatError('lap journal views need a little-endian machine')
+
+        journal_view: memoryview = memoryview(self.__journal_map)[JOURNAL_HEADER_SIZE:
+            JOURNAL_HEADER_SIZE + self.__record_count * JOURNAL_RECORD.size]
+
+        journal_records = to_lap_array(journal_view.cast('B').cast('q'))
+
+        if isinstance(journal_records, memoryview):
+            if not self.__record_count:
+                return journal_records
+
+            return journal_records.cast('B').cast('q', [self.__record_count, 3])
+
+        return journal_records.reshape(self.__record_count, 3)
+
+
+    # define get_durations function
+
+    def get_durations(self) -> list:
+        '''
+        Get the record durations (in nanoseconds).
+
+        Returns:
+            Returns an int64 NumPy array (a strided view of the file) if NumPy is 
+                installed, otherwise a list.
+        '''
+
+        journal_records = self.get_records()
+
+        if isinstance(journal_records, memoryview):
+            return [JOURNAL_RECORD.unpack_from(self.__journal_map, JOURNAL_HEADER_SIZE + 
+                record_index * JOURNAL_RECORD.size)[1] for record_index in range(self.__record_count)]
+
+        return journal_records[:, 1]
+
+
+    # define close function
+
+    def close(self):
+        '''
+        Close the reader. Views returned earlier keep the mapping alive 
+            until they are released.
+        '''
+
+        try:
+            self.__journal_map.close()
+        except BufferError:
+            pass
+
+        self.__journal_file.close()
+
+        if self.__names_file:
+            self.__names_file.close()
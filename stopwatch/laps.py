@@ -0,0 +1,934 @@
+# stopwatch.laps.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the lap storages used by the Stopwatch class.
+
+A lap storage keeps the duration (in nanoseconds) of each timing record 
+    and resolves records by name or by number.
+'''
+
+import array
+import random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# define LAP_NAME_PREFIX const
+
+LAP_NAME_PREFIX: str = 'lap_'    # Name prefix of anonymous records.
+
+
+# define to_lap_array function
+
+def to_lap_array(
+    lap_view: memoryview
+):
+    '''
+    Wrap a view of record durations for the caller.
+
+    Args:
+        lap_view, memoryview: A view (format 'q') of record durations (in nanoseconds).
+
+    Returns:
+        Returns an int64 NumPy array sharing memory with the view if NumPy is 
+            installed, otherwise the view itself.
+    '''
+
+    if numpy is None:
+        return lap_view
+
+    return numpy.frombuffer(lap_view, dtype = numpy.int64)
+
+
+# define join_lap_arrays function
+
+def join_lap_arrays(
+    lap_views: list
+) -> memoryview:
+    '''
+    Concatenate views of record durations into one view.
+
+    Args:
+        lap_views, list: A list of views (format 'q') of record durations.
+
+    Returns:
+        Returns a view (format 'q') over a new array holding all record durations.
+    '''
+
+    lap_counts: array.array = array.array('q')
+
+    for lap_view in lap_views:
+        lap_counts.frombytes(memoryview(lap_view).cast('B'))
+
+    return memoryview(lap_counts)
+
+
+# define LapStorage class
+
+class LapStorage:
+    '''
+    A dictionary-backed lap storage.
+
+    Every record, named or anonymous, is a dictionary entry, anonymous 
+        records are named lap_ + number (for example: lap_1).
+    '''
+
+    __slots__ = (
+        '__lap_counts',
+    )
+
+    # define __init__ function
+
+    def __init__(self):
+        '''
+        Constructs an instance of the LapStorage class object.
+        '''
+
+        self.__lap_counts: dict = dict()
+
+
+    # define append function
+
+    def append(self,
+        lap_name: str,
+        lap_count: int
+    ):
+        '''
+        Append a record.
+
+        Args:
+            lap_name, str: Record name. If the value is None, the record is anonymous.
+            lap_count, int: Record duration (in nanoseconds).
+        '''
+
+        self.__lap_counts[lap_name if lap_name else LAP_NAME_PREFIX + str(len(
+            self.__lap_counts) + 1)] = lap_count
+
+
+    # define has function
+
+    def has(self,
+        lap_name: str
+    ) -> bool:
+        '''
+        Check if the specified record exists.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns True if it exists, or False if it does not exist.
+        '''
+
+        return lap_name in self.__lap_counts
+
+
+    # define get function
+
+    def get(self,
+        lap_name: str
+    ) -> int:
+        '''
+        Get the record duration (in nanoseconds) by record name.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            KeyError: There is no such record.
+        '''
+
+        return self.__lap_counts[lap_name]
+
+
+    # define get_by_number function
+
+    def get_by_number(self,
+        lap_number: int
+    ) -> int:
+        '''
+        Get the record duration (in nanoseconds) by record number.
+
+        Args:
+            lap_number, int: Record number, starting with 1.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            KeyError: There is no such record.
+        '''
+
+        return self.__lap_counts[LAP_NAME_PREFIX + str(lap_number)]
+
+
+    # define get_names function
+
+    def get_names(self) -> list:
+        '''
+        Get all record names in the order they were recorded.
+
+        Returns:
+            Returns a list of all record names.
+        '''
+
+        return list(self.__lap_counts.keys())
+
+
+    # define get_counts function
+
+    def get_counts(self) -> list:
+        '''
+        Get all record durations (in nanoseconds) in the order they were recorded.
+
+        Returns:
+            Returns a list of all record durations (in nanoseconds).
+        '''
+
+        return list(self.__lap_counts.values())
+
+
+    # define get_array function
+
+    def get_array(self) -> memoryview:
+        '''
+        Get the durations (in nanoseconds) of all records in the order they were recorded.
+
+        The records are copied once into a new array, since a dictionary 
+            does not keep them in contiguous memory.
+
+        Returns:
+            Returns a view (format 'q') of record durations (in nanoseconds).
+        '''
+
+        return memoryview(array.array('q', self.__lap_counts.values()))
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of records.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return len(self.__lap_counts)
+
+
+    # define get_named function
+
+    def get_named(self) -> dict:
+        '''
+        Get the records whose name differs from the anonymous name of their position.
+
+        Returns:
+            Returns a dictionary of position (in get_counts order) to record name.
+        '''
+
+        return {lap_index: lap_name for lap_index, lap_name in enumerate(self.__lap_counts) 
+            if lap_name != LAP_NAME_PREFIX + str(lap_index + 1)}
+
+
+    # define load function
+
+    def load(self,
+        lap_counts: array.array,
+        lap_names: dict
+    ):
+        '''
+        Replace all records, for example with records read back from storage.
+
+        Args:
+            lap_counts, array.array: The record durations (in nanoseconds).
+            lap_names, dict: The names of named records by position, the other 
+                records get the anonymous name of their position.
+        '''
+
+        self.__lap_counts = dict(zip([lap_names.get(lap_index, LAP_NAME_PREFIX + str(lap_index + 1)) 
+            for lap_index in range(len(lap_counts))], lap_counts.tolist()))
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all records.
+        '''
+
+        self.__lap_counts.clear()
+
+
+# define CompactLapStorage class
+
+class CompactLapStorage:
+    '''
+    An array-backed lap storage.
+
+    Record durations are packed into a signed 64-bit integer array, so an 
+        anonymous record costs 8 bytes. Only explicitly named records are 
+        kept in a sparse side-table, and anonymous record names are derived 
+        from the record number when they are requested.
+
+    If a maximum number of records is given, the array is used as a ring 
+        buffer and only the most recent records are kept. Record numbers 
+        keep counting across evictions, so lap_N always names the N-th 
+        record ever appended.
+
+    Clearing the storage keeps the allocated array, so a reused 
+        storage overwrites it in place instead of growing it again.
+    '''
+
+    __slots__ = (
+        '__max_lap_count',
+        '__lap_sequence',
+        '__lap_counts',
+        '__lap_numbers',
+        '__lap_names',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        max_lap_count: int = None
+    ):
+        '''
+        Constructs an instance of the CompactLapStorage class object.
+
+        Args:
+            max_lap_count, int: The maximum number of records that are kept. 
+                If this parameter is not supplied or the value is None, 
+                the number of records is not limited.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if max_lap_count is not None and (not isinstance(max_lap_count, int) or max_lap_count < 1):
+            raise ValueError('<max_lap_count> value invalid')
+
+        self.__max_lap_count: int = max_lap_count
+        self.__lap_sequence: int = 0
+
+        self.__lap_counts: array.array = array.array('q')
+        self.__lap_numbers: dict = dict()
+        self.__lap_names: dict = dict()
+
+
+    # define append function
+
+    def append(self,
+        lap_name: str,
+        lap_count: int
+    ):
+        '''
+        Append a record, evicting the oldest record if the storage is full.
+
+        Args:
+            lap_name, str: Record name. If the value is None, the record is anonymous.
+            lap_count, int: Record duration (in nanoseconds).
+        '''
+
+        lap_position: int = self.__lap_sequence
+
+        if self.__max_lap_count:
+            if self.__lap_sequence >= self.__max_lap_count:
+                evicted_index: int = self.__lap_sequence - self.__max_lap_count
+
+                if evicted_index in self.__lap_names:
+                    del self.__lap_numbers[self.__lap_names.pop(evicted_index)]
+
+            lap_position %= self.__max_lap_count
+
+        if lap_position < len(self.__lap_counts):
+            self.__lap_counts[lap_position] = lap_count
+        else:
+            try:
+                self.__lap_counts.append(lap_count)
+            except BufferError:
+                # A view from get_array pins the array, continue on a copy.
+                self.__lap_counts = array.array('q', self.__lap_counts)
+                self.__lap_counts.append(lap_count)
+
+        if lap_name:
+            self.__lap_numbers[lap_name] = self.__lap_sequence
+            self.__lap_names[self.__lap_sequence] = lap_name
+
+        self.__lap_sequence += 1
+
+
+    # define get_first_index function
+
+    def get_first_index(self) -> int:
+        '''
+        Get the index of the oldest record that is still kept.
+
+        Returns:
+            Returns the index (record number - 1) of the oldest kept record.
+        '''
+
+        return self.__lap_sequence - self.get_count()
+
+
+    # define find function
+
+    def find(self,
+        lap_name: str
+    ) -> int:
+        '''
+        Find the index (record number - 1) of a record by record name.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns the index of the record, or -1 if it does not exist.
+        '''
+
+        lap_index: int = self.__lap_numbers.get(lap_name, -1)
+
+        if lap_index >= 0 or not lap_name.startswith(LAP_NAME_PREFIX):
+            return lap_index
+
+        lap_number: str = lap_name[len(LAP_NAME_PREFIX):]
+
+        if not lap_number.isdigit():
+            return -1
+
+        lap_index = int(lap_number) - 1
+
+        if lap_index < self.get_first_index() or lap_index >= self.__lap_sequence or lap_index in self.__lap_names:
+            return -1
+
+        return lap_index
+
+
+    # define has function
+
+    def has(self,
+        lap_name: str
+    ) -> bool:
+        '''
+        Check if the specified record exists.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns True if it exists, or False if it does not exist.
+        '''
+
+        return self.find(lap_name) >= 0
+
+
+    # define get function
+
+    def get(self,
+        lap_name: str
+    ) -> int:
+        '''
+        Get the record duration (in nanoseconds) by record name.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            KeyError: There is no such record.
+        '''
+
+        lap_index: int = self.find(lap_name)
+
+        if lap_index < 0:
+            raise KeyError(lap_name)
+
+        return self.get_by_number(lap_index + 1)
+
+
+    # define get_by_number function
+
+    def get_by_number(self,
+        lap_number: int
+    ) -> int:
+        '''
+        Get the record duration (in nanoseconds) by record number.
+
+        Unlike LapStorage, the number addresses every record, 
+            whether it is named or anonymous.
+
+        Args:
+            lap_number, int: Record number, starting with 1.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            KeyError: There is no such record, or it has been evicted.
+        '''
+
+        if not isinstance(lap_number, int) or lap_number <= self.get_first_index() or lap_number > self.__lap_sequence:
+            raise KeyError(LAP_NAME_PREFIX + str(lap_number))
+
+        if self.__max_lap_count:
+            return self.__lap_counts[(lap_number - 1) % self.__max_lap_count]
+
+        return self.__lap_counts[lap_number - 1]
+
+
+    # define get_names function
+
+    def get_names(self) -> list:
+        '''
+        Get the names of all kept records in the order they were recorded.
+
+        Returns:
+            Returns a list of record names.
+        '''
+
+        return [self.__lap_names.get(lap_index, LAP_NAME_PREFIX + str(lap_index + 1)) 
+            for lap_index in range(self.get_first_index(), self.__lap_sequence)]
+
+
+    # define get_counts function
+
+    def get_counts(self) -> list:
+        '''
+        Get the durations (in nanoseconds) of all kept records in the order they were recorded.
+
+        Returns:
+            Returns a list of record durations (in nanoseconds).
+        '''
+
+        if not self.__max_lap_count or self.__lap_sequence <= self.__max_lap_count:
+            return self.__lap_counts[:self.__lap_sequence].tolist()
+
+        lap_position: int = self.__lap_sequence % self.__max_lap_count
+        return self.__lap_counts[lap_position:].tolist() + self.__lap_counts[:lap_position].tolist()
+
+
+    # define get_array function
+
+    def get_array(self) -> memoryview:
+        '''
+        Get the durations (in nanoseconds) of all kept records in the order they were recorded.
+
+        The view shares memory with the storage unless the ring buffer has 
+            wrapped, in which case the records are copied once into order. 
+            A shared view sees the records that later overwrite it in place, 
+            after the storage is cleared or its oldest records are evicted.
+
+        Returns:
+            Returns a view (format 'q') of record durations (in nanoseconds).
+        '''
+
+        if not self.__max_lap_count or self.__lap_sequence <= self.__max_lap_count:
+            return memoryview(self.__lap_counts)[:self.__lap_sequence]
+
+        lap_position: int = self.__lap_sequence % self.__max_lap_count
+        return join_lap_arrays([memoryview(self.__lap_counts)[lap_position:], 
+            memoryview(self.__lap_counts)[:lap_position]])
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of kept records.
+
+        Returns:
+            Returns the number of kept records.
+        '''
+
+        if self.__max_lap_count and self.__lap_sequence > self.__max_lap_count:
+            return self.__max_lap_count
+
+        return self.__lap_sequence
+
+
+    # define get_named function
+
+    def get_named(self) -> dict:
+        '''
+        Get the explicitly named kept records.
+
+        Returns:
+            Returns a dictionary of position (in get_counts order) to record name.
+        '''
+
+        first_index: int = self.get_first_index()
+
+        return {lap_index - first_index: lap_name for lap_index, lap_name in self.__lap_names.items()}
+
+
+    # define load function
+
+    def load(self,
+        lap_counts: array.array,
+        lap_names: dict,
+        first_index: int = 0
+    ):
+        '''
+        Replace all records, for example with records read back from storage.
+
+        If there are more records than the maximum number of records, only 
+            the most recent are kept. Records are numbered from first_index + 1 
+            if the kept records fill the ring buffer, otherwise from 1, since 
+            only a full ring buffer has evicted records.
+
+        Args:
+            lap_counts, array.array: The record durations (in nanoseconds), 
+                which the storage takes over without copying unless they 
+                have to be rotated into the ring buffer.
+            lap_names, dict: The names of named records by position.
+            first_index, int: The index (record number - 1) of the first record, 
+                as returned by get_first_index.
+        '''
+
+        if not self.__max_lap_count or len(lap_counts) < self.__max_lap_count:
+            first_index = 0
+
+        if self.__max_lap_count and len(lap_counts) > self.__max_lap_count:
+            drop_count: int = len(lap_counts) - self.__max_lap_count
+
+            lap_counts = lap_counts[drop_count:]
+            lap_names = {lap_index - drop_count: lap_name 
+                for lap_index, lap_name in lap_names.items() if lap_index >= drop_count}
+            first_index += drop_count
+
+        lap_position: int = first_index % self.__max_lap_count if first_index else 0
+
+        if lap_position:
+            # The record with index N is kept at position N % max_lap_count.
+            lap_counts = lap_counts[-lap_position:] + lap_counts[:-lap_position]
+
+        self.__lap_counts = lap_counts
+        self.__lap_sequence = first_index + len(lap_counts)
+
+        self.__lap_names = {first_index + lap_index: lap_name for lap_index, lap_name in lap_names.items()}
+        self.__lap_numbers = {lap_name: lap_index for lap_index, lap_name in self.__lap_names.items()}
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all records, keeping the allocated array.
+        '''
+
+        self.__lap_numbers.clear()
+        self.__lap_names.clear()
+        self.__lap_sequence = 0
+
+
+# define ReservoirLapStorage class
+
+class ReservoirLapStorage:
+    '''
+    An array-backed lap storage that keeps a uniform random sample of records.
+
+    The first reservoir_size records are kept, then the N-th record replaces 
+        a random kept record with probability reservoir_size / N (Algorithm R), 
+        so every record ever appended is kept with the same probability. Kept 
+        records are listed in reservoir order rather than in recording order, 
+        and record numbers keep counting across replacements. The reservoir 
+        position of every kept record is indexed by its record number, so 
+        a lookup by name or number does not scan the reservoir.
+    '''
+
+    __slots__ = (
+        '__reservoir_size',
+        '__lap_sequence',
+        '__lap_counts',
+        '__lap_indexes',
+        '__lap_positions',
+        '__lap_numbers',
+        '__lap_names',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        reservoir_size: int
+    ):
+        '''
+        Constructs an instance of the ReservoirLapStorage class object.
+
+        Args:
+            reservoir_size, int: The number of records that are kept.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(reservoir_size, int) or reservoir_size < 1:
+            raise ValueError('<reservoir_size> value invalid')
+
+        self.__reservoir_size: int = reservoir_size
+        self.__lap_sequence: int = 0
+
+        self.__lap_counts: array.array = array.array('q')
+        self.__lap_indexes: array.array = array.array('q')
+        self.__lap_positions: dict = dict()
+        self.__lap_numbers: dict = dict()
+        self.__lap_names: dict = dict()
+
+
+    # define append function
+
+    def append(self,
+        lap_name: str,
+        lap_count: int
+    ):
+        '''
+        Append a record, which may replace a random kept record or be dropped.
+
+        Args:
+            lap_name, str: Record name. If the value is None, the record is anonymous.
+            lap_count, int: Record duration (in nanoseconds).
+        '''
+
+        lap_index: int = self.__lap_sequence
+        self.__lap_sequence += 1
+
+        if lap_index < self.__reservoir_size:
+            try:
+                self.__lap_counts.append(lap_count)
+            except BufferError:
+                # A view from get_array pins the array, continue on a copy.
+                self.__lap_counts = array.array('q', self.__lap_counts)
+                self.__lap_counts.append(lap_count)
+
+            self.__lap_positions[lap_index] = len(self.__lap_indexes)
+            self.__lap_indexes.append(lap_index)
+        else:
+            lap_position: int = random.randrange(self.__lap_sequence)
+
+            if lap_position >= self.__reservoir_size:
+                return
+
+            evicted_index: int = self.__lap_indexes[lap_position]
+
+            if evicted_index in self.__lap_names:
+                del self.__lap_numbers[self.__lap_names.pop(evicted_index)]
+
+            del self.__lap_positions[evicted_index]
+
+            self.__lap_counts[lap_position] = lap_count
+            self.__lap_indexes[lap_position] = lap_index
+            self.__lap_positions[lap_index] = lap_position
+
+        if lap_name:
+            self.__lap_numbers[lap_name] = lap_index
+            self.__lap_names[lap_index] = lap_name
+
+
+    # define find function
+
+    def find(self,
+        lap_name: str
+    ) -> int:
+        '''
+        Find the reservoir position of a record by record name.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns the position of the record, or -1 if it is not kept.
+        '''
+
+        lap_index: int = self.__lap_numbers.get(lap_name, -1)
+
+        if lap_index < 0:
+            if not lap_name.startswith(LAP_NAME_PREFIX) or not lap_name[len(LAP_NAME_PREFIX):].isdigit():
+                return -1
+
+            lap_index = int(lap_name[len(LAP_NAME_PREFIX):]) - 1
+
+            if lap_index in self.__lap_names:
+                return -1
+
+        return self.__lap_positions.get(lap_index, -1)
+
+
+    # define has function
+
+    def has(self,
+        lap_name: str
+    ) -> bool:
+        '''
+        Check if the specified record is kept.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns True if it exists, or False if it does not exist.
+        '''
+
+        return self.find(lap_name) >= 0
+
+
+    # define get function
+
+    def get(self,
+        lap_name: str
+    ) -> int:
+        '''
+        Get the record duration (in nanoseconds) by record name.
+
+        Args:
+            lap_name, str: Record name.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            KeyError: There is no such record, or it is not kept.
+        '''
+
+        lap_position: int = self.find(lap_name)
+
+        if lap_position < 0:
+            raise KeyError(lap_name)
+
+        return self.__lap_counts[lap_position]
+
+
+    # define get_by_number function
+
+    def get_by_number(self,
+        lap_number: int
+    ) -> int:
+        '''
+        Get the record duration (in nanoseconds) by record number.
+
+        Args:
+            lap_number, int: Record number, starting with 1.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            KeyError: There is no such record, or it is not kept.
+        '''
+
+        try:
+            return self.__lap_counts[self.__lap_positions[lap_number - 1]]
+        except (TypeError, KeyError):
+            raise KeyError(LAP_NAME_PREFIX + str(lap_number))
+
+
+    # define get_names function
+
+    def get_names(self) -> list:
+        '''
+        Get the names of all kept records in reservoir order.
+
+        Returns:
+            Returns a list of record names.
+        '''
+
+        return [self.__lap_names.get(lap_index, LAP_NAME_PREFIX + str(lap_index + 1)) 
+            for lap_index in self.__lap_indexes]
+
+
+    # define get_counts function
+
+    def get_counts(self) -> list:
+        '''
+        Get the durations (in nanoseconds) of all kept records in reservoir order.
+
+        Returns:
+            Returns a list of record durations (in nanoseconds).
+        '''
+
+        return self.__lap_counts.tolist()
+
+
+    # define get_array function
+
+    def get_array(self) -> memoryview:
+        '''
+        Get the durations (in nanoseconds) of all kept records in reservoir order.
+
+        The view shares memory with the storage, so it sees the records 
+            that later replace kept records.
+
+        Returns:
+            Returns a view (format 'q') of record durations (in nanoseconds).
+        '''
+
+        return memoryview(self.__lap_counts)
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of kept records.
+
+        Returns:
+            Returns the number of kept records.
+        '''
+
+        return len(self.__lap_counts)
+
+
+    # define get_named function
+
+    def get_named(self) -> dict:
+        '''
+        Get the explicitly named kept records.
+
+        Returns:
+            Returns a dictionary of position (in get_counts order) to record name.
+        '''
+
+        return {lap_position: self.__lap_names[lap_index] 
+            for lap_position, lap_index in enumerate(self.__lap_indexes) if lap_index in self.__lap_names}
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all records.
+        '''
+
+        self.__lap_numbers.clear()
+        self.__lap_names.clear()
+        self.__lap_sequence = 0
+
+        self.__lap_counts = array.array('q')
+        self.__lap_indexes = array.array('q')
+        self.__lap_positions.clear()
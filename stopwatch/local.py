@@ -0,0 +1,1249 @@
+# stopwatch.local.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the ThreadLocalStopwatch and TaskLocalStopwatch 
+    classes, Stopwatch variants that keep a private Stopwatch per thread or 
+    per asyncio task and merge them on demand.
+'''
+
+import time
+import array
+import asyncio
+import weakref
+import inspect
+import functools
+import threading
+import contextvars
+
+from stopwatch.watch import Stopwatch
+from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import MAX_STOPWATCH_PRECISION
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.statistics import LapStatistics
+from stopwatch.statistics import get_percentile
+
+from stopwatch.sketch import LapSketch
+
+from stopwatch.histogram import LapHistogram
+
+from stopwatch.laps import LAP_NAME_PREFIX
+from stopwatch.laps import to_lap_array
+from stopwatch.laps import join_lap_arrays
+
+from stopwatch.errors import StatusError
+
+
+# define LocalSentinel class
+
+class LocalSentinel:
+    '''
+    An object kept only by the thread-local storage of a ThreadLocalStopwatch, 
+        whose finalizer runs when its thread exits.
+    '''
+
+    __slots__ = (
+        '__weakref__',
+    )
+
+
+# define ThreadLocalStopwatch class
+
+class ThreadLocalStopwatch(Stopwatch):
+    '''
+    A stopwatch shared by many threads without locking.
+
+    Every thread records into its own private Stopwatch, so start, stop and lap 
+        never contend and never interleave laps of different threads. These 
+        methods, together with get_status, has_lap, get_lap and get_lap_by_number, 
+        act on the calling thread's records.
+
+    The totals and lap aggregates (get_watch, get_watch_ns, get_lap_count, get_laps, 
+        get_lap_counts, get_histogram and the get_*_of_laps methods) merge the 
+        records of every thread when they are called, so the instance can be 
+        added to a StopwatchManager and get_watchs reports the total of all threads.
+
+    When a thread exits, its total, lap statistics, percentile sketch, lap 
+        histogram and records are folded into the aggregates of the instance 
+        and its Stopwatch is released, so the memory does not grow with the 
+        number of threads. The records of exited threads keep their explicit 
+        names, their anonymous records are numbered by position among the 
+        records of exited threads, and with max_laps only the most recent 
+        max_laps of them are kept.
+
+    The per-thread Stopwatch instances have no rolling window, so the 
+        get_window_* methods raise StatusError.
+    '''
+
+    __slots__ = (
+        '__local_precision',
+        '__local_options',
+        '__local_histogram_buckets',
+        '__local_storage',
+        '__local_stopwatches',
+        '__local_lock',
+        '__local_total_count',
+        '__local_statistics',
+        '__local_sketch',
+        '__local_histogram',
+        '__local_lap_counts',
+        '__local_lap_names',
+        '__local_generation',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        default_precision: int = 3,
+        compact_laps: bool = False,
+        percentile_accuracy: float = None,
+        max_laps: int = None,
+        histogram_buckets: list = None
+    ):
+        '''
+        Constructs an instance of the ThreadLocalStopwatch class object.
+
+        Args:
+            default_precision, int: The default precision (number of decimal places) 
+                of the stopwatch, whose value should be less than or equal to the 
+                constant MAX_STOPWATCH_PRECISION.
+            compact_laps, bool: Whether every per-thread Stopwatch keeps its records 
+                in an array-backed storage.
+            percentile_accuracy, float: The relative accuracy of the per-thread 
+                percentile sketches, which are merged to estimate percentiles.
+            max_laps, int: The maximum number of records kept per thread, and 
+                of records kept from exited threads.
+            histogram_buckets, list: The lap histogram bucket bounds (in seconds) 
+                of the per-thread Stopwatch instances, whose histograms are merged.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        super().__init__(default_precision, compact_laps, percentile_accuracy, max_laps, 
+            histogram_buckets = histogram_buckets)
+
+        self.__local_precision: int = default_precision
+        self.__local_options: tuple = (default_precision, compact_laps, percentile_accuracy, max_laps)
+        self.__local_histogram_buckets: list = histogram_buckets
+        self.__local_storage: threading.local = threading.local()
+        self.__local_stopwatches: list = list()
+        self.__local_lock: threading.Lock = threading.Lock()
+
+        self.__local_total_count: int = 0
+        self.__local_statistics: LapStatistics = LapStatistics()
+        self.__local_sketch: LapSketch = LapSketch(percentile_accuracy) if percentile_accuracy else None
+        self.__local_histogram: LapHistogram = super().get_histogram()
+        self.__local_lap_counts: array.array = array.array('q')
+        self.__local_lap_names: dict = dict()
+        self.__local_generation: int = 0
+
+
+    # define _get_local_stopwatch function
+
+    def _get_local_stopwatch(self) -> Stopwatch:
+        '''
+        Get the private Stopwatch of the calling thread, creating it on first use.
+
+        Only the creation takes a lock, later calls read a thread-local attribute. 
+            The creation also stores a LocalSentinel next to the Stopwatch, which 
+            the thread-local storage drops when the thread exits, so that its 
+            finalizer retires the Stopwatch.
+
+        Returns:
+            Returns the Stopwatch instance of the calling thread.
+        '''
+
+        try:
+            return self.__local_storage.stopwatch
+        except AttributeError:
+            local_stopwatch: Stopwatch = self._create_local_stopwatch()
+            local_sentinel: LocalSentinel = LocalSentinel()
+
+            with self.__local_lock:
+                self.__local_stopwatches.append(local_stopwatch)
+
+            weakref.finalize(local_sentinel, self.__retire, local_stopwatch)
+
+            self.__local_storage.stopwatch = local_stopwatch
+            self.__local_storage.sentinel = local_sentinel
+            return local_stopwatch
+
+
+    # define _create_local_stopwatch function
+
+    def _create_local_stopwatch(self) -> Stopwatch:
+        '''
+        Create a private Stopwatch with the options of the instance.
+
+        Returns:
+            Returns a new Stopwatch instance.
+        '''
+
+        return Stopwatch(*self.__local_options, histogram_buckets = self.__local_histogram_buckets)
+
+
+    # define __retire function
+
+    def __retire(self,
+        local_stopwatch: Stopwatch
+    ):
+        '''
+        Fold the Stopwatch of an exited thread into the aggregates and release it.
+
+        Args:
+            local_stopwatch, Stopwatch: The Stopwatch of the exited thread.
+        '''
+
+        with self.__local_lock:
+            self.__local_stopwatches.remove(local_stopwatch)
+
+        self._fold_local_stopwatch(local_stopwatch)
+
+
+    # define _fold_local_stopwatch function
+
+    def _fold_local_stopwatch(self,
+        local_stopwatch: Stopwatch
+    ):
+        '''
+        Fold a private Stopwatch that is no longer used into the aggregates: its 
+            total, lap statistics, percentile sketch, lap histogram and records.
+
+        Args:
+            local_stopwatch, Stopwatch: The private Stopwatch.
+        '''
+
+        lap_counts: list = local_stopwatch.get_lap_counts()
+        lap_names: dict = local_stopwatch._get_lap_names()
+        max_lap_count: int = self.__local_options[3]
+
+        with self.__local_lock:
+            self.__local_total_count += local_stopwatch.get_watch_ns()
+            self.__local_statistics.merge(local_stopwatch.get_lap_statistics())
+            self.__local_generation += local_stopwatch.get_generation() + 1
+
+            if self.__local_sketch:
+                self.__local_sketch.merge(local_stopwatch.get_lap_sketch())
+
+            if self.__local_histogram:
+                self.__local_histogram.merge(local_stopwatch.get_histogram())
+
+            lap_offset: int = len(self.__local_lap_counts)
+
+            self.__local_lap_counts.extend(lap_counts)
+            self.__local_lap_names.update((lap_offset + lap_index, lap_name) 
+                for lap_index, lap_name in lap_names.items())
+
+            if max_lap_count and len(self.__local_lap_counts) > max_lap_count:
+                drop_count: int = len(self.__local_lap_counts) - max_lap_count
+
+                self.__local_lap_counts = self.__local_lap_counts[drop_count:]
+                self.__local_lap_names = {lap_index - drop_count: lap_name 
+                    for lap_index, lap_name in self.__local_lap_names.items() if lap_index >= drop_count}
+
+
+    # define __get_retired_laps function
+
+    def __get_retired_laps(self) -> tuple:
+        '''
+        Get a copy of the records of exited threads.
+
+        Returns:
+            Returns a tuple of the record durations (array.array) and the 
+                record names by position (dict).
+        '''
+
+        with self.__local_lock:
+            return array.array('q', self.__local_lap_counts), dict(self.__local_lap_names)
+
+
+    # define _get_local_stopwatches function
+
+    def _get_local_stopwatches(self) -> list:
+        '''
+        Get the private Stopwatch instances of all running threads.
+
+        Returns:
+            Returns a list of Stopwatch instances.
+        '''
+
+        with self.__local_lock:
+            return list(self.__local_stopwatches)
+
+
+    # define __get_precision function
+
+    def __get_precision(self,
+        precision: int,
+        precision_name: str
+    ) -> int:
+        '''
+        Validate a precision parameter, falling back to the default precision.
+
+        Args:
+            precision, int: The precision (number of decimal places) or None.
+            precision_name, str: The parameter name used in error messages.
+
+        Returns:
+            Returns the precision to be used.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not precision:
+            return self.__local_precision
+        if not isinstance(precision, int):
+            raise ValueError('<' + precision_name + '> value invalid')
+        if precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<' + precision_name + '> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        return precision
+
+
+    # define get_status function
+
+    def get_status(self) -> int:
+        '''
+        Get the status of the calling thread's Stopwatch.
+
+        Returns:
+            Returns the current state of Stopwatch whose value is indicated using 
+                the StopwatchStatus enumerator.
+        '''
+
+        return self._get_local_stopwatch().get_status()
+
+
+    # define start function
+
+    def start(self,
+        start_count: int = None
+    ):
+        '''
+        Start running the calling thread's Stopwatch.
+
+        Args:
+            start_count, int: A time.perf_counter_ns reading to start from.
+
+        Raises:
+            StatusError: Stopwatch has started.
+        '''
+
+        self._get_local_stopwatch().start(start_count)
+
+
+    # define stop function
+
+    def stop(self,
+        stop_count: int = None
+    ) -> float:
+        '''
+        Stop running the calling thread's Stopwatch.
+
+        Args:
+            stop_count, int: A time.perf_counter_ns reading to stop at.
+
+        Returns:
+            Returns the total time (in seconds) of the calling thread's Stopwatch.
+
+        Raises:
+            StatusError: Stopwatch has stopped or never started.
+        '''
+
+        return self._get_local_stopwatch().stop(stop_count)
+
+
+    # define stop_ns function
+
+    def stop_ns(self,
+        stop_count: int = None
+    ) -> int:
+        '''
+        Stop running the calling thread's Stopwatch without rounding the result.
+
+        Args:
+            stop_count, int: A time.perf_counter_ns reading to stop at.
+
+        Returns:
+            Returns the total time (in nanoseconds) of the calling thread's Stopwatch.
+
+        Raises:
+            StatusError: Stopwatch has stopped or never started.
+        '''
+
+        return self._get_local_stopwatch().stop_ns(stop_count)
+
+
+    # define lap function
+
+    def lap(self,
+        lap_name: str = None
+    ) -> float:
+        '''
+        Record the time once on the calling thread's Stopwatch.
+
+        Args:
+            lap_name, str: Record name.
+        
+        Returns:
+            The time (in seconds) to return this record.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StatusError: Stopwatch has not started.
+            LapNameError: The same record name already exists.
+        '''
+
+        return self._get_local_stopwatch().lap(lap_name)
+
+
+    # define record function
+
+    def record(self,
+        lap_count: int,
+        lap_name: str = None,
+        lap_weight: float = None
+    ):
+        '''
+        Record an interval measured outside of the Stopwatch on the calling thread's Stopwatch.
+
+        Args:
+            lap_count, int: The interval (in nanoseconds).
+            lap_name, str: Record name.
+            lap_weight, float: The sampling weight of the record.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            LapNameError: The same record name already exists.
+        '''
+
+        self._get_local_stopwatch().record(lap_count, lap_name, lap_weight)
+
+
+    # define sample function
+
+    def sample(self) -> float:
+        '''
+        Ask the calling thread's Stopwatch whether to keep the next record.
+
+        Returns:
+            Returns 0 if the record should be skipped, otherwise its weight.
+        '''
+
+        return self._get_local_stopwatch().sample()
+
+
+    # define reset function
+
+    def reset(self):
+        '''
+        Reset the Stopwatch of every running thread, and the aggregates of 
+            exited threads.
+
+        Raises:
+            StatusError: The Stopwatch of a thread has not stopped.
+        '''
+
+        local_stopwatches: list = self._get_local_stopwatches()
+
+        for local_stopwatch in local_stopwatches:
+            if local_stopwatch.get_status() != StopwatchStatus.Stopped:
+                raise StatusError('stopwatch has started')
+
+        for local_stopwatch in local_stopwatches:
+            local_stopwatch.reset()
+
+        with self.__local_lock:
+            self.__local_total_count = 0
+            self.__local_statistics.clear()
+            self.__local_generation += 1
+
+            if self.__local_sketch:
+                self.__local_sketch.clear()
+
+            if self.__local_histogram:
+                self.__local_histogram.clear()
+
+            self.__local_lap_counts = array.array('q')
+            self.__local_lap_names.clear()
+
+
+    # define has_lap function
+
+    def has_lap(self,
+        lap_name: str
+    ) -> bool:
+        '''
+        Check if the specified timing record exists on the calling thread's Stopwatch.
+
+        Args:
+            lap_name, str: Record the name.
+        
+        Returns:
+            Returns True if it exists, or False if it does not exist.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        return self._get_local_stopwatch().has_lap(lap_name)
+
+
+    # define get_lap function
+
+    def get_lap(self,
+        lap_name: str,
+        lap_precision: int = None
+    ) -> float:
+        '''
+        Get the statistical time (in seconds) of the calling thread's record by name.
+
+        Args:
+            lap_name, str: Record the name.
+            lap_precision, int: Record precision (number of decimal places).
+
+        Returns:
+            Returns the recording time (in seconds) with a data type of float.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            LapNameError: There is no such record.
+        '''
+
+        return self._get_local_stopwatch().get_lap(lap_name, lap_precision)
+
+
+    # define get_lap_by_number function
+
+    def get_lap_by_number(self,
+        lap_number: int,
+        lap_precision: int = None
+    ) -> float:
+        '''
+        Get the statistical time (in seconds) of the calling thread's record by number.
+
+        Args:
+            lap_number, int: Record number, starting with 1.
+            lap_precision, int: Record precision (number of decimal places).
+
+        Returns:
+            Returns the recording time (in seconds) with a data type of float.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            LapNameError: There is no such record.
+        '''
+
+        return self._get_local_stopwatch().get_lap_by_number(lap_number, lap_precision)
+
+
+    # define get_lap_statistics function
+
+    def get_lap_statistics(self) -> LapStatistics:
+        '''
+        Get the running statistics of the timing records of all threads, 
+            including exited threads.
+
+        Returns:
+            Returns a merged LapStatistics instance.
+        '''
+
+        lap_statistics: LapStatistics = LapStatistics()
+
+        for local_stopwatch in self._get_local_stopwatches():
+            lap_statistics.merge(local_stopwatch.get_lap_statistics())
+
+        with self.__local_lock:
+            lap_statistics.merge(self.__local_statistics)
+
+        return lap_statistics
+
+
+    # define get_lap_sketch function
+
+    def get_lap_sketch(self) -> LapSketch:
+        '''
+        Get the percentile sketch of the timing records of all threads, 
+            including exited threads.
+
+        Returns:
+            Returns a merged LapSketch instance, or None if the stopwatch was 
+                constructed without percentile_accuracy.
+        '''
+
+        if not self.__local_options[2]:
+            return None
+
+        lap_sketch: LapSketch = LapSketch(self.__local_options[2])
+
+        for local_stopwatch in self._get_local_stopwatches():
+            lap_sketch.merge(local_stopwatch.get_lap_sketch())
+
+        with self.__local_lock:
+            lap_sketch.merge(self.__local_sketch)
+
+        return lap_sketch
+
+
+    # define get_histogram function
+
+    def get_histogram(self) -> LapHistogram:
+        '''
+        Get the lap histogram of the timing records of all threads, including 
+            exited threads.
+
+        Returns:
+            Returns a merged LapHistogram instance, or None if the stopwatch was 
+                constructed without histogram_buckets.
+        '''
+
+        if not self.__local_histogram:
+            return None
+
+        lap_histogram: LapHistogram = super().get_histogram()
+
+        for local_stopwatch in self._get_local_stopwatches():
+            lap_histogram.merge(local_stopwatch.get_histogram())
+
+        with self.__local_lock:
+            lap_histogram.merge(self.__local_histogram)
+
+        return lap_histogram
+
+
+    # define get_average_of_laps function
+
+    def get_average_of_laps(self,
+        average_precision: int = None
+    ) -> float:
+        '''
+        Get the average (in seconds) of the timing records of all threads.
+
+        Args:
+            average_precision, int: average precision (number of decimal places).
+
+        Returns:
+            Returns the average (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        average_precision = self.__get_precision(average_precision, 'average_precision')
+        return round(self.get_lap_statistics().get_mean() / NANOSECONDS_PER_SECOND, average_precision)
+
+
+    # define get_min_of_laps function
+
+    def get_min_of_laps(self,
+        min_precision: int = None
+    ) -> float:
+        '''
+        Get the minimum (in seconds) of the timing records of all threads.
+
+        Args:
+            min_precision, int: min precision (number of decimal places).
+
+        Returns:
+            Returns the minimum (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        min_precision = self.__get_precision(min_precision, 'min_precision')
+        return round(self.get_lap_statistics().get_min() / NANOSECONDS_PER_SECOND, min_precision)
+
+
+    # define get_max_of_laps function
+
+    def get_max_of_laps(self,
+        max_precision: int = None
+    ) -> float:
+        '''
+        Get the maximum (in seconds) of the timing records of all threads.
+
+        Args:
+            max_precision, int: max precision (number of decimal places).
+
+        Returns:
+            Returns the maximum (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        max_precision = self.__get_precision(max_precision, 'max_precision')
+        return round(self.get_lap_statistics().get_max() / NANOSECONDS_PER_SECOND, max_precision)
+
+
+    # define get_stddev_of_laps function
+
+    def get_stddev_of_laps(self,
+        stddev_precision: int = None
+    ) -> float:
+        '''
+        Get the population standard deviation (in seconds) of the timing records of all threads.
+
+        Args:
+            stddev_precision, int: stddev precision (number of decimal places).
+
+        Returns:
+            Returns the population standard deviation (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        stddev_precision = self.__get_precision(stddev_precision, 'stddev_precision')
+        return round(self.get_lap_statistics().get_stddev() / NANOSECONDS_PER_SECOND, stddev_precision)
+
+
+    # define get_percentile_of_laps function
+
+    def get_percentile_of_laps(self,
+        percentile: float,
+        percentile_precision: int = None
+    ) -> float:
+        '''
+        Get a percentile (in seconds) of the timing records of all threads.
+
+        The per-thread sketches are merged if the stopwatch was constructed with 
+            percentile_accuracy, otherwise the value is computed exactly.
+
+        Args:
+            percentile, float: The percentile, whose value should be between 0 and 100.
+            percentile_precision, int: percentile precision (number of decimal places).
+
+        Returns:
+            Returns the percentile (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(percentile, (int, float)) or percentile < 0 or percentile > 100:
+            raise ValueError('<percentile> value invalid')
+
+        percentile_precision = self.__get_precision(percentile_precision, 'percentile_precision')
+        lap_sketch: LapSketch = self.get_lap_sketch()
+
+        if lap_sketch:
+            return round(lap_sketch.get_percentile(percentile) / NANOSECONDS_PER_SECOND, percentile_precision)
+
+        return round(get_percentile(self.get_lap_counts(), percentile) / 
+            NANOSECONDS_PER_SECOND, percentile_precision)
+
+
+    # define get_window_count function
+
+    def get_window_count(self,
+        window_seconds: int = None
+    ) -> int:
+        '''
+        Get the number of timing records in the last seconds.
+
+        The per-thread Stopwatch instances have no rolling window, so it is 
+            not supported.
+
+        Args:
+            window_seconds, int: The window length (in seconds).
+
+        Raises:
+            StatusError: A ThreadLocalStopwatch has no rolling window.
+        '''
+
+        raise StatusError('stopwatch has no rolling window')
+
+
+    # define get_window_rate function
+
+    def get_window_rate(self,
+        window_seconds: int = None,
+        rate_precision: int = None
+    ) -> float:
+        '''
+        Get the number of timing records per second in the last seconds.
+
+        The per-thread Stopwatch instances have no rolling window, so it is 
+            not supported.
+
+        Args:
+            window_seconds, int: The window length (in seconds).
+            rate_precision, int: Rate precision (number of decimal places).
+
+        Raises:
+            StatusError: A ThreadLocalStopwatch has no rolling window.
+        '''
+
+        raise StatusError('stopwatch has no rolling window')
+
+
+    # define get_window_average function
+
+    def get_window_average(self,
+        window_seconds: int = None,
+        average_precision: int = None
+    ) -> float:
+        '''
+        Get the average (in seconds) of the timing records in the last seconds.
+
+        The per-thread Stopwatch instances have no rolling window, so it is 
+            not supported.
+
+        Args:
+            window_seconds, int: The window length (in seconds).
+            average_precision, int: average precision (number of decimal places).
+
+        Raises:
+            StatusError: A ThreadLocalStopwatch has no rolling window.
+        '''
+
+        raise StatusError('stopwatch has no rolling window')
+
+
+    # define get_window_percentile function
+
+    def get_window_percentile(self,
+        percentile: float,
+        window_seconds: int = None,
+        percentile_precision: int = None
+    ) -> float:
+        '''
+        Estimate a percentile (in seconds) of the timing records in the last seconds.
+
+        The per-thread Stopwatch instances have no rolling window, so it is 
+            not supported.
+
+        Args:
+            percentile, float: The percentile, whose value should be between 0 and 100.
+            window_seconds, int: The window length (in seconds).
+            percentile_precision, int: percentile precision (number of decimal places).
+
+        Raises:
+            StatusError: A ThreadLocalStopwatch has no rolling window.
+        '''
+
+        raise StatusError('stopwatch has no rolling window')
+
+
+    # define get_laps function
+
+    def get_laps(self) -> list:
+        '''
+        Get the timing record names of all threads: the kept records of exited 
+            threads first, then those of running threads grouped by thread.
+
+        Returns:
+            Returns a list of record names, which may contain the same name more than once.
+        '''
+
+        retired_counts, retired_names = self.__get_retired_laps()
+
+        lap_names: list = [retired_names.get(lap_index, LAP_NAME_PREFIX + str(lap_index + 1)) 
+            for lap_index in range(len(retired_counts))]
+
+        for local_stopwatch in self._get_local_stopwatches():
+            lap_names.extend(local_stopwatch.get_laps())
+
+        return lap_names
+
+
+    # define get_lap_counts function
+
+    def get_lap_counts(self) -> list:
+        '''
+        Get the timing record durations (in nanoseconds) of all threads, 
+            including the kept records of exited threads, in the same order as get_laps.
+
+        Returns:
+            Returns a list of record durations (in nanoseconds).
+        '''
+
+        lap_counts: list = self.__get_retired_laps()[0].tolist()
+
+        for local_stopwatch in self._get_local_stopwatches():
+            lap_counts.extend(local_stopwatch.get_lap_counts())
+
+        return lap_counts
+
+
+    # define laps_as_array function
+
+    def laps_as_array(self):
+        '''
+        Get the timing record durations (in nanoseconds) of all threads, 
+            including the kept records of exited threads, as one array in the 
+            same order as get_laps.
+
+        Returns:
+            Returns an int64 NumPy array if NumPy is installed, 
+                otherwise a memoryview of format 'q'.
+        '''
+
+        return to_lap_array(join_lap_arrays([self.__get_retired_laps()[0]] + [local_stopwatch.laps_as_array() 
+            for local_stopwatch in self._get_local_stopwatches()]))
+
+
+    # define _get_lap_names function
+
+    def _get_lap_names(self) -> dict:
+        '''
+        Get the timing records of all threads whose name is not the anonymous 
+            name of their position in laps_as_array.
+
+        Returns:
+            Returns a dictionary of position to record name.
+        '''
+
+        return {lap_index: lap_name for lap_index, lap_name in enumerate(self.get_laps()) 
+            if lap_name != LAP_NAME_PREFIX + str(lap_index + 1)}
+
+
+    # define get_lap_count function
+
+    def get_lap_count(self) -> int:
+        '''
+        Get the number of timing records of all threads, including the kept 
+            records of exited threads.
+
+        Returns:
+            The number of timed records.
+        '''
+
+        with self.__local_lock:
+            retired_count: int = len(self.__local_lap_counts)
+
+        return sum(local_stopwatch.get_lap_count() for local_stopwatch in self._get_local_stopwatches()) + retired_count
+
+
+    # define get_estimated_lap_count function
+
+    def get_estimated_lap_count(self) -> int:
+        '''
+        Get the number of timing records of all threads since the last reset.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return self.get_lap_statistics().get_count()
+
+
+    # define get_watch function
+
+    def get_watch(self,
+        watch_precision: int = None
+    ) -> float:
+        '''
+        Gets the statistical time (in seconds) of all threads.
+
+        Args:
+            watch_precision, int: Watch precision (number of decimal places).
+
+        Returns:
+            Returns the sum of the statistical time (in seconds) of every thread.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        watch_precision = self.__get_precision(watch_precision, 'watch_precision')
+        return round(self.get_watch_ns() / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_watch_ns function
+
+    def get_watch_ns(self,
+        watch_count: int = None
+    ) -> int:
+        '''
+        Gets the statistical time (in nanoseconds) of all threads, including 
+            exited threads.
+
+        Args:
+            watch_count, int: A time.perf_counter_ns reading at which the time of 
+                running Stopwatch instances is measured. If this parameter is not 
+                supplied or the value is None, the clock is read once.
+
+        Returns:
+            Returns the sum of the statistical time (in nanoseconds) of every thread.
+        '''
+
+        if watch_count is None:
+            watch_count = time.perf_counter_ns()
+
+        return sum(local_stopwatch.get_watch_ns(watch_count) 
+            for local_stopwatch in self._get_local_stopwatches()) + self.__local_total_count
+
+
+    # define _snapshot function
+
+    def _snapshot(self,
+        snapshot_count: int
+    ) -> tuple:
+        '''
+        Capture the merged state of all threads for a StopwatchSnapshot, the 
+            status is Started if the Stopwatch of any thread is running.
+
+        Args:
+            snapshot_count, int: The time.perf_counter_ns reading of the snapshot.
+
+        Returns:
+            Returns a record tuple, whose fields are indicated using the 
+                SnapshotField enumerator.
+        '''
+
+        stopwatch_status: int = StopwatchStatus.Started if any(local_stopwatch.get_status() == 
+            StopwatchStatus.Started for local_stopwatch in self._get_local_stopwatches()) else StopwatchStatus.Stopped
+
+        return (stopwatch_status,) + super()._snapshot(snapshot_count)[1:]
+
+
+    # define get_generation function
+
+    def get_generation(self) -> int:
+        '''
+        Get the generation of the Stopwatch, the sum of the generations of 
+            every running thread's Stopwatch, which also advances when a 
+            thread exits or the aggregates of exited threads are reset.
+
+        Returns:
+            Returns the generation.
+        '''
+
+        return sum(local_stopwatch.get_generation() 
+            for local_stopwatch in self._get_local_stopwatches()) + self.__local_generation
+
+
+    # define _observe function
+
+    def _observe(self,
+        stopwatch_observer: set
+    ) -> bool:
+        '''
+        The records of a ThreadLocalStopwatch are kept by per-thread Stopwatch 
+            instances, so it cannot be observed.
+
+        Args:
+            stopwatch_observer, set: The observer set.
+
+        Returns:
+            Returns False.
+        '''
+
+        return False
+
+
+# define TaskLocalStopwatch class
+
+class TaskLocalStopwatch(ThreadLocalStopwatch):
+    '''
+    A stopwatch shared by many asyncio tasks.
+
+    Every task records into its own private Stopwatch (keyed on the current task 
+        through a context variable), so laps of concurrent coroutines never 
+        interleave. Outside of a task, the calling thread's Stopwatch is used 
+        as with ThreadLocalStopwatch. The hot path neither awaits nor locks.
+
+    When a task finishes, its Stopwatch is folded into the aggregates of the 
+        instance and released, as the Stopwatch of an exited thread is, so 
+        the memory does not grow with the number of tasks.
+
+    The instance is also an asynchronous context manager (async with) that records 
+        the time spent in the block into the current task's Stopwatch, and 
+        measure decorates a coroutine function in the same way. Blocks and 
+        measured coroutines may be nested, since they read the clock instead 
+        of starting the Stopwatch.
+    '''
+
+    __slots__ = (
+        '__task_variable',
+        '__task_start_counts',
+        '__task_stopwatches',
+        '__task_lock',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        default_precision: int = 3,
+        compact_laps: bool = False,
+        percentile_accuracy: float = None,
+        max_laps: int = None,
+        histogram_buckets: list = None
+    ):
+        '''
+        Constructs an instance of the TaskLocalStopwatch class object.
+
+        Args:
+            default_precision, int: The default precision (number of decimal places) 
+                of the stopwatch, whose value should be less than or equal to the 
+                constant MAX_STOPWATCH_PRECISION.
+            compact_laps, bool: Whether every per-task Stopwatch keeps its records 
+                in an array-backed storage.
+            percentile_accuracy, float: The relative accuracy of the per-task 
+                percentile sketches, which are merged to estimate percentiles.
+            max_laps, int: The maximum number of records kept per task, and 
+                of records kept from finished tasks and exited threads.
+            histogram_buckets, list: The lap histogram bucket bounds (in seconds) 
+                of the per-task Stopwatch instances, whose histograms are merged.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        super().__init__(default_precision, compact_laps, percentile_accuracy, max_laps, histogram_buckets)
+
+        self.__task_variable: contextvars.ContextVar = contextvars.ContextVar('stopwatch', default = None)
+        self.__task_start_counts: contextvars.ContextVar = contextvars.ContextVar('stopwatch_start_counts', default = ())
+        self.__task_stopwatches: set = set()
+        self.__task_lock: threading.Lock = threading.Lock()
+
+
+    # define _get_local_stopwatch function
+
+    def _get_local_stopwatch(self) -> Stopwatch:
+        '''
+        Get the private Stopwatch of the current task, creating it on first use.
+
+        Returns:
+            Returns the Stopwatch instance of the current task, or of the 
+                calling thread if no task is running.
+        '''
+
+        try:
+            local_task: asyncio.Task = asyncio.current_task()
+        except RuntimeError:
+            local_task: asyncio.Task = None
+
+        if not local_task:
+            return super()._get_local_stopwatch()
+
+        local_value: tuple = self.__task_variable.get()
+
+        if local_value and local_value[0] is local_task:
+            return local_value[1]
+
+        local_stopwatch: Stopwatch = self._create_local_stopwatch()
+
+        with self.__task_lock:
+            self.__task_stopwatches.add(local_stopwatch)
+
+        local_task.add_done_callback(functools.partial(self.__retire, local_stopwatch))
+        self.__task_variable.set((local_task, local_stopwatch))
+
+        return local_stopwatch
+
+
+    # define __retire function
+
+    def __retire(self,
+        local_stopwatch: Stopwatch,
+        local_task: asyncio.Task
+    ):
+        '''
+        Fold the Stopwatch of a finished task into the aggregates and release it.
+
+        Args:
+            local_stopwatch, Stopwatch: The Stopwatch of the finished task.
+            local_task, asyncio.Task: The finished task.
+        '''
+
+        with self.__task_lock:
+            self.__task_stopwatches.discard(local_stopwatch)
+
+        self._fold_local_stopwatch(local_stopwatch)
+
+
+    # define _get_local_stopwatches function
+
+    def _get_local_stopwatches(self) -> list:
+        '''
+        Get the private Stopwatch instances of all threads and running tasks.
+
+        Returns:
+            Returns a list of Stopwatch instances.
+        '''
+
+        with self.__task_lock:
+            return super()._get_local_stopwatches() + list(self.__task_stopwatches)
+
+
+    # define __aenter__ function
+
+    async def __aenter__(self) -> 'TaskLocalStopwatch':
+        '''
+        Remember the time when entering an async with block.
+
+        The reading is pushed on a stack held in a context variable, so every 
+            task has its own stack and nested blocks pair up correctly.
+        '''
+
+        self.__task_start_counts.set(self.__task_start_counts.get() + (time.perf_counter_ns(),))
+        return self
+
+
+    # define __aexit__ function
+
+    async def __aexit__(self, exception_type, exception_value, exception_traceback):
+        '''
+        Record the time spent in the async with block into the current task's Stopwatch.
+        '''
+
+        task_start_counts: tuple = self.__task_start_counts.get()
+        self.__task_start_counts.set(task_start_counts[:-1])
+
+        self._get_local_stopwatch().record(time.perf_counter_ns() - task_start_counts[-1])
+
+
+    # define measure function
+
+    def measure(self,
+        coroutine_function
+    ):
+        '''
+        Decorate a coroutine function so that each call is recorded into the 
+            Stopwatch of the task that awaits it, as with async with.
+
+        Args:
+            coroutine_function, callable: The coroutine function to be decorated.
+
+        Returns:
+            Returns the decorated coroutine function.
+
+        Raises:
+            ValueError: The parameter is not a coroutine function.
+        '''
+
+        if not inspect.iscoroutinefunction(coroutine_function):
+            raise ValueError('<coroutine_function> value invalid')
+
+        @functools.wraps(coroutine_function)
+        async def measured_function(*args, **kwargs):
+            async with self:
+                return await coroutine_function(*args, **kwargs)
+
+        return measured_function
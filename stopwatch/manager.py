@@ -24,13 +24,38 @@
 The current module implements the Stopwatch class instance registration feature of stopwatch.
 '''
 
+import time
+import array
+import functools
+import itertools
+
 from stopwatch.watch import Stopwatch
 from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import MAX_STOPWATCH_PRECISION
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.sampling import FixedRateSampler
+from stopwatch.sampling import AdaptiveSampler
+from stopwatch.sampling import ReservoirSampler
+
+from stopwatch.laps import to_lap_array
+from stopwatch.laps import join_lap_arrays
+
+from stopwatch.exposition import ExpositionCache
+
+from stopwatch.snapshot import SnapshotField
+from stopwatch.snapshot import StopwatchSnapshot
 
 from stopwatch.errors import StatusError
 from stopwatch.errors import StopwatchNameError
 from stopwatch.errors import MaxLimitError
 
+from stopwatch.persist import PersistKind
+from stopwatch.persist import read_header
+from stopwatch.persist import read_name
+from stopwatch.persist import write_header
+from stopwatch.persist import write_name
+
 
 # define StopwatchManager class
 
@@ -40,12 +65,20 @@ class StopwatchManager:
 
     By using StopwatchManager, you can easily manage 
         a batch of Stopwatch instances.
+
+    With pooling enabled, the Stopwatch instances created by the manager are 
+        reset and kept in a pool when they are removed, and are handed out 
+        again by create, which avoids allocating a new instance per name. 
+        Do not keep using an instance after removing it from a pooling manager.
     '''
     
     # define __init__ function
 
     def __init__(self,
-        max_stopwatch_count: int = None
+        max_stopwatch_count: int = None,
+        max_pool_count: int = None,
+        stopwatch_sampler = None,
+        stopwatch_histogram_buckets: list = None
     ):
         '''
         Constructs an instance of the StopwatchManager class object.
@@ -54,6 +87,17 @@ class StopwatchManager:
             max_stopwatch_count, int: The maximum number of Stopwatch instances that 
                 can be accommodated. If this parameter is not supplied or the value 
                 is None, the number of instances is not limited.
+            max_pool_count, int: The maximum number of removed Stopwatch instances 
+                kept for reuse. If this parameter is not supplied or the value 
+                is None, pooling is disabled.
+            stopwatch_sampler, FixedRateSampler, AdaptiveSampler or ReservoirSampler: 
+                The sampler shared by the Stopwatch instances created by the manager, 
+                a shared AdaptiveSampler applies its CPU budget to all of them. If this 
+                parameter is not supplied or the value is None, every record is kept.
+            stopwatch_histogram_buckets, list: The lap histogram bucket bounds (in seconds) 
+                of the Stopwatch instances created by the manager, which render_openmetrics 
+                exposes. If this parameter is not supplied or the value is None, the 
+                instances keep no histogram.
             
         Raises:
             ValueError: The data type or value of the parameter is invalid.
@@ -61,9 +105,70 @@ class StopwatchManager:
 
         if max_stopwatch_count and not isinstance(max_stopwatch_count, int):
             raise ValueError('<max_stopwatch_count> value invalid')
+
+        if max_pool_count and not isinstance(max_pool_count, int):
+            raise ValueError('<max_pool_count> value invalid')
+
+        if stopwatch_sampler is not None and not isinstance(stopwatch_sampler, 
+            (FixedRateSampler, AdaptiveSampler, ReservoirSampler)):
+            raise ValueError('<stopwatch_sampler> value invalid')
+
+        if stopwatch_histogram_buckets is not None:
+            try:
+                Stopwatch(histogram_buckets = stopwatch_histogram_buckets)
+            except ValueError:
+                raise ValueError('<stopwatch_histogram_buckets> value invalid')
         
         self.__max_stopwatch_count: int = max_stopwatch_count
         self.__stopwatch_instances: dict = dict()
+        self.__stopwatch_sampler = stopwatch_sampler
+        self.__stopwatch_histogram_buckets: list = stopwatch_histogram_buckets
+        self.__exposition_cache: ExpositionCache = ExpositionCache()
+        self.__instances_revision: int = 0
+        self.__revision_counter: itertools.count = itertools.count(1)
+        self.__snapshot_cache: tuple = None
+
+        self.__max_pool_count: int = max_pool_count
+        self.__pool_instances: list = list()
+        self.__pool_created_instances: set = set()
+        self.__pool_hit_count: int = 0
+        self.__pool_miss_count: int = 0
+
+
+    # define __getstate__ function
+
+    def __getstate__(self) -> dict:
+        '''
+        Get the state of the manager for pickle, without the exposition and 
+            snapshot caches, which are rebuilt after unpickling.
+
+        Returns:
+            Returns the state dictionary.
+        '''
+
+        manager_state: dict = self.__dict__.copy()
+        manager_state['_StopwatchManager__exposition_cache'] = None
+        manager_state['_StopwatchManager__snapshot_cache'] = None
+        manager_state['_StopwatchManager__revision_counter'] = None
+
+        return manager_state
+
+
+    # define __setstate__ function
+
+    def __setstate__(self,
+        manager_state: dict
+    ):
+        '''
+        Restore the state of the manager from pickle.
+
+        Args:
+            manager_state, dict: The state dictionary returned by __getstate__.
+        '''
+
+        self.__dict__.update(manager_state)
+        self.__exposition_cache = ExpositionCache()
+        self.__revision_counter = itertools.count(self.__instances_revision + 1)
 
 
     # define get function
@@ -128,6 +233,7 @@ class StopwatchManager:
                 raise MaxLimitError('max stopwatch instance limit')
 
         self.__stopwatch_instances[stopwatch_name] = stopwatch_instance
+        self._revise()
 
 
     # define create function
@@ -151,15 +257,53 @@ class StopwatchManager:
                 constructor method max_stopwatch_count parameter.
         '''
 
-        new_stopwatch: Stopwatch = Stopwatch()
+        if not self.__max_pool_count:
+            new_stopwatch: Stopwatch = Stopwatch(sampler = self.__stopwatch_sampler, 
+                histogram_buckets = self.__stopwatch_histogram_buckets)
+        elif self.__pool_instances:
+            new_stopwatch: Stopwatch = self.__pool_instances.pop()
+            self.__pool_hit_count += 1
+        else:
+            new_stopwatch: Stopwatch = Stopwatch(sampler = self.__stopwatch_sampler, 
+                histogram_buckets = self.__stopwatch_histogram_buckets)
+            self.__pool_miss_count += 1
 
-        self.add(
-            stopwatch_name = stopwatch_name,
-            stopwatch_instance = new_stopwatch
-        )
+        try:
+            self.add(
+                stopwatch_name = stopwatch_name,
+                stopwatch_instance = new_stopwatch
+            )
+        except (ValueError, StopwatchNameError, MaxLimitError):
+            self.__recycle(new_stopwatch)
+            raise
+
+        if self.__max_pool_count:
+            self.__pool_created_instances.add(new_stopwatch)
 
         return new_stopwatch
 
+
+    # define __recycle function
+
+    def __recycle(self,
+        stopwatch_instance: Stopwatch
+    ):
+        '''
+        Reset a Stopwatch instance and keep it in the pool, if the pool is not full.
+
+        Args:
+            stopwatch_instance, Stopwatch: The Stopwatch instance created by the manager.
+        '''
+
+        if not self.__max_pool_count or len(self.__pool_instances) >= self.__max_pool_count:
+            return
+
+        if stopwatch_instance.get_status() == StopwatchStatus.Started:
+            stopwatch_instance.stop()
+
+        stopwatch_instance.reset()
+        self.__pool_instances.append(stopwatch_instance)
+
     
     # define create_and_start function
 
@@ -206,10 +350,16 @@ class StopwatchManager:
             raise ValueError('<stopwatch_name> value invalid')
         
         try:
-            del self.__stopwatch_instances[stopwatch_name]
+            stopwatch_instance: Stopwatch = self.__stopwatch_instances.pop(stopwatch_name)
         except KeyError:
             raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
 
+        self._revise()
+
+        if stopwatch_instance in self.__pool_created_instances:
+            self.__pool_created_instances.discard(stopwatch_instance)
+            self.__recycle(stopwatch_instance)
+
 
     # define clear function
 
@@ -218,7 +368,68 @@ class StopwatchManager:
         Remove all Stopwatch instances.
         '''
 
+        for stopwatch_instance in self.__pool_created_instances:
+            self.__recycle(stopwatch_instance)
+
+        self.__pool_created_instances.clear()
         self.__stopwatch_instances.clear()
+        self._revise()
+
+
+    # define _revise function
+
+    def _revise(self):
+        '''
+        Advance the revision of the set of Stopwatch instances, which invalidates 
+            the cached selection of render_openmetrics. A subclass that keeps the 
+            instances itself calls it whenever an instance is added or removed.
+
+        The revision is drawn from a counter rather than incremented, so 
+            concurrent calls under different locks never lose a revision, and 
+            every revision is used at most once.
+        '''
+
+        self.__instances_revision = next(self.__revision_counter)
+
+
+    # define get_pool_count function
+
+    def get_pool_count(self) -> int:
+        '''
+        Gets the number of Stopwatch instances kept in the pool.
+
+        Returns:
+            Returns the number of pooled Stopwatch instances.
+        '''
+
+        return len(self.__pool_instances)
+
+
+    # define get_pool_hits function
+
+    def get_pool_hits(self) -> int:
+        '''
+        Gets the number of Stopwatch instances that create took from the pool.
+
+        Returns:
+            Returns the number of pool hits.
+        '''
+
+        return self.__pool_hit_count
+
+
+    # define get_pool_misses function
+
+    def get_pool_misses(self) -> int:
+        '''
+        Gets the number of Stopwatch instances that create had to allocate 
+            because the pool was empty.
+
+        Returns:
+            Returns the number of pool misses.
+        '''
+
+        return self.__pool_miss_count
 
 
     # define has function
@@ -258,6 +469,40 @@ class StopwatchManager:
         return len(self.__stopwatch_instances)
 
 
+    # define _select function
+
+    def _select(self,
+        stopwatch_names: list = None
+    ) -> list:
+        '''
+        Select a specified batch or all of the Stopwatch instances.
+
+        The batch methods iterate the returned list rather than the manager itself, 
+            so a subclass only needs to override this method to change how 
+            the batch is collected.
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                If this parameter is not supplied or the value is None, all Stopwatch 
+                instances are selected.
+
+        Returns:
+            Returns a list of (name, Stopwatch instance) tuples.
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if not stopwatch_names:
+            return list(self.__stopwatch_instances.items())
+
+        try:
+            return [(stopwatch_name, self.__stopwatch_instances[stopwatch_name]) 
+                for stopwatch_name in stopwatch_names]
+        except KeyError as error:
+            raise StopwatchNameError('no such stopwatch: ' + str(error.args[0]))
+
+
     # define starts function
 
     def starts(self,
@@ -269,6 +514,9 @@ class StopwatchManager:
         Note that the Stopwatch instance that has started will be skipped 
             instead of raising a StatusError exception.
 
+        The clock is read once and every Stopwatch instance of the batch 
+            starts from that same reading.
+
         Args:
             stopwatch_names, list: A list of unique names for the Stopwatch instance 
                 that needs to be started. If this parameter is not supplied or the 
@@ -286,14 +534,13 @@ class StopwatchManager:
             raise ValueError('<stopwatch_names> value invalid')
 
         real_start_count: int = 0
+        stopwatch_instances: list = self._select(stopwatch_names)
+        stopwatch_start_count: int = time.perf_counter_ns()
 
-        try:
-            for stopwatch_name in stopwatch_names if stopwatch_names else self.__stopwatch_instances:
-                if self.__stopwatch_instances[stopwatch_name].get_status() == StopwatchStatus.Stopped:
-                    self.__stopwatch_instances[stopwatch_name].start()
-                    real_start_count += 1
-        except KeyError:
-            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+        for stopwatch_name, stopwatch_instance in stopwatch_instances:
+            if stopwatch_instance.get_status() == StopwatchStatus.Stopped:
+                stopwatch_instance.start(stopwatch_start_count)
+                real_start_count += 1
         
         return real_start_count
 
@@ -308,6 +555,9 @@ class StopwatchManager:
 
         Note that the stopped stopwatch instance will be skipped 
             instead of raising a StatusError exception.
+
+        The clock is read once and every Stopwatch instance of the batch 
+            stops at that same reading.
         
         Args:
             stopwatch_names, list: A list of unique names for Stopwatch instances 
@@ -326,14 +576,13 @@ class StopwatchManager:
             raise ValueError('<stopwatch_names> value invalid')
 
         real_stop_count: int = 0
+        stopwatch_instances: list = self._select(stopwatch_names)
+        stopwatch_stop_count: int = time.perf_counter_ns()
 
-        try:
-            for stopwatch_name in stopwatch_names if stopwatch_names else self.__stopwatch_instances:
-                if self.__stopwatch_instances[stopwatch_name].get_status() == StopwatchStatus.Started:        
-                    self.__stopwatch_instances[stopwatch_name].stop()
-                    real_stop_count += 1
-        except KeyError:
-            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+        for stopwatch_name, stopwatch_instance in stopwatch_instances:
+            if stopwatch_instance.get_status() == StopwatchStatus.Started:
+                stopwatch_instance.stop_ns(stopwatch_stop_count)
+                real_stop_count += 1
         
         return real_stop_count
 
@@ -359,14 +608,43 @@ class StopwatchManager:
         if stopwatch_names and not isinstance(stopwatch_names, list):
             raise ValueError('<stopwatch_names> value invalid')
         
-        try:
-            for stopwatch_name in stopwatch_names if stopwatch_names else self.__stopwatch_instances:
-                if self.__stopwatch_instances[stopwatch_name].get_status() == StopwatchStatus.Started:
-                    self.__stopwatch_instances[stopwatch_name].stop()
+        stopwatch_instances: list = self._select(stopwatch_names)
+        stopwatch_stop_count: int = time.perf_counter_ns()
 
-                self.__stopwatch_instances[stopwatch_name].reset()
-        except KeyError:
-            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+        for stopwatch_name, stopwatch_instance in stopwatch_instances:
+            if stopwatch_instance.get_status() == StopwatchStatus.Started:
+                stopwatch_instance.stop_ns(stopwatch_stop_count)
+
+            stopwatch_instance.reset()
+
+
+    # define get_watchs_ns function
+
+    def get_watchs_ns(self,
+        stopwatch_names: list = None
+    ) -> int:
+        '''
+        Gets the exact total duration (in nanoseconds) of a specified 
+            batch or all of the Stopwatch instances.
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instance 
+                that need to get the total duration. If this parameter is not supplied 
+                or if the value is None, then all Stopwatch instances are obtained.
+
+        Returns:
+            Returns the total time (in nanoseconds) with a data type of int.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        return sum(stopwatch_instance.get_watch_ns() 
+            for stopwatch_name, stopwatch_instance in self._select(stopwatch_names))
 
 
     # define get_watchs function
@@ -378,15 +656,18 @@ class StopwatchManager:
         '''
         Gets the total duration (in seconds) of a specified 
             batch or all of the Stopwatch instances.
+
+        The durations are summed exactly in integer nanoseconds 
+            and the total is rounded once.
         
         Args:
             stopwatch_names, list: A list of unique names for the Stopwatch instance 
                 that need to get the total duration. If this parameter is not supplied 
                 or if the value is None, then all Stopwatch instances are obtained.
             watch_precision, int: Watch precision (number of decimal places).
-                If not provided or not, the default precision value of the stopwatch 
-                will be used.  whose value should be less than or equal to the constant 
-                MAX_STOPWATCH_PRECISION.
+                If not provided or not, the highest default precision of the selected 
+                Stopwatch instances will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
 
         Returns:
             Returns the total time (in seconds) of the specified batch or all of the 
@@ -394,24 +675,395 @@ class StopwatchManager:
         
         Raises:
             ValueError: The data type or value of the parameter is invalid.
-            StopwatchNameError: There is already a Stopwatch instance with the same name.
-            StatusError: Stopwatch has not stopped.
+            StopwatchNameError: There is no such Stopwatch instance.
         '''
 
         if stopwatch_names and not isinstance(stopwatch_names, list):
             raise ValueError('<stopwatch_names> value invalid')
 
-        watch_total: float = 0
+        stopwatch_instances: list = self._select(stopwatch_names)
+        watch_precision = self.__get_precision(watch_precision, stopwatch_instances)
 
-        try:
-            for stopwatch_name in stopwatch_names if stopwatch_names else self.__stopwatch_instances:
-                watch_total += self.__stopwatch_instances[stopwatch_name].get_watch(watch_precision)
-        except KeyError:
-            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
-        except StatusError as error:
-            raise StatusError('{ERROR_MESSAGE}: {STOPWATCH_NAME}'.format(
-                ERROR_MESSAGE = str(error),
-                STOPWATCH_NAME = stopwatch_name
-            ))
+        watch_total: int = sum(stopwatch_instance.get_watch_ns() 
+            for stopwatch_name, stopwatch_instance in stopwatch_instances)
+
+        return round(watch_total / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_watchs_by_prefix function
+
+    def get_watchs_by_prefix(self,
+        stopwatch_names: list = None,
+        prefix_separator: str = '::',
+        prefix_depth: int = 1,
+        watch_precision: int = None
+    ) -> dict:
+        '''
+        Gets the sum, mean and max duration (in seconds) of the Stopwatch 
+            instances grouped by name prefix, in one pass.
+
+        The prefix of a name is its first prefix_depth parts split by 
+            prefix_separator, for example the prefix of 'db::query::select' 
+            is 'db' at depth 1 and 'db::query' at depth 2. Every group is 
+            aggregated in integer nanoseconds and rounded once.
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                If this parameter is not supplied or the value is None, all Stopwatch 
+                instances are grouped.
+            prefix_separator, str: The separator between the parts of a name.
+            prefix_depth, int: The number of leading parts that form the prefix.
+            watch_precision, int: Watch precision (number of decimal places).
+                If not provided or not, the highest default precision of the selected 
+                Stopwatch instances will be used.
+
+        Returns:
+            Returns a dictionary of prefix to a dictionary with the keys 
+                count (int), sum, mean and max (in seconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        if not prefix_separator or not isinstance(prefix_separator, str):
+            raise ValueError('<prefix_separator> value invalid')
+
+        if not prefix_depth or not isinstance(prefix_depth, int) or prefix_depth < 1:
+            raise ValueError('<prefix_depth> value invalid')
+
+        stopwatch_instances: list = self._select(stopwatch_names)
+        watch_precision = self.__get_precision(watch_precision, stopwatch_instances)
+
+        watch_groups: dict = dict()
+
+        for stopwatch_name, stopwatch_instance in stopwatch_instances:
+            watch_prefix: str = prefix_separator.join(stopwatch_name.split(
+                prefix_separator, prefix_depth)[:prefix_depth])
+            watch_count: int = stopwatch_instance.get_watch_ns()
+
+            watch_group: list = watch_groups.get(watch_prefix)
+
+            if watch_group is None:
+                watch_groups[watch_prefix] = [1, watch_count, watch_count]
+            else:
+                watch_group[0] += 1
+                watch_group[1] += watch_count
+
+                if watch_count > watch_group[2]:
+                    watch_group[2] = watch_count
+
+        return {watch_prefix: {
+            'count': group_count,
+            'sum': round(group_total / NANOSECONDS_PER_SECOND, watch_precision),
+            'mean': round(group_total / group_count / NANOSECONDS_PER_SECOND, watch_precision),
+            'max': round(group_max / NANOSECONDS_PER_SECOND, watch_precision),
+        } for watch_prefix, (group_count, group_total, group_max) in watch_groups.items()}
+
+
+    # define __get_precision function
+
+    def __get_precision(self,
+        watch_precision: int,
+        stopwatch_instances: list
+    ) -> int:
+        '''
+        Validate a precision parameter of an aggregation.
+
+        Args:
+            watch_precision, int: Watch precision (number of decimal places) or None.
+            stopwatch_instances, list: The selected (name, Stopwatch instance) tuples.
+
+        Returns:
+            Returns the given precision, or the highest default precision of 
+                the selected Stopwatch instances if it is not provided.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not watch_precision:
+            return max((stopwatch_instance.get_precision() 
+                for stopwatch_name, stopwatch_instance in stopwatch_instances), default = 3)
+        elif not isinstance(watch_precision, int):
+            raise ValueError('<watch_precision> value invalid')
+        elif watch_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<watch_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        return watch_precision
+
+
+    # define snapshot function
+
+    def snapshot(self,
+        stopwatch_names: list = None
+    ) -> StopwatchSnapshot:
+        '''
+        Capture the totals, statuses and lap aggregates of a specified batch or 
+            all of the Stopwatch instances into an immutable StopwatchSnapshot.
+
+        The instances are selected once and the clock is read once, so the 
+            snapshot neither mixes two selections nor measures running instances 
+            at different moments. A record made by another thread while the 
+            snapshot is taken may or may not be included.
+
+        The records are reused from the previous snapshot for instances whose 
+            generation did not change, only the total of a running instance is 
+            measured again, and the selection itself is reused until an instance 
+            is added or removed, so taking a snapshot every second stays cheap.
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                Names without a Stopwatch instance are left out of the snapshot. If 
+                this parameter is not supplied or the value is None, all Stopwatch 
+                instances are captured.
+
+        Returns:
+            Returns a StopwatchSnapshot instance.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        snapshot_key: tuple = (self.__instances_revision, tuple(stopwatch_names or ()))
+        snapshot_cache: tuple = self.__snapshot_cache
+
+        if snapshot_cache and snapshot_cache[0] == snapshot_key:
+            snapshot_key, snapshot_names, snapshot_indexes, stopwatch_instances, \
+                previous_generations, previous_records = snapshot_cache
+        else:
+            stopwatch_instances: list = self._select()
+
+            if stopwatch_names:
+                stopwatch_names = set(stopwatch_names)
+                stopwatch_instances = [(stopwatch_name, stopwatch_instance) for stopwatch_name, 
+                    stopwatch_instance in stopwatch_instances if stopwatch_name in stopwatch_names]
+
+            snapshot_names: tuple = tuple(stopwatch_name for stopwatch_name, stopwatch_instance in stopwatch_instances)
+            snapshot_indexes: dict = {snapshot_name: snapshot_index 
+                for snapshot_index, snapshot_name in enumerate(snapshot_names)}
+            stopwatch_instances = tuple(stopwatch_instance for stopwatch_name, stopwatch_instance in stopwatch_instances)
+
+            previous_generations: list = [None] * len(stopwatch_instances)
+            previous_records: tuple = previous_generations
+
+        snapshot_count: int = time.perf_counter_ns()
+        snapshot_time: int = time.time_ns()
+
+        snapshot_generations: list = list()
+        snapshot_records: list = list()
+
+        for stopwatch_instance, previous_generation, snapshot_record in zip(
+            stopwatch_instances, previous_generations, previous_records):
+            stopwatch_generation: int = stopwatch_instance.get_generation()
+
+            if stopwatch_generation != previous_generation:
+                snapshot_record = stopwatch_instance._snapshot(snapshot_count)
+            elif snapshot_record[SnapshotField.Status] == StopwatchStatus.Started:
+                snapshot_record = snapshot_record[:SnapshotField.Watch] + (stopwatch_instance.get_watch_ns(
+                    snapshot_count),) + snapshot_record[SnapshotField.Watch + 1:]
+
+            snapshot_generations.append(stopwatch_generation)
+            snapshot_records.append(snapshot_record)
+
+        snapshot_records: tuple = tuple(snapshot_records)
+        self.__snapshot_cache = (snapshot_key, snapshot_names, snapshot_indexes, 
+            stopwatch_instances, snapshot_generations, snapshot_records)
+
+        return StopwatchSnapshot(snapshot_count, snapshot_time, snapshot_names, snapshot_records, snapshot_indexes)
+
+
+    # define render_openmetrics function
+
+    def render_openmetrics(self,
+        stopwatch_names: list = None,
+        metric_prefix: str = 'stopwatch'
+    ) -> str:
+        '''
+        Render a specified batch or all of the Stopwatch instances in the 
+            OpenMetrics text exposition format, for example to answer a scrape.
+
+        Every instance is exposed as a '<prefix>_seconds' counter and a 
+            '<prefix>_lap_seconds' histogram labelled with its name. The output is 
+            cached, and only the instances that changed since the previous call 
+            (or are running) are rendered again, so repeated scrapes of a large 
+            manager stay cheap.
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                If this parameter is not supplied or the value is None, all Stopwatch 
+                instances are rendered.
+            metric_prefix, str: The prefix of the metric names.
+
+        Returns:
+            Returns the exposition text.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        return self.__exposition_cache.render((self.__instances_revision, tuple(stopwatch_names or ())), 
+            functools.partial(self._select, stopwatch_names), metric_prefix)
+
+
+    # define to_arrays function
+
+    def to_arrays(self,
+        stopwatch_names: list = None
+    ) -> dict:
+        '''
+        Export a specified batch or all of the Stopwatch instances as arrays.
+
+        The timing records of all instances are concatenated into one array, 
+            the records of the i-th instance are lap_counts[lap_offsets[i]:lap_offsets[i + 1]].
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                If this parameter is not supplied or the value is None, all Stopwatch 
+                instances are exported.
+
+        Returns:
+            Returns a dictionary with the following keys, every array is int64 
+                (a NumPy array if NumPy is installed, otherwise a memoryview):
+                names, list: The names of the exported instances.
+                watch_counts, array: The total time (in nanoseconds) of each instance.
+                lap_offsets, array: The offset of the first record of each instance, 
+                    followed by the total number of records.
+                lap_counts, array: The record durations (in nanoseconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        stopwatch_instances: list = self._select(stopwatch_names)
+
+        watch_counts: array.array = array.array('q')
+        lap_offsets: array.array = array.array('q', [0])
+        lap_views: list = list()
+
+        for stopwatch_name, stopwatch_instance in stopwatch_instances:
+            lap_view = stopwatch_instance.laps_as_array()
+
+            watch_counts.append(stopwatch_instance.get_watch_ns())
+            lap_offsets.append(lap_offsets[-1] + len(lap_view))
+            lap_views.append(lap_view)
+
+        return {
+            'names': [stopwatch_name for stopwatch_name, stopwatch_instance in stopwatch_instances],
+            'watch_counts': to_lap_array(memoryview(watch_counts)),
+            'lap_offsets': to_lap_array(memoryview(lap_offsets)),
+            'lap_counts': to_lap_array(join_lap_arrays(lap_views)),
+        }
+
+
+    # define dump function
+
+    def dump(self,
+        dump_file,
+        stopwatch_names: list = None
+    ):
+        '''
+        Save a specified batch or all of the Stopwatch instances to a binary file.
+
+        Every instance is saved as by Stopwatch.dump, after its length-prefixed name.
+
+        Args:
+            dump_file, file: A binary file object open for writing.
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                If this parameter is not supplied or the value is None, all Stopwatch 
+                instances are saved.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        stopwatch_instances: list = self._select(stopwatch_names)
+
+        write_header(dump_file, PersistKind.Manager)
+
+        for stopwatch_name, stopwatch_instance in stopwatch_instances:
+            write_name(dump_file, stopwatch_name)
+            stopwatch_instance._dump_record(dump_file)
+
+        write_name(dump_file, None)
+
+
+    # define iter_load function
+
+    @staticmethod
+    def iter_load(
+        load_file
+    ):
+        '''
+        Read the Stopwatch instances saved by dump one at a time.
+
+        Only the instance being read is held in memory, so large files can 
+            be processed without loading a whole manager.
+
+        Args:
+            load_file, file: A binary file object open for reading.
+
+        Yields:
+            Yields (name, Stopwatch instance) tuples.
+
+        Raises:
+            FormatError: The file is invalid or truncated.
+        '''
+
+        read_header(load_file, PersistKind.Manager)
+
+        while True:
+            stopwatch_name: str = read_name(load_file)
+
+            if stopwatch_name is None:
+                return
+
+            yield stopwatch_name, Stopwatch._load_record(load_file)
+
+
+    # define load function
+
+    def load(self,
+        load_file
+    ) -> int:
+        '''
+        Add the Stopwatch instances saved by dump to the manager.
+
+        Args:
+            load_file, file: A binary file object open for reading.
+
+        Returns:
+            Returns the number of Stopwatch instances added.
+
+        Raises:
+            FormatError: The file is invalid or truncated.
+            StopwatchNameError: There is already a Stopwatch instance with the same name.
+            MaxLimitError: The number of Stopwatch instances has exceeded the limit of the 
+                constructor method max_stopwatch_count parameter.
+        '''
+
+        load_count: int = 0
+
+        for stopwatch_name, stopwatch_instance in self.iter_load(load_file):
+            self.add(stopwatch_name, stopwatch_instance)
+            load_count += 1
 
-        return watch_total
+        return load_count
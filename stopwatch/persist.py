@@ -0,0 +1,288 @@
+# stopwatch.persist.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the compact binary format used by the dump and 
+    load methods of the Stopwatch and StopwatchManager classes.
+
+A file starts with a header (magic, format version, kind). A Stopwatch file 
+    holds one stopwatch record, a StopwatchManager file holds a sequence of 
+    length-prefixed names, each followed by a stopwatch record, and ends 
+    with an empty name, so it can be read one stopwatch at a time. All 
+    values are little-endian, record durations are packed int64 arrays.
+'''
+
+import sys
+import array
+import struct
+
+from stopwatch.errors import FormatError
+
+
+# define PERSIST_MAGIC const
+
+PERSIST_MAGIC: bytes = b'SWBF'    # Magic bytes of a Stopwatch binary file.
+
+
+# define PERSIST_VERSION const
+
+PERSIST_VERSION: int = 1    # Current format version.
+
+
+# define PersistKind enum
+
+class PersistKind:
+    '''
+    An enumerator of the kinds of Stopwatch binary files.
+
+    Members:
+        Stopwatch, int: The file holds one Stopwatch.
+        Manager, int: The file holds the Stopwatch instances of a StopwatchManager.
+    '''
+
+    Stopwatch: int = 1
+    Manager: int = 2
+
+
+# define PersistFlag enum
+
+class PersistFlag:
+    '''
+    An enumerator of the option flags of a stopwatch record.
+
+    Members:
+        CompactLaps, int: The records are kept in an array-backed storage.
+        Sketch, int: A percentile sketch follows the lap statistics.
+        Histogram, int: A lap histogram follows the percentile sketch.
+    '''
+
+    CompactLaps: int = 1
+    Sketch: int = 2
+    Histogram: int = 4
+
+
+# define PERSIST_HEADER const
+
+PERSIST_HEADER: struct.Struct = struct.Struct('<4sHH')    # magic, version, kind
+
+
+# define PERSIST_STOPWATCH const
+
+PERSIST_STOPWATCH: struct.Struct = struct.Struct('<BBHIIdqqqqqddQQI')    # Fixed part of a stopwatch record.
+
+
+# define PERSIST_SKETCH const
+
+PERSIST_SKETCH: struct.Struct = struct.Struct('<QQI')    # zero count, count, bucket count
+
+
+# define PERSIST_HISTOGRAM const
+
+PERSIST_HISTOGRAM: struct.Struct = struct.Struct('<Idd')    # bound count, count, total
+
+
+# define PERSIST_NAME const
+
+PERSIST_NAME: struct.Struct = struct.Struct('<H')    # Length of an encoded name.
+
+
+# define PERSIST_INDEX const
+
+PERSIST_INDEX: struct.Struct = struct.Struct('<Q')    # Position of a named record.
+
+
+# define read_exact function
+
+def read_exact(
+    load_file,
+    read_size: int
+) -> bytes:
+    '''
+    Read an exact number of bytes.
+
+    Args:
+        load_file, file: A binary file object open for reading.
+        read_size, int: The number of bytes.
+
+    Returns:
+        Returns the bytes read.
+
+    Raises:
+        FormatError: The file is truncated.
+    '''
+
+    read_bytes: bytes = load_file.read(read_size)
+
+    if len(read_bytes) != read_size:
+        raise FormatError('unexpected end of file')
+
+    return read_bytes
+
+
+# define write_header function
+
+def write_header(
+    dump_file,
+    persist_kind: int
+):
+    '''
+    Write the file header.
+
+    Args:
+        dump_file, file: A binary file object open for writing.
+        persist_kind, int: The PersistKind of the file.
+    '''
+
+    dump_file.write(PERSIST_HEADER.pack(PERSIST_MAGIC, PERSIST_VERSION, persist_kind))
+
+
+# define read_header function
+
+def read_header(
+    load_file,
+    persist_kind: int
+):
+    '''
+    Read and check the file header.
+
+    Args:
+        load_file, file: A binary file object open for reading.
+        persist_kind, int: The expected PersistKind of the file.
+
+    Raises:
+        FormatError: The header is invalid, of a newer version or of another kind.
+    '''
+
+    persist_magic, persist_version, file_kind = PERSIST_HEADER.unpack(
+        read_exact(load_file, PERSIST_HEADER.size))
+
+    if persist_magic != PERSIST_MAGIC:
+        raise FormatError('not a stopwatch binary file')
+
+    if persist_version > PERSIST_VERSION:
+        raise FormatError('unsupported format version: ' + str(persist_version))
+
+    if file_kind != persist_kind:
+        raise FormatError('unexpected file kind: ' + str(file_kind))
+
+
+# define write_name function
+
+def write_name(
+    dump_file,
+    persist_name: str
+):
+    '''
+    Write a length-prefixed UTF-8 name, None is written as an empty name.
+
+    Args:
+        dump_file, file: A binary file object open for writing.
+        persist_name, str: The name.
+    '''
+
+    name_bytes: bytes = persist_name.encode('utf-8') if persist_name else b''
+
+    dump_file.write(PERSIST_NAME.pack(len(name_bytes)))
+    dump_file.write(name_bytes)
+
+
+# define read_name function
+
+def read_name(
+    load_file
+) -> str:
+    '''
+    Read a length-prefixed UTF-8 name.
+
+    Args:
+        load_file, file: A binary file object open for reading.
+
+    Returns:
+        Returns the name, or None for an empty name.
+
+    Raises:
+        FormatError: The file is truncated or the name is not valid UTF-8.
+    '''
+
+    name_size: int = PERSIST_NAME.unpack(read_exact(load_file, PERSIST_NAME.size))[0]
+
+    if not name_size:
+        return None
+
+    try:
+        return read_exact(load_file, name_size).decode('utf-8')
+    except UnicodeDecodeError:
+        raise FormatError('invalid name')
+
+
+# define write_array function
+
+def write_array(
+    dump_file,
+    persist_array,
+    array_format: str = 'q'
+):
+    '''
+    Write a packed int64 (or float64) array without a length prefix.
+
+    Args:
+        dump_file, file: A binary file object open for writing.
+        persist_array, array.array or memoryview: The values.
+        array_format, str: The array format of the values, 'q' or 'd'.
+    '''
+
+    if sys.byteorder == 'big':
+        persist_array = array.array(array_format, persist_array)
+        persist_array.byteswap()
+
+    dump_file.write(memoryview(persist_array).cast('B'))
+
+
+# define read_array function
+
+def read_array(
+    load_file,
+    array_count: int,
+    array_format: str = 'q'
+) -> array.array:
+    '''
+    Read a packed int64 (or float64) array.
+
+    Args:
+        load_file, file: A binary file object open for reading.
+        array_count, int: The number of values.
+        array_format, str: The array format of the values, 'q' or 'd'.
+
+    Returns:
+        Returns an array.array of the array format.
+
+    Raises:
+        FormatError: The file is truncated.
+    '''
+
+    persist_array: array.array = array.array(array_format)
+    persist_array.frombytes(read_exact(load_file, array_count * persist_array.itemsize))
+
+    if sys.byteorder == 'big':
+        persist_array.byteswap()
+
+    return persist_array
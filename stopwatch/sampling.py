@@ -0,0 +1,309 @@
+# stopwatch.sampling.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements the samplers that let a Stopwatch record 
+    only part of its timing records under load.
+
+Every sampler answers sample() with a weight: 0 means the record is 
+    skipped, otherwise the record stands for weight records, which keeps 
+    the totals, counts and averages derived from the kept records unbiased 
+    (Horvitz-Thompson estimation).
+'''
+
+import time
+import random
+
+
+# define FixedRateSampler class
+
+class FixedRateSampler:
+    '''
+    Keeps every record with the same probability.
+    '''
+
+    __slots__ = (
+        '__sample_rate',
+        '__sample_weight',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        sample_rate: float
+    ):
+        '''
+        Constructs an instance of the FixedRateSampler class object.
+
+        Args:
+            sample_rate, float: The probability (for example: 0.01) that a record is kept.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(sample_rate, float) or sample_rate <= 0 or sample_rate > 1:
+            raise ValueError('<sample_rate> value invalid')
+
+        self.__sample_rate: float = sample_rate
+        self.__sample_weight: float = 1 / sample_rate
+
+
+    # define sample function
+
+    def sample(self) -> float:
+        '''
+        Decide whether to keep a record.
+
+        Returns:
+            Returns 0 to skip the record, or the weight of the kept record.
+        '''
+
+        if random.random() < self.__sample_rate:
+            return self.__sample_weight
+
+        return 0.0
+
+
+    # define get_rate function
+
+    def get_rate(self) -> float:
+        '''
+        Get the probability that a record is kept.
+
+        Returns:
+            Returns the sample rate.
+        '''
+
+        return self.__sample_rate
+
+
+# define AdaptiveSampler class
+
+class AdaptiveSampler:
+    '''
+    Keeps records with a probability that adapts to a CPU budget.
+
+    Every adjust_count decisions, the sampler compares the estimated time 
+        spent recording (kept records times record_cost_ns) with the given 
+        share of the elapsed wall time, and scales the rate towards it. Each 
+        kept record is weighted by the rate in effect when it was kept, so 
+        the estimates stay unbiased while the rate changes.
+
+    An instance may be shared by many Stopwatch instances (for example 
+        through StopwatchManager), the budget then applies to all of them.
+    '''
+
+    __slots__ = (
+        '__cpu_budget',
+        '__record_cost_count',
+        '__min_sample_rate',
+        '__adjust_count',
+        '__sample_rate',
+        '__sample_weight',
+        '__decision_count',
+        '__kept_count',
+        '__window_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        cpu_budget: float = 0.01,
+        record_cost_ns: int = 1000,
+        min_sample_rate: float = 0.0001,
+        adjust_count: int = 1024
+    ):
+        '''
+        Constructs an instance of the AdaptiveSampler class object.
+
+        Args:
+            cpu_budget, float: The share (for example: 0.01) of wall time that 
+                recording may take.
+            record_cost_ns, int: The estimated cost (in nanoseconds) of one kept record, 
+                including the clock reads. Measure it with the package benchmarks 
+                for the best accuracy.
+            min_sample_rate, float: The lowest probability the rate can adapt to.
+            adjust_count, int: The number of decisions between two adjustments.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(cpu_budget, float) or cpu_budget <= 0 or cpu_budget > 1:
+            raise ValueError('<cpu_budget> value invalid')
+
+        if not isinstance(record_cost_ns, int) or record_cost_ns < 1:
+            raise ValueError('<record_cost_ns> value invalid')
+
+        if not isinstance(min_sample_rate, float) or min_sample_rate <= 0 or min_sample_rate > 1:
+            raise ValueError('<min_sample_rate> value invalid')
+
+        if not isinstance(adjust_count, int) or adjust_count < 1:
+            raise ValueError('<adjust_count> value invalid')
+
+        self.__cpu_budget: float = cpu_budget
+        self.__record_cost_count: int = record_cost_ns
+        self.__min_sample_rate: float = min_sample_rate
+        self.__adjust_count: int = adjust_count
+
+        self.__sample_rate: float = 1.0
+        self.__sample_weight: float = 1.0
+
+        self.__decision_count: int = 0
+        self.__kept_count: int = 0
+        self.__window_count: int = time.perf_counter_ns()
+
+
+    # define sample function
+
+    def sample(self) -> float:
+        '''
+        Decide whether to keep a record.
+
+        Returns:
+            Returns 0 to skip the record, or the weight of the kept record.
+        '''
+
+        self.__decision_count += 1
+
+        if self.__decision_count >= self.__adjust_count:
+            self.__adjust()
+
+        if self.__sample_rate >= 1 or random.random() < self.__sample_rate:
+            self.__kept_count += 1
+            return self.__sample_weight
+
+        return 0.0
+
+
+    # define __adjust function
+
+    def __adjust(self):
+        '''
+        Scale the rate so that the time spent recording meets the budget.
+        '''
+
+        window_count: int = time.perf_counter_ns()
+
+        budget_count: float = (window_count - self.__window_count) * self.__cpu_budget
+        spent_count: int = self.__kept_count * self.__record_cost_count
+
+        sample_rate: float = self.__sample_rate * budget_count / spent_count \
+            if spent_count else self.__sample_rate * 2
+
+        self.__sample_rate = min(1.0, max(self.__min_sample_rate, sample_rate))
+        self.__sample_weight = 1 / self.__sample_rate
+
+        self.__decision_count = 0
+        self.__kept_count = 0
+        self.__window_count = window_count
+
+
+    # define get_rate function
+
+    def get_rate(self) -> float:
+        '''
+        Get the current probability that a record is kept.
+
+        Returns:
+            Returns the sample rate.
+        '''
+
+        return self.__sample_rate
+
+
+# define ReservoirSampler class
+
+class ReservoirSampler:
+    '''
+    Counts every record but keeps a uniform random sample of a fixed size.
+
+    Unlike the other samplers, every record is added to the total time and 
+        the lap statistics, which cost a few integer operations, and only the 
+        lap storage is sampled (Algorithm R), so memory stays bounded while 
+        the kept records remain representative of the whole history, rather 
+        than of the most recent records as with max_laps.
+    '''
+
+    __slots__ = (
+        '__reservoir_size',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        reservoir_size: int
+    ):
+        '''
+        Constructs an instance of the ReservoirSampler class object.
+
+        Args:
+            reservoir_size, int: The number of records kept.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(reservoir_size, int) or reservoir_size < 1:
+            raise ValueError('<reservoir_size> value invalid')
+
+        self.__reservoir_size: int = reservoir_size
+
+
+    # define sample function
+
+    def sample(self) -> float:
+        '''
+        Decide whether to keep a record, every record is counted.
+
+        Returns:
+            Returns the weight of the record, which is always 1.
+        '''
+
+        return 1.0
+
+
+    # define get_rate function
+
+    def get_rate(self) -> float:
+        '''
+        Get the probability that a record is counted.
+
+        Returns:
+            Returns the sample rate, which is always 1.
+        '''
+
+        return 1.0
+
+
+    # define get_reservoir_size function
+
+    def get_reservoir_size(self) -> int:
+        '''
+        Get the number of records kept.
+
+        Returns:
+            Returns the reservoir size.
+        '''
+
+        return self.__reservoir_size
@@ -0,0 +1,714 @@
+# stopwatch.shared.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements a Stopwatch manager whose counters live in 
+    shared memory, so that the workers of a pre-fork process pool record 
+    into them directly and the parent process reads the fleet-wide totals.
+'''
+
+import os
+import time
+import struct
+import multiprocessing
+
+from multiprocessing import shared_memory
+
+from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import MAX_STOPWATCH_PRECISION
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.statistics import LapStatistics
+
+from stopwatch.errors import StatusError
+from stopwatch.errors import StopwatchNameError
+from stopwatch.errors import MaxLimitError
+
+
+# define shared memory layout consts
+
+SHARED_MAGIC: int = 0x5357415443480002    # Magic number and layout version.
+SHARED_HEADER_SIZE: int = 64              # Size (in bytes) of the header.
+SHARED_NAME_SIZE: int = 64                # Size (in bytes) of an encoded name.
+
+
+# define check_process function
+
+def check_process(
+    process_id: int
+) -> bool:
+    '''
+    Check if a process is still running.
+
+    Args:
+        process_id, int: The process id.
+
+    Returns:
+        Returns True if the process exists, otherwise False.
+    '''
+
+    try:
+        os.kill(process_id, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+
+    return True
+
+
+# define SharedField enum
+
+class SharedField:
+    '''
+    An enumerator of the counters of a named stopwatch in a worker slot.
+
+    Every slot is 8 fields of 8 bytes (one cache line), MEAN and M2 
+        are float64, all others are int64 nanoseconds or counts.
+
+    Members:
+        WatchTotal, int: The total time of all start and stop cycles.
+        WatchCount, int: The number of start and stop cycles.
+        LapCount, int: The number of records.
+        LapTotal, int: The sum of record durations.
+        LapMin, int: The shortest record duration.
+        LapMax, int: The longest record duration.
+        LapMean, int: The running mean of record durations.
+        LapM2, int: The running sum of squared deviations (Welford).
+    '''
+
+    WatchTotal: int = 0
+    WatchCount: int = 1
+    LapCount: int = 2
+    LapTotal: int = 3
+    LapMin: int = 4
+    LapMax: int = 5
+    LapMean: int = 6
+    LapM2: int = 7
+
+    Count: int = 8
+
+
+# define SharedStopwatch class
+
+class SharedStopwatch:
+    '''
+    A stopwatch that records into the slot of the current worker process.
+
+    The start count is private to the process, every stop and lap writes 
+        its result into shared memory without locking or IPC, since each 
+        worker only ever writes its own slots. A SharedStopwatch should be 
+        used by one thread at a time.
+    '''
+
+    __slots__ = (
+        '__shared_counts',
+        '__shared_means',
+        '__shared_offset',
+        '__stopwatch_start_count',
+        '__stopwatch_last_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        shared_counts: memoryview,
+        shared_means: memoryview,
+        shared_offset: int
+    ):
+        '''
+        Constructs an instance of the SharedStopwatch class object.
+
+        Use SharedStopwatchManager.get instead of constructing it directly.
+
+        Args:
+            shared_counts, memoryview: The int64 view of the shared counters.
+            shared_means, memoryview: The float64 view of the same shared counters.
+            shared_offset, int: The index of the first field of the slot.
+        '''
+
+        self.__shared_counts: memoryview = shared_counts
+        self.__shared_means: memoryview = shared_means
+        self.__shared_offset: int = shared_offset
+
+        self.__stopwatch_start_count: int = None
+        self.__stopwatch_last_count: int = None
+
+
+    # define get_status function
+
+    def get_status(self) -> int:
+        '''
+        Get the status of the Stopwatch in the current process.
+
+        Returns:
+            Returns the current state of Stopwatch whose value is indicated using 
+                the StopwatchStatus enumerator.
+        '''
+
+        return StopwatchStatus.Stopped if self.__stopwatch_start_count is None else StopwatchStatus.Started
+
+
+    # define start function
+
+    def start(self):
+        '''
+        Start running Stopwatch.
+
+        Raises:
+            StatusError: Stopwatch has started.
+        '''
+
+        if self.__stopwatch_start_count is not None:
+            raise StatusError('stopwatch has started')
+
+        self.__stopwatch_start_count = time.perf_counter_ns()
+        self.__stopwatch_last_count = self.__stopwatch_start_count
+
+
+    # define stop function
+
+    def stop(self) -> int:
+        '''
+        Stop running Stopwatch and add the elapsed time to the shared total.
+
+        Returns:
+            Returns the elapsed time (in nanoseconds) of this cycle.
+
+        Raises:
+            StatusError: Stopwatch has stopped or never started.
+        '''
+
+        stopwatch_stop_count: int = time.perf_counter_ns()
+
+        if self.__stopwatch_start_count is None:
+            raise StatusError('stopwatch has stopped')
+
+        stopwatch_count: int = stopwatch_stop_count - self.__stopwatch_start_count
+
+        self.__shared_counts[self.__shared_offset + SharedField.WatchTotal] += stopwatch_count
+        self.__shared_counts[self.__shared_offset + SharedField.WatchCount] += 1
+        self.__stopwatch_start_count = None
+
+        return stopwatch_count
+
+
+    # define lap function
+
+    def lap(self) -> int:
+        '''
+        Record the interval from the last record (or the start) to the current time 
+            into the shared lap aggregates.
+
+        Returns:
+            Returns the record duration (in nanoseconds).
+
+        Raises:
+            StatusError: Stopwatch has not started.
+        '''
+
+        stopwatch_lap_count: int = time.perf_counter_ns()
+
+        if self.__stopwatch_start_count is None:
+            raise StatusError('stopwatch did not start')
+
+        lap_count: int = stopwatch_lap_count - self.__stopwatch_last_count
+        self.__stopwatch_last_count = stopwatch_lap_count
+
+        self.record(lap_count)
+        return lap_count
+
+
+    # define record function
+
+    def record(self,
+        lap_count: int
+    ):
+        '''
+        Add a record duration measured elsewhere to the shared lap aggregates.
+
+        Args:
+            lap_count, int: Record duration (in nanoseconds).
+        '''
+
+        shared_counts: memoryview = self.__shared_counts
+        shared_offset: int = self.__shared_offset
+
+        shared_lap_count: int = shared_counts[shared_offset + SharedField.LapCount] + 1
+
+        shared_counts[shared_offset + SharedField.LapCount] = shared_lap_count
+        shared_counts[shared_offset + SharedField.LapTotal] += lap_count
+
+        if shared_lap_count == 1 or lap_count < shared_counts[shared_offset + SharedField.LapMin]:
+            shared_counts[shared_offset + SharedField.LapMin] = lap_count
+        if shared_lap_count == 1 or lap_count > shared_counts[shared_offset + SharedField.LapMax]:
+            shared_counts[shared_offset + SharedField.LapMax] = lap_count
+
+        lap_mean: float = self.__shared_means[shared_offset + SharedField.LapMean]
+        lap_delta: float = lap_count - lap_mean
+        lap_mean += lap_delta / shared_lap_count
+
+        self.__shared_means[shared_offset + SharedField.LapMean] = lap_mean
+        self.__shared_means[shared_offset + SharedField.LapM2] += lap_delta * (lap_count - lap_mean)
+
+
+# define SharedStopwatchManager class
+
+class SharedStopwatchManager:
+    '''
+    Stopwatch manager backed by shared memory.
+
+    The set of stopwatch names is fixed when the manager is constructed in the 
+        parent process. The shared block holds one slot per name for each worker, 
+        a worker claims its slots (under a lock, once per process) the first time 
+        it calls get, and afterwards writes only to its own slots. The parent 
+        reads and sums the slots of all workers in place, without copies or IPC.
+
+    When every slot has been claimed, a new worker takes over the slots of a 
+        worker process that has exited and continues its totals, so a pool 
+        that respawns its workers never runs out of slots. max_worker_count 
+        only limits the number of workers that record at the same time.
+
+    The block starts with a header (magic, worker limit, name count, claimed 
+        workers), a table of the encoded names and a table of the process id 
+        of each claimed worker, so other tools can interpret it from its 
+        name alone.
+
+    Workers must inherit the manager through fork. The parent should call 
+        close and unlink when the pool has finished.
+    '''
+
+    # define __init__ function
+
+    def __init__(self,
+        stopwatch_names: list,
+        max_worker_count: int = 64
+    ):
+        '''
+        Constructs an instance of the SharedStopwatchManager class object 
+            and allocates its shared memory block.
+
+        Args:
+            stopwatch_names, list: A list of unique names of the shared stopwatches.
+            max_worker_count, int: The maximum number of processes that record 
+                into the manager at the same time, including the parent if it 
+                records too.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not stopwatch_names or not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        if not max_worker_count or not isinstance(max_worker_count, int) or max_worker_count < 1:
+            raise ValueError('<max_worker_count> value invalid')
+
+        self.__stopwatch_indexes: dict = dict()
+
+        for stopwatch_name in stopwatch_names:
+            if not stopwatch_name or not isinstance(stopwatch_name, str):
+                raise ValueError('<stopwatch_names> value invalid')
+
+            if len(stopwatch_name.encode('utf-8')) > SHARED_NAME_SIZE:
+                raise ValueError('<stopwatch_names> name is longer than ' + str(SHARED_NAME_SIZE) + ' bytes')
+
+            if stopwatch_name in self.__stopwatch_indexes:
+                raise StopwatchNameError('stopwatch name already exists: ' + stopwatch_name)
+
+            self.__stopwatch_indexes[stopwatch_name] = len(self.__stopwatch_indexes)
+
+        self.__max_worker_count: int = max_worker_count
+        self.__pids_offset: int = SHARED_HEADER_SIZE + SHARED_NAME_SIZE * len(stopwatch_names)
+        self.__counts_offset: int = self.__pids_offset + max_worker_count * 8
+
+        self.__shared_memory: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            create = True, size = self.__counts_offset + max_worker_count * 
+                len(stopwatch_names) * SharedField.Count * 8)
+
+        struct.pack_into('<qqqq', self.__shared_memory.buf, 0, 
+            SHARED_MAGIC, max_worker_count, len(stopwatch_names), 0)
+
+        for stopwatch_name, stopwatch_index in self.__stopwatch_indexes.items():
+            self.__shared_memory.buf[SHARED_HEADER_SIZE + SHARED_NAME_SIZE * stopwatch_index:
+                SHARED_HEADER_SIZE + SHARED_NAME_SIZE * stopwatch_index + len(stopwatch_name.encode('utf-8'))] = \
+                stopwatch_name.encode('utf-8')
+
+        self.__shared_header: memoryview = self.__shared_memory.buf[:SHARED_HEADER_SIZE].cast('q')
+        self.__shared_pids: memoryview = self.__shared_memory.buf[self.__pids_offset:self.__counts_offset].cast('q')
+        self.__shared_counts: memoryview = self.__shared_memory.buf[self.__counts_offset:].cast('q')
+        self.__shared_means: memoryview = self.__shared_memory.buf[self.__counts_offset:].cast('d')
+        self.__shared_lock: multiprocessing.Lock = multiprocessing.Lock()
+
+        self.__worker_pid: int = None
+        self.__worker_index: int = None
+        self.__worker_stopwatches: dict = dict()
+
+
+    # define get_shared_name function
+
+    def get_shared_name(self) -> str:
+        '''
+        Get the name of the shared memory block.
+
+        Returns:
+            Returns the name of the shared memory block.
+        '''
+
+        return self.__shared_memory.name
+
+
+    # define get_worker_count function
+
+    def get_worker_count(self) -> int:
+        '''
+        Get the number of worker slots that have been claimed, a slot taken 
+            over from an exited worker is counted once.
+
+        Returns:
+            Returns the number of worker slots.
+        '''
+
+        return self.__shared_header[3]
+
+
+    # define __get_worker_index function
+
+    def __get_worker_index(self) -> int:
+        '''
+        Get the worker index of the current process, claiming one on first use.
+
+        An unclaimed slot is preferred, otherwise the slot of a worker process 
+            that has exited is taken over.
+
+        Returns:
+            Returns the worker index of the current process.
+
+        Raises:
+            MaxLimitError: All worker slots are claimed by running processes.
+        '''
+
+        worker_pid: int = os.getpid()
+
+        if self.__worker_pid == worker_pid:
+            return self.__worker_index
+
+        with self.__shared_lock:
+            worker_index: int = self.__shared_header[3]
+
+            if worker_index < self.__max_worker_count:
+                self.__shared_header[3] = worker_index + 1
+            else:
+                for worker_index in range(self.__max_worker_count):
+                    if self.__shared_pids[worker_index] == worker_pid or \
+                        not check_process(self.__shared_pids[worker_index]):
+                        break
+                else:
+                    raise MaxLimitError('max worker limit')
+
+            self.__shared_pids[worker_index] = worker_pid
+
+        self.__worker_pid = worker_pid
+        self.__worker_index = worker_index
+        self.__worker_stopwatches.clear()
+
+        return worker_index
+
+
+    # define __get_stopwatch_index function
+
+    def __get_stopwatch_index(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Get the index of a shared stopwatch by name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the index of the shared stopwatch.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such shared stopwatch.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        try:
+            return self.__stopwatch_indexes[stopwatch_name]
+        except KeyError:
+            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+
+
+    # define get function
+
+    def get(self,
+        stopwatch_name: str
+    ) -> SharedStopwatch:
+        '''
+        Get the SharedStopwatch of the current process by name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the SharedStopwatch that records into the current process's slot.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such shared stopwatch.
+            MaxLimitError: All worker slots have been claimed.
+        '''
+
+        stopwatch_index: int = self.__get_stopwatch_index(stopwatch_name)
+        worker_index: int = self.__get_worker_index()
+
+        try:
+            return self.__worker_stopwatches[stopwatch_name]
+        except KeyError:
+            shared_stopwatch: SharedStopwatch = SharedStopwatch(self.__shared_counts, self.__shared_means, 
+                (worker_index * len(self.__stopwatch_indexes) + stopwatch_index) * SharedField.Count)
+
+            self.__worker_stopwatches[stopwatch_name] = shared_stopwatch
+            return shared_stopwatch
+
+
+    # define has function
+
+    def has(self,
+        stopwatch_name: str
+    ) -> bool:
+        '''
+        Check if the shared stopwatch with the specified name exists.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            There is a return of True; there is no return to False.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        return stopwatch_name in self.__stopwatch_indexes
+
+
+    # define get_names function
+
+    def get_names(self) -> list:
+        '''
+        Get the names of all shared stopwatches.
+
+        Returns:
+            Returns a list of names.
+        '''
+
+        return list(self.__stopwatch_indexes.keys())
+
+
+    # define __sum_field function
+
+    def __sum_field(self,
+        stopwatch_index: int,
+        field_index: int
+    ) -> int:
+        '''
+        Sum a field of a shared stopwatch over all worker slots.
+
+        Args:
+            stopwatch_index, int: The index of the shared stopwatch.
+            field_index, int: The SharedField member to be summed.
+
+        Returns:
+            Returns the sum of the field.
+        '''
+
+        slot_stride: int = len(self.__stopwatch_indexes) * SharedField.Count
+        field_offset: int = stopwatch_index * SharedField.Count + field_index
+
+        return sum(self.__shared_counts[field_offset:field_offset + 
+            self.get_worker_count() * slot_stride:slot_stride])
+
+
+    # define get_watch_ns function
+
+    def get_watch_ns(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Gets the total time (in nanoseconds) recorded by all workers 
+            for a shared stopwatch.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the total time (in nanoseconds) of completed start and stop cycles.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such shared stopwatch.
+        '''
+
+        return self.__sum_field(self.__get_stopwatch_index(stopwatch_name), SharedField.WatchTotal)
+
+
+    # define get_watchs function
+
+    def get_watchs(self,
+        stopwatch_names: list = None,
+        watch_precision: int = 3
+    ) -> float:
+        '''
+        Gets the total duration (in seconds) recorded by all workers 
+            for a specified batch or all of the shared stopwatches.
+
+        Args:
+            stopwatch_names, list: A list of unique names of shared stopwatches. 
+                If this parameter is not supplied or the value is None, 
+                all shared stopwatches are summed.
+            watch_precision, int: Watch precision (number of decimal places), 
+                whose value should be less than or equal to the constant 
+                MAX_STOPWATCH_PRECISION.
+
+        Returns:
+            Returns the total time (in seconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such shared stopwatch.
+        '''
+
+        if stopwatch_names and not isinstance(stopwatch_names, list):
+            raise ValueError('<stopwatch_names> value invalid')
+
+        if not watch_precision or not isinstance(watch_precision, int):
+            raise ValueError('<watch_precision> value invalid')
+        elif watch_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<watch_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        watch_total: int = 0
+
+        for stopwatch_name in stopwatch_names if stopwatch_names else self.__stopwatch_indexes:
+            watch_total += self.get_watch_ns(stopwatch_name)
+
+        return round(watch_total / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_watch_count function
+
+    def get_watch_count(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Gets the number of completed start and stop cycles of all workers 
+            for a shared stopwatch.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the number of start and stop cycles.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such shared stopwatch.
+        '''
+
+        return self.__sum_field(self.__get_stopwatch_index(stopwatch_name), SharedField.WatchCount)
+
+
+    # define get_lap_statistics function
+
+    def get_lap_statistics(self,
+        stopwatch_name: str
+    ) -> LapStatistics:
+        '''
+        Gets the lap statistics of all workers for a shared stopwatch.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns a LapStatistics instance merged over all worker slots.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such shared stopwatch.
+        '''
+
+        stopwatch_index: int = self.__get_stopwatch_index(stopwatch_name)
+
+        lap_statistics: LapStatistics = LapStatistics()
+        worker_statistics: LapStatistics = LapStatistics()
+
+        for worker_index in range(self.get_worker_count()):
+            shared_offset: int = (worker_index * len(self.__stopwatch_indexes) + 
+                stopwatch_index) * SharedField.Count
+
+            worker_statistics.set_state((
+                self.__shared_counts[shared_offset + SharedField.LapCount],
+                self.__shared_counts[shared_offset + SharedField.LapTotal],
+                self.__shared_counts[shared_offset + SharedField.LapMin],
+                self.__shared_counts[shared_offset + SharedField.LapMax],
+                self.__shared_means[shared_offset + SharedField.LapMean],
+                self.__shared_means[shared_offset + SharedField.LapM2]
+            ))
+
+            lap_statistics.merge(worker_statistics)
+
+        return lap_statistics
+
+
+    # define close function
+
+    def close(self):
+        '''
+        Release the views and detach from the shared memory block.
+
+        SharedStopwatch instances obtained from the manager must not be used afterwards.
+        '''
+
+        self.__worker_stopwatches.clear()
+
+        self.__shared_header.release()
+        self.__shared_pids.release()
+        self.__shared_counts.release()
+        self.__shared_means.release()
+        self.__shared_memory.close()
+
+
+    # define unlink function
+
+    def unlink(self):
+        '''
+        Destroy the shared memory block, this should be called once by the parent.
+        '''
+
+        self.__shared_memory.unlink()
@@ -0,0 +1,260 @@
+# stopwatch.sketch.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the quantile sketch used by the Stopwatch class 
+    to estimate percentiles of timing records.
+'''
+
+import math
+
+
+# define LapSketch class
+
+class LapSketch:
+    '''
+    A mergeable quantile sketch of timing records.
+
+    Record durations (in nanoseconds) are counted in logarithmic buckets 
+        (in the style of DDSketch), so any estimated percentile is within the 
+        configured relative accuracy of the true value, and the memory used 
+        is bounded by the number of buckets rather than the number of records.
+    '''
+
+    __slots__ = (
+        '__sketch_accuracy',
+        '__sketch_gamma',
+        '__sketch_multiplier',
+        '__sketch_max_bucket_count',
+        '__sketch_buckets',
+        '__sketch_zero_count',
+        '__sketch_count',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        relative_accuracy: float = 0.01,
+        max_bucket_count: int = 2048
+    ):
+        '''
+        Constructs an instance of the LapSketch class object.
+
+        Args:
+            relative_accuracy, float: The relative accuracy of the estimated 
+                percentiles, whose value should be greater than 0 and less than 1.
+            max_bucket_count, int: The maximum number of buckets. When it is exceeded, 
+                the lowest buckets are collapsed, so only the accuracy of the lowest 
+                percentiles degrades.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(relative_accuracy, float) or relative_accuracy <= 0 or relative_accuracy >= 1:
+            raise ValueError('<relative_accuracy> value invalid')
+
+        if not max_bucket_count or not isinstance(max_bucket_count, int) or max_bucket_count < 2:
+            raise ValueError('<max_bucket_count> value invalid')
+
+        self.__sketch_accuracy: float = relative_accuracy
+        self.__sketch_gamma: float = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.__sketch_multiplier: float = 1 / math.log(self.__sketch_gamma)
+        self.__sketch_max_bucket_count: int = max_bucket_count
+
+        self.__sketch_buckets: dict = dict()
+        self.__sketch_zero_count: int = 0
+        self.__sketch_count: int = 0
+
+
+    # define get_relative_accuracy function
+
+    def get_relative_accuracy(self) -> float:
+        '''
+        Get the relative accuracy of the sketch.
+
+        Returns:
+            Returns the relative accuracy of the estimated percentiles.
+        '''
+
+        return self.__sketch_accuracy
+
+
+    # define update function
+
+    def update(self,
+        lap_count: int
+    ):
+        '''
+        Add a record duration to the sketch.
+
+        Args:
+            lap_count, int: Record duration (in nanoseconds).
+        '''
+
+        self.__sketch_count += 1
+
+        if lap_count <= 0:
+            self.__sketch_zero_count += 1
+            return
+
+        bucket_index: int = math.ceil(math.log(lap_count) * self.__sketch_multiplier)
+
+        try:
+            self.__sketch_buckets[bucket_index] += 1
+        except KeyError:
+            self.__sketch_buckets[bucket_index] = 1
+
+            if len(self.__sketch_buckets) > self.__sketch_max_bucket_count:
+                self.__collapse()
+
+
+    # define __collapse function
+
+    def __collapse(self):
+        '''
+        Fold the two lowest buckets into one to keep the number of buckets bounded.
+        '''
+
+        bucket_indexes: list = sorted(self.__sketch_buckets)[:2]
+        self.__sketch_buckets[bucket_indexes[1]] += self.__sketch_buckets.pop(bucket_indexes[0])
+
+
+    # define merge function
+
+    def merge(self,
+        lap_sketch: 'LapSketch'
+    ):
+        '''
+        Merge another sketch into the current sketch.
+
+        Args:
+            lap_sketch, LapSketch: The sketch to be merged, whose relative accuracy 
+                should be the same as the current sketch.
+
+        Raises:
+            ValueError: The relative accuracy of the sketches is different.
+        '''
+
+        if lap_sketch.__sketch_accuracy != self.__sketch_accuracy:
+            raise ValueError('<lap_sketch> relative accuracy is different')
+
+        for bucket_index, bucket_count in lap_sketch.__sketch_buckets.items():
+            self.__sketch_buckets[bucket_index] = self.__sketch_buckets.get(bucket_index, 0) + bucket_count
+
+        while len(self.__sketch_buckets) > self.__sketch_max_bucket_count:
+            self.__collapse()
+
+        self.__sketch_zero_count += lap_sketch.__sketch_zero_count
+        self.__sketch_count += lap_sketch.__sketch_count
+
+
+    # define get_state function
+
+    def get_state(self) -> tuple:
+        '''
+        Get the raw state of the sketch.
+
+        Returns:
+            Returns a (zero count, count, buckets) tuple that set_state accepts, 
+                where buckets is a copy of the bucket index to count dictionary.
+        '''
+
+        return (self.__sketch_zero_count, self.__sketch_count, dict(self.__sketch_buckets))
+
+
+    # define set_state function
+
+    def set_state(self,
+        sketch_state: tuple
+    ):
+        '''
+        Replace the sketch with a raw state, for example one read back from storage.
+
+        Args:
+            sketch_state, tuple: A (zero count, count, buckets) tuple as returned by get_state.
+        '''
+
+        self.__sketch_zero_count, self.__sketch_count, sketch_buckets = sketch_state
+        self.__sketch_buckets = dict(sketch_buckets)
+
+        while len(self.__sketch_buckets) > self.__sketch_max_bucket_count:
+            self.__collapse()
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all records from the sketch.
+        '''
+
+        self.__sketch_buckets.clear()
+        self.__sketch_zero_count = 0
+        self.__sketch_count = 0
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of records added to the sketch.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return self.__sketch_count
+
+
+    # define get_percentile function
+
+    def get_percentile(self,
+        percentile: float
+    ) -> float:
+        '''
+        Estimate a percentile of the record durations (in nanoseconds).
+
+        Args:
+            percentile, float: The percentile, whose value should be between 0 and 100.
+
+        Returns:
+            Returns the estimated duration (in nanoseconds), or 0 if there are no records.
+        '''
+
+        if not self.__sketch_count:
+            return 0.0
+
+        lap_rank: float = percentile / 100 * (self.__sketch_count - 1)
+
+        if lap_rank < self.__sketch_zero_count:
+            return 0.0
+
+        bucket_total: int = self.__sketch_zero_count
+
+        for bucket_index in sorted(self.__sketch_buckets):
+            bucket_total += self.__sketch_buckets[bucket_index]
+
+            if bucket_total > lap_rank:
+                break
+
+        return 2 * self.__sketch_gamma ** bucket_index / (self.__sketch_gamma + 1)
@@ -0,0 +1,358 @@
+# stopwatch.snapshot.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements the immutable snapshot of the Stopwatch 
+    instances of a manager taken by StopwatchManager.snapshot.
+'''
+
+from stopwatch.watch import StopwatchStatus
+from stopwatch.watch import MAX_STOPWATCH_PRECISION
+from stopwatch.watch import NANOSECONDS_PER_SECOND
+
+from stopwatch.errors import StopwatchNameError
+
+
+# define SnapshotField enum
+
+class SnapshotField:
+    '''
+    An enumerator of the fields of a snapshot record.
+
+    Members:
+        Status, int: The StopwatchStatus of the Stopwatch instance.
+        Watch, int: The total time (in nanoseconds) at the snapshot clock reading.
+        LapCount, int: The (estimated, if sampled) number of timing records.
+        LapTotal, int: The sum of the kept record durations (in nanoseconds).
+        LapMin, int: The shortest record duration (in nanoseconds).
+        LapMax, int: The longest record duration (in nanoseconds).
+        LapMean, float: The mean record duration (in nanoseconds).
+    '''
+
+    Status: int = 0
+    Watch: int = 1
+    LapCount: int = 2
+    LapTotal: int = 3
+    LapMin: int = 4
+    LapMax: int = 5
+    LapMean: int = 6
+
+    Count: int = 7
+
+
+# define StopwatchSnapshot class
+
+class StopwatchSnapshot:
+    '''
+    An immutable snapshot of the Stopwatch instances of a manager.
+
+    Every record is a tuple whose fields are indicated using the SnapshotField 
+        enumerator, and the running totals of all records are measured at the 
+        same clock reading. Records of Stopwatch instances that did not change 
+        are shared with the previous snapshot of the same manager.
+    '''
+
+    __slots__ = (
+        '__snapshot_count',
+        '__snapshot_time',
+        '__snapshot_names',
+        '__snapshot_records',
+        '__snapshot_indexes',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        snapshot_count: int,
+        snapshot_time: int,
+        snapshot_names: tuple,
+        snapshot_records: tuple,
+        snapshot_indexes: dict = None
+    ):
+        '''
+        Constructs an instance of the StopwatchSnapshot class object.
+
+        Args:
+            snapshot_count, int: The time.perf_counter_ns reading of the snapshot.
+            snapshot_time, int: The wall-clock time (in nanoseconds since the epoch) 
+                of the snapshot.
+            snapshot_names, tuple: The unique names of the Stopwatch instances.
+            snapshot_records, tuple: The records, in the order of the names.
+            snapshot_indexes, dict: The position of every name, which is never 
+                modified and may be shared by snapshots of the same names. If not 
+                provided, it is built from the names.
+        '''
+
+        self.__snapshot_count: int = snapshot_count
+        self.__snapshot_time: int = snapshot_time
+        self.__snapshot_names: tuple = snapshot_names
+        self.__snapshot_records: tuple = snapshot_records
+        self.__snapshot_indexes: dict = snapshot_indexes if snapshot_indexes is not None else {
+            snapshot_name: snapshot_index for snapshot_index, snapshot_name in enumerate(snapshot_names)}
+
+
+    # define __get_record function
+
+    def __get_record(self,
+        stopwatch_name: str
+    ) -> tuple:
+        '''
+        Get the record of a Stopwatch instance.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the record tuple.
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance in the snapshot.
+        '''
+
+        try:
+            return self.__snapshot_records[self.__snapshot_indexes[stopwatch_name]]
+        except KeyError:
+            raise StopwatchNameError('no such stopwatch: ' + str(stopwatch_name))
+
+
+    # define get_count_ns function
+
+    def get_count_ns(self) -> int:
+        '''
+        Get the clock reading of the snapshot.
+
+        Returns:
+            Returns the time.perf_counter_ns reading.
+        '''
+
+        return self.__snapshot_count
+
+
+    # define get_time_ns function
+
+    def get_time_ns(self) -> int:
+        '''
+        Get the wall-clock time of the snapshot.
+
+        Returns:
+            Returns the time (in nanoseconds since the epoch).
+        '''
+
+        return self.__snapshot_time
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of Stopwatch instances in the snapshot.
+
+        Returns:
+            Returns the number of Stopwatch instances.
+        '''
+
+        return len(self.__snapshot_names)
+
+
+    # define get_names function
+
+    def get_names(self) -> tuple:
+        '''
+        Get the unique names of the Stopwatch instances in the snapshot.
+
+        Returns:
+            Returns a tuple of names.
+        '''
+
+        return self.__snapshot_names
+
+
+    # define get_records function
+
+    def get_records(self) -> tuple:
+        '''
+        Get the records of the snapshot, in the order of get_names.
+
+        Returns:
+            Returns a tuple of record tuples, whose fields are indicated using 
+                the SnapshotField enumerator.
+        '''
+
+        return self.__snapshot_records
+
+
+    # define has function
+
+    def has(self,
+        stopwatch_name: str
+    ) -> bool:
+        '''
+        Check if the snapshot contains the Stopwatch instance with the specified name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            There is a return of True; there is no return to False.
+        '''
+
+        return stopwatch_name in self.__snapshot_indexes
+
+
+    # define get function
+
+    def get(self,
+        stopwatch_name: str
+    ) -> tuple:
+        '''
+        Get the record of the Stopwatch instance with the specified name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the record tuple, whose fields are indicated using the 
+                SnapshotField enumerator.
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance in the snapshot.
+        '''
+
+        return self.__get_record(stopwatch_name)
+
+
+    # define get_status function
+
+    def get_status(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Get the status of a Stopwatch instance at the snapshot.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the status, indicated using the StopwatchStatus enumerator.
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance in the snapshot.
+        '''
+
+        return self.__get_record(stopwatch_name)[SnapshotField.Status]
+
+
+    # define get_watch_ns function
+
+    def get_watch_ns(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Get the total time of a Stopwatch instance at the snapshot.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the total time (in nanoseconds).
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance in the snapshot.
+        '''
+
+        return self.__get_record(stopwatch_name)[SnapshotField.Watch]
+
+
+    # define get_watch function
+
+    def get_watch(self,
+        stopwatch_name: str,
+        watch_precision: int = 3
+    ) -> float:
+        '''
+        Get the total time (in seconds) of a Stopwatch instance at the snapshot.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+            watch_precision, int: Watch precision (number of decimal places), whose 
+                value should be less than or equal to the constant MAX_STOPWATCH_PRECISION.
+
+        Returns:
+            Returns the total time (in seconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance in the snapshot.
+        '''
+
+        if not watch_precision or not isinstance(watch_precision, int) or watch_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<watch_precision> value invalid')
+
+        return round(self.__get_record(stopwatch_name)[SnapshotField.Watch] / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_lap_count function
+
+    def get_lap_count(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Get the number of timing records of a Stopwatch instance at the snapshot.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the number of records.
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance in the snapshot.
+        '''
+
+        return self.__get_record(stopwatch_name)[SnapshotField.LapCount]
+
+
+    # define get_watchs_ns function
+
+    def get_watchs_ns(self) -> int:
+        '''
+        Get the exact total time of all Stopwatch instances in the snapshot.
+
+        Returns:
+            Returns the total time (in nanoseconds).
+        '''
+
+        return sum(snapshot_record[SnapshotField.Watch] for snapshot_record in self.__snapshot_records)
+
+
+    # define get_started_count function
+
+    def get_started_count(self) -> int:
+        '''
+        Get the number of Stopwatch instances that were running at the snapshot.
+
+        Returns:
+            Returns the number of running Stopwatch instances.
+        '''
+
+        return sum(1 for snapshot_record in self.__snapshot_records 
+            if snapshot_record[SnapshotField.Status] == StopwatchStatus.Started)
@@ -0,0 +1,475 @@
+# stopwatch.spans.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements nested span timing: a SpanStopwatch opens 
+    child scopes inside each other and records them into a tree of 
+    SpanNode aggregates, which can be merged across many requests.
+'''
+
+import time
+
+from stopwatch.errors import StatusError
+
+
+# define SpanNode class
+
+class SpanNode:
+    '''
+    An aggregate node of a span tree.
+
+    A node stands for every span with the same path (for example request, 
+        db, query), not for a single call, so the tree stays as small as the 
+        number of distinct paths. The self time of a node is its total time 
+        minus the total time of its children.
+    '''
+
+    __slots__ = (
+        '__span_name',
+        '__span_count',
+        '__span_total_count',
+        '__span_child_count',
+        '__span_children',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        span_name: str = None
+    ):
+        '''
+        Constructs an instance of the SpanNode class object.
+
+        Args:
+            span_name, str: The name of the span. The root node of a tree has no name.
+        '''
+
+        self.__span_name: str = span_name
+        self.__span_count: int = 0
+        self.__span_total_count: int = 0
+        self.__span_child_count: int = 0
+        self.__span_children: dict = None
+
+
+    # define get_name function
+
+    def get_name(self) -> str:
+        '''
+        Get the name of the span.
+
+        Returns:
+            Returns the name of the span, or None for the root node.
+        '''
+
+        return self.__span_name
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of spans recorded into the node.
+
+        Returns:
+            Returns the number of spans.
+        '''
+
+        return self.__span_count
+
+
+    # define get_total_ns function
+
+    def get_total_ns(self) -> int:
+        '''
+        Get the total time (in nanoseconds) of the spans, including their children.
+
+        Returns:
+            Returns the total time (in nanoseconds).
+        '''
+
+        return self.__span_total_count
+
+
+    # define get_self_ns function
+
+    def get_self_ns(self) -> int:
+        '''
+        Get the self time (in nanoseconds) of the spans, excluding their children.
+
+        Returns:
+            Returns the self time (in nanoseconds).
+        '''
+
+        return self.__span_total_count - self.__span_child_count
+
+
+    # define get_child function
+
+    def get_child(self,
+        span_name: str
+    ) -> 'SpanNode':
+        '''
+        Get a child node by name, creating it if it does not exist.
+
+        Args:
+            span_name, str: The name of the child span.
+
+        Returns:
+            Returns the child SpanNode.
+        '''
+
+        if self.__span_children is None:
+            self.__span_children = dict()
+
+        span_child: SpanNode = self.__span_children.get(span_name)
+
+        if span_child is None:
+            span_child = self.__span_children[span_name] = SpanNode(span_name)
+
+        return span_child
+
+
+    # define has_child function
+
+    def has_child(self,
+        span_name: str
+    ) -> bool:
+        '''
+        Check if the node has a child with the specified name.
+
+        Args:
+            span_name, str: The name of the child span.
+
+        Returns:
+            Returns True if it exists, or False if it does not exist.
+        '''
+
+        return bool(self.__span_children) and span_name in self.__span_children
+
+
+    # define get_children function
+
+    def get_children(self) -> list:
+        '''
+        Get the child nodes in the order they were first recorded.
+
+        Returns:
+            Returns a list of SpanNode instances.
+        '''
+
+        if not self.__span_children:
+            return list()
+
+        return list(self.__span_children.values())
+
+
+    # define add function
+
+    def add(self,
+        span_count: int,
+        child_count: int = 0
+    ):
+        '''
+        Record one span into the node.
+
+        Args:
+            span_count, int: The duration (in nanoseconds) of the span.
+            child_count, int: The part of the duration spent in child spans.
+        '''
+
+        self.__span_count += 1
+        self.__span_total_count += span_count
+        self.__span_child_count += child_count
+
+
+    # define merge function
+
+    def merge(self,
+        span_node: 'SpanNode'
+    ):
+        '''
+        Merge another span tree into the node, node by node along equal paths.
+
+        Args:
+            span_node, SpanNode: The root of the tree to be merged.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(span_node, SpanNode):
+            raise ValueError('<span_node> value invalid')
+
+        self.__span_count += span_node.__span_count
+        self.__span_total_count += span_node.__span_total_count
+        self.__span_child_count += span_node.__span_child_count
+
+        if span_node.__span_children:
+            for span_name, span_child in span_node.__span_children.items():
+                self.get_child(span_name).merge(span_child)
+
+
+    # define walk function
+
+    def walk(self,
+        span_depth: int = 0
+    ):
+        '''
+        Iterate the node and all of its descendants in depth-first order.
+
+        Args:
+            span_depth, int: The depth reported for this node.
+
+        Yields:
+            Yields (depth, SpanNode) tuples, suitable for printing the tree.
+        '''
+
+        yield span_depth, self
+
+        if self.__span_children:
+            for span_child in self.__span_children.values():
+                yield from span_child.walk(span_depth + 1)
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all recorded spans and children.
+        '''
+
+        self.__span_count = 0
+        self.__span_total_count = 0
+        self.__span_child_count = 0
+        self.__span_children = None
+
+
+# define SpanScope class
+
+class SpanScope:
+    '''
+    A context manager that opens a span on entering and closes it on leaving.
+
+    Use SpanStopwatch.span instead of constructing it directly.
+    '''
+
+    __slots__ = (
+        '__scope_stopwatch',
+        '__scope_name',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        scope_stopwatch: 'SpanStopwatch',
+        scope_name: str
+    ):
+        '''
+        Constructs an instance of the SpanScope class object.
+
+        Args:
+            scope_stopwatch, SpanStopwatch: The stopwatch that records the span.
+            scope_name, str: The name of the span.
+        '''
+
+        self.__scope_stopwatch: SpanStopwatch = scope_stopwatch
+        self.__scope_name: str = scope_name
+
+
+    # define __enter__ function
+
+    def __enter__(self) -> 'SpanStopwatch':
+        '''
+        Open the span when entering a with block.
+        '''
+
+        self.__scope_stopwatch.enter(self.__scope_name)
+        return self.__scope_stopwatch
+
+
+    # define __exit__ function
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        '''
+        Close the span when leaving the with block.
+        '''
+
+        self.__scope_stopwatch.exit()
+        return False
+
+
+# define SpanStopwatch class
+
+class SpanStopwatch:
+    '''
+    Records nested spans into a span tree.
+
+    A span is opened with enter and closed with exit (or with the span 
+        context manager), spans opened inside it become its children. An 
+        instance keeps a single stack of open spans, so it is meant to be 
+        used by one request or task at a time; use one instance per request 
+        and merge their trees (SpanNode.merge) into a shared tree to 
+        aggregate many requests.
+    '''
+
+    __slots__ = (
+        '__span_root',
+        '__span_nodes',
+        '__span_start_counts',
+        '__span_child_counts',
+    )
+
+    # define __init__ function
+
+    def __init__(self):
+        '''
+        Constructs an instance of the SpanStopwatch class object.
+        '''
+
+        self.__span_root: SpanNode = SpanNode()
+        self.__span_nodes: list = [self.__span_root]
+        self.__span_start_counts: list = list()
+        self.__span_child_counts: list = [0]
+
+
+    # define enter function
+
+    def enter(self,
+        span_name: str,
+        enter_count: int = None
+    ):
+        '''
+        Open a span as a child of the innermost open span.
+
+        Args:
+            span_name, str: The name of the span.
+            enter_count, int: A time.perf_counter_ns() reading taken by the caller. 
+                If not provided or not, the clock is read.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not span_name or not isinstance(span_name, str):
+            raise ValueError('<span_name> value invalid')
+
+        self.__span_nodes.append(self.__span_nodes[-1].get_child(span_name))
+        self.__span_child_counts.append(0)
+        self.__span_start_counts.append(enter_count if enter_count is not None else time.perf_counter_ns())
+
+
+    # define exit function
+
+    def exit(self,
+        exit_count: int = None
+    ) -> int:
+        '''
+        Close the innermost open span.
+
+        Args:
+            exit_count, int: A time.perf_counter_ns() reading taken by the caller. 
+                If not provided or not, the clock is read.
+
+        Returns:
+            Returns the duration (in nanoseconds) of the span.
+
+        Raises:
+            StatusError: There is no open span.
+        '''
+
+        if exit_count is None:
+            exit_count = time.perf_counter_ns()
+
+        if not self.__span_start_counts:
+            raise StatusError('no span is open')
+
+        span_count: int = exit_count - self.__span_start_counts.pop()
+
+        self.__span_nodes.pop().add(span_count, self.__span_child_counts.pop())
+        self.__span_child_counts[-1] += span_count
+
+        return span_count
+
+
+    # define span function
+
+    def span(self,
+        span_name: str
+    ) -> SpanScope:
+        '''
+        Get a context manager that records its block as a span.
+
+        Args:
+            span_name, str: The name of the span.
+
+        Returns:
+            Returns a SpanScope context manager.
+        '''
+
+        return SpanScope(self, span_name)
+
+
+    # define get_depth function
+
+    def get_depth(self) -> int:
+        '''
+        Get the number of open spans.
+
+        Returns:
+            Returns the number of open spans.
+        '''
+
+        return len(self.__span_start_counts)
+
+
+    # define get_root function
+
+    def get_root(self) -> SpanNode:
+        '''
+        Get the root of the span tree.
+
+        The root has no name and no count, its children are the outermost 
+            spans. The tree is returned without copying, merge it into 
+            another SpanNode to keep a copy.
+
+        Returns:
+            Returns the root SpanNode.
+        '''
+
+        return self.__span_root
+
+
+    # define reset function
+
+    def reset(self):
+        '''
+        Remove all recorded spans.
+
+        Raises:
+            StatusError: A span is still open.
+        '''
+
+        if self.__span_start_counts:
+            raise StatusError('span is still open')
+
+        self.__span_root.clear()
+        self.__span_child_counts[0] = 0
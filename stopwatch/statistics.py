@@ -0,0 +1,297 @@
+# stopwatch.statistics.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module defines the running lap statistics used by the Stopwatch class.
+'''
+
+import math
+
+
+# define get_percentile function
+
+def get_percentile(
+    lap_counts: list,
+    percentile: float
+) -> float:
+    '''
+    Compute a percentile of record durations exactly, interpolating 
+        linearly between the two closest ranks.
+
+    Args:
+        lap_counts, list: Record durations (in nanoseconds), in any order.
+        percentile, float: The percentile, whose value should be between 0 and 100.
+
+    Returns:
+        Returns the percentile (in nanoseconds), or 0 if there are no records.
+    '''
+
+    if not lap_counts:
+        return 0.0
+
+    lap_counts = sorted(lap_counts)
+    lap_rank: float = percentile / 100 * (len(lap_counts) - 1)
+    lap_index: int = int(lap_rank)
+
+    if lap_index + 1 < len(lap_counts):
+        return lap_counts[lap_index] + (lap_counts[lap_index + 1] - 
+            lap_counts[lap_index]) * (lap_rank - lap_index)
+
+    return float(lap_counts[lap_index])
+
+
+# define LapStatistics class
+
+class LapStatistics:
+    '''
+    Running statistics of timing records.
+
+    The count, sum, minimum, maximum and variance (Welford's algorithm) are 
+        updated once per record, so every query answers in constant time 
+        regardless of the number of records. All durations are in nanoseconds.
+    '''
+
+    __slots__ = (
+        '__lap_count',
+        '__lap_total',
+        '__lap_min',
+        '__lap_max',
+        '__lap_mean',
+        '__lap_m2',
+    )
+
+    # define __init__ function
+
+    def __init__(self):
+        '''
+        Constructs an instance of the LapStatistics class object.
+        '''
+
+        self.__lap_count: int = 0
+        self.__lap_total: int = 0
+        self.__lap_min: int = 0
+        self.__lap_max: int = 0
+        self.__lap_mean: float = 0.0
+        self.__lap_m2: float = 0.0
+
+
+    # define update function
+
+    def update(self,
+        lap_count: int
+    ):
+        '''
+        Add a record duration to the statistics.
+
+        Args:
+            lap_count, int: Record duration (in nanoseconds).
+        '''
+
+        self.__lap_count += 1
+        self.__lap_total += lap_count
+
+        if self.__lap_count == 1:
+            self.__lap_min = lap_count
+            self.__lap_max = lap_count
+        elif lap_count < self.__lap_min:
+            self.__lap_min = lap_count
+        elif lap_count > self.__lap_max:
+            self.__lap_max = lap_count
+
+        lap_delta: float = lap_count - self.__lap_mean
+        self.__lap_mean += lap_delta / self.__lap_count
+        self.__lap_m2 += lap_delta * (lap_count - self.__lap_mean)
+
+
+    # define merge function
+
+    def merge(self,
+        lap_statistics: 'LapStatistics'
+    ):
+        '''
+        Merge the statistics of another instance into the current instance.
+
+        Args:
+            lap_statistics, LapStatistics: The statistics to be merged.
+        '''
+
+        if not lap_statistics.__lap_count:
+            return
+
+        if not self.__lap_count:
+            self.__lap_min = lap_statistics.__lap_min
+            self.__lap_max = lap_statistics.__lap_max
+        else:
+            self.__lap_min = min(self.__lap_min, lap_statistics.__lap_min)
+            self.__lap_max = max(self.__lap_max, lap_statistics.__lap_max)
+
+        lap_count: int = self.__lap_count + lap_statistics.__lap_count
+        lap_delta: float = lap_statistics.__lap_mean - self.__lap_mean
+
+        self.__lap_m2 += lap_statistics.__lap_m2 + lap_delta * lap_delta * (
+            self.__lap_count * lap_statistics.__lap_count / lap_count)
+        self.__lap_mean += lap_delta * lap_statistics.__lap_count / lap_count
+
+        self.__lap_count = lap_count
+        self.__lap_total += lap_statistics.__lap_total
+
+
+    # define get_state function
+
+    def get_state(self) -> tuple:
+        '''
+        Get the raw state of the statistics.
+
+        Returns:
+            Returns a (count, total, min, max, mean, m2) tuple that set_state accepts.
+        '''
+
+        return (self.__lap_count, self.__lap_total, self.__lap_min, 
+            self.__lap_max, self.__lap_mean, self.__lap_m2)
+
+
+    # define set_state function
+
+    def set_state(self,
+        lap_state: tuple
+    ):
+        '''
+        Replace the statistics with a raw state, for example one read back from storage.
+
+        Args:
+            lap_state, tuple: A (count, total, min, max, mean, m2) tuple as returned by get_state.
+        '''
+
+        self.__lap_count, self.__lap_total, self.__lap_min, \
+            self.__lap_max, self.__lap_mean, self.__lap_m2 = lap_state
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Clear the statistics.
+        '''
+
+        self.__lap_count = 0
+        self.__lap_total = 0
+        self.__lap_min = 0
+        self.__lap_max = 0
+        self.__lap_mean = 0.0
+        self.__lap_m2 = 0.0
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Get the number of records.
+
+        Returns:
+            Returns the number of records.
+        '''
+
+        return self.__lap_count
+
+
+    # define get_total function
+
+    def get_total(self) -> int:
+        '''
+        Get the sum of all record durations (in nanoseconds).
+
+        Returns:
+            Returns the sum of all record durations (in nanoseconds).
+        '''
+
+        return self.__lap_total
+
+
+    # define get_min function
+
+    def get_min(self) -> int:
+        '''
+        Get the shortest record duration (in nanoseconds).
+
+        Returns:
+            Returns the shortest record duration, or 0 if there are no records.
+        '''
+
+        return self.__lap_min
+
+
+    # define get_max function
+
+    def get_max(self) -> int:
+        '''
+        Get the longest record duration (in nanoseconds).
+
+        Returns:
+            Returns the longest record duration, or 0 if there are no records.
+        '''
+
+        return self.__lap_max
+
+
+    # define get_mean function
+
+    def get_mean(self) -> float:
+        '''
+        Get the average record duration (in nanoseconds).
+
+        Returns:
+            Returns the average record duration, or 0 if there are no records.
+        '''
+
+        if not self.__lap_count:
+            return 0.0
+
+        return self.__lap_total / self.__lap_count
+
+
+    # define get_variance function
+
+    def get_variance(self) -> float:
+        '''
+        Get the population variance of record durations (in square nanoseconds).
+
+        Returns:
+            Returns the population variance, or 0 if there are no records.
+        '''
+
+        if not self.__lap_count:
+            return 0.0
+
+        return self.__lap_m2 / self.__lap_count
+
+
+    # define get_stddev function
+
+    def get_stddev(self) -> float:
+        '''
+        Get the population standard deviation of record durations (in nanoseconds).
+
+        Returns:
+            Returns the population standard deviation, or 0 if there are no records.
+        '''
+
+        return math.sqrt(self.get_variance())
@@ -0,0 +1,308 @@
+# stopwatch.threadsafe.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements a thread-safe Stopwatch instance manager.
+'''
+
+import threading
+
+from stopwatch.watch import Stopwatch
+
+from stopwatch.manager import StopwatchManager
+
+from stopwatch.errors import StopwatchNameError
+from stopwatch.errors import MaxLimitError
+
+
+# define ConcurrentStopwatchManager class
+
+class ConcurrentStopwatchManager(StopwatchManager):
+    '''
+    Thread-safe Stopwatch multi-instance manager.
+
+    Stopwatch instances are spread over a number of shards by the hash of 
+        their name, and every shard is guarded by its own lock (lock striping), 
+        so threads working on different names rarely wait for each other. Batch 
+        methods operate on a per-shard copy taken under the shard lock, so 
+        concurrent add and remove calls never break an iteration.
+
+    The total count is only tracked under a separate lock when 
+        max_stopwatch_count is set, otherwise no lock is shared by all names.
+
+    Note that the manager only protects its own registry, a single Stopwatch 
+        instance should still be used by one thread at a time.
+    '''
+
+    # define __init__ function
+
+    def __init__(self,
+        max_stopwatch_count: int = None,
+        shard_count: int = 16,
+        stopwatch_sampler = None,
+        stopwatch_histogram_buckets: list = None
+    ):
+        '''
+        Constructs an instance of the ConcurrentStopwatchManager class object.
+
+        Args:
+            max_stopwatch_count, int: The maximum number of Stopwatch instances that 
+                can be accommodated. If this parameter is not supplied or the value 
+                is None, the number of instances is not limited.
+            shard_count, int: The number of shards (and locks) the instances are 
+                spread over.
+            stopwatch_sampler, FixedRateSampler, AdaptiveSampler or ReservoirSampler: 
+                The sampler shared by the Stopwatch instances created by the manager.
+            stopwatch_histogram_buckets, list: The lap histogram bucket bounds (in seconds) 
+                of the Stopwatch instances created by the manager.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not shard_count or not isinstance(shard_count, int) or shard_count < 1:
+            raise ValueError('<shard_count> value invalid')
+
+        super().__init__(max_stopwatch_count, stopwatch_sampler = stopwatch_sampler, 
+            stopwatch_histogram_buckets = stopwatch_histogram_buckets)
+
+        self.__max_stopwatch_count: int = max_stopwatch_count
+        self.__stopwatch_count: int = 0
+        self.__count_lock: threading.Lock = threading.Lock()
+
+        self.__shard_instances: list = [dict() for shard_index in range(shard_count)]
+        self.__shard_locks: list = [threading.Lock() for shard_index in range(shard_count)]
+
+
+    # define __get_shard_index function
+
+    def __get_shard_index(self,
+        stopwatch_name: str
+    ) -> int:
+        '''
+        Get the index of the shard that holds the specified name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+
+        Returns:
+            Returns the index of the shard.
+        '''
+
+        return hash(stopwatch_name) % len(self.__shard_instances)
+
+
+    # define get function
+
+    def get(self,
+        stopwatch_name: str
+    ) -> Stopwatch:
+        '''
+        Get a Stopwatch instance by name.
+
+        The lookup does not take a lock, a single dictionary read is atomic.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+        
+        Returns:
+            Returns the specified Stopwatch instance.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        try:
+            return self.__shard_instances[self.__get_shard_index(stopwatch_name)][stopwatch_name]
+        except KeyError:
+            raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+
+
+    # define add function
+
+    def add(self,
+        stopwatch_name: str,
+        stopwatch_instance: Stopwatch
+    ):
+        '''
+        Add a Stopwatch instance.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+            stopwatch_instance, Stopwatch: The Stopwatch instance object to be added.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is already a Stopwatch instance with the same name.
+            MaxLimitError: The number of Stopwatch instances has exceeded the limit of the 
+                constructor method max_stopwatch_count parameter.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        if not stopwatch_instance or not isinstance(stopwatch_instance, Stopwatch):
+            raise ValueError('<stopwatch_instance> value invalid')
+
+        shard_index: int = self.__get_shard_index(stopwatch_name)
+
+        with self.__shard_locks[shard_index]:
+            if stopwatch_name in self.__shard_instances[shard_index]:
+                raise StopwatchNameError('stopwatch name already exists: ' + stopwatch_name)
+
+            if self.__max_stopwatch_count:
+                with self.__count_lock:
+                    if self.__stopwatch_count >= self.__max_stopwatch_count:
+                        raise MaxLimitError('max stopwatch instance limit')
+
+                    self.__stopwatch_count += 1
+
+            self.__shard_instances[shard_index][stopwatch_name] = stopwatch_instance
+            self._revise()
+
+
+    # define remove function
+
+    def remove(self,
+        stopwatch_name: str
+    ):
+        '''
+        Remove the Stopwatch instance with the specified name.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        shard_index: int = self.__get_shard_index(stopwatch_name)
+
+        with self.__shard_locks[shard_index]:
+            try:
+                del self.__shard_instances[shard_index][stopwatch_name]
+            except KeyError:
+                raise StopwatchNameError('no such stopwatch: ' + stopwatch_name)
+
+            self._revise()
+
+            if self.__max_stopwatch_count:
+                with self.__count_lock:
+                    self.__stopwatch_count -= 1
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all Stopwatch instances.
+        '''
+
+        for shard_index in range(len(self.__shard_instances)):
+            with self.__shard_locks[shard_index]:
+                if self.__max_stopwatch_count:
+                    with self.__count_lock:
+                        self.__stopwatch_count -= len(self.__shard_instances[shard_index])
+
+                self.__shard_instances[shard_index].clear()
+
+        self._revise()
+
+
+    # define has function
+
+    def has(self,
+        stopwatch_name: str
+    ) -> bool:
+        '''
+        Check if the Stopwatch instance with the specified name exists.
+
+        Args:
+            stopwatch_name, str: Stopwatch unique name.
+        
+        Returns:
+            There is a return of True; there is no return to False.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not stopwatch_name or not isinstance(stopwatch_name, str):
+            raise ValueError('<stopwatch_name> value invalid')
+
+        return stopwatch_name in self.__shard_instances[self.__get_shard_index(stopwatch_name)]
+
+
+    # define get_count function
+
+    def get_count(self) -> int:
+        '''
+        Gets the number of Stopwatch instances that have been added.
+
+        Returns:
+            Returns the number of Stopwatch instances.
+        '''
+
+        return sum(len(shard_instances) for shard_instances in self.__shard_instances)
+
+
+    # define _select function
+
+    def _select(self,
+        stopwatch_names: list = None
+    ) -> list:
+        '''
+        Select a specified batch or all of the Stopwatch instances.
+
+        Each shard is copied under its own lock, so the result is consistent 
+            per shard but other threads are never blocked for the whole batch.
+
+        Args:
+            stopwatch_names, list: A list of unique names for the Stopwatch instances. 
+                If this parameter is not supplied or the value is None, all Stopwatch 
+                instances are selected.
+
+        Returns:
+            Returns a list of (name, Stopwatch instance) tuples.
+
+        Raises:
+            StopwatchNameError: There is no such Stopwatch instance.
+        '''
+
+        if stopwatch_names:
+            return [(stopwatch_name, self.get(stopwatch_name)) for stopwatch_name in stopwatch_names]
+
+        stopwatch_instances: list = list()
+
+        for shard_index in range(len(self.__shard_instances)):
+            with self.__shard_locks[shard_index]:
+                stopwatch_instances.extend(self.__shard_instances[shard_index].items())
+
+        return stopwatch_instances
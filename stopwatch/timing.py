@@ -0,0 +1,322 @@
+# stopwatch.timing.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements the timed decorator and context manager, 
+    which record the time spent in a block or function into a Stopwatch 
+    of a StopwatchManager, and a global switch to disable them.
+'''
+
+import time
+import inspect
+import functools
+import contextvars
+
+import stopwatch
+
+from stopwatch.watch import Stopwatch
+
+from stopwatch.manager import StopwatchManager
+
+from stopwatch.errors import StopwatchNameError
+
+
+# define timing_enabled variable
+
+timing_enabled: bool = True    # Whether timed records anything, read when timed is called.
+
+
+# define enable function
+
+def enable():
+    '''
+    Enable the timed decorator and context manager.
+
+    Functions decorated while timing was disabled stay undecorated.
+    '''
+
+    global timing_enabled
+    timing_enabled = True
+
+
+# define disable function
+
+def disable():
+    '''
+    Disable the timed decorator and context manager.
+
+    Functions decorated afterwards are returned unchanged, so disabled 
+        instrumentation costs nothing when they are called, and timed 
+        blocks only cost entering and leaving a no-op context manager. 
+        Functions that were already decorated keep recording.
+    '''
+
+    global timing_enabled
+    timing_enabled = False
+
+
+# define is_enabled function
+
+def is_enabled() -> bool:
+    '''
+    Check if the timed decorator and context manager are enabled.
+
+    Returns:
+        Returns True if enabled, or False if disabled.
+    '''
+
+    return timing_enabled
+
+
+# define Timer class
+
+class Timer:
+    '''
+    Records the time spent in a block or a function into a named Stopwatch.
+
+    Every block or call is recorded with Stopwatch.record, so it is added to 
+        the total time and kept as an anonymous timing record. Use timed 
+        instead of constructing it directly.
+
+    The start of each with block is kept in a context variable, so one 
+        Timer can be entered by several threads and tasks at the same time.
+    '''
+
+    __slots__ = (
+        '__timer_name',
+        '__timer_manager',
+        '__timer_start_counts',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        stopwatch_name: str,
+        stopwatch_manager: StopwatchManager
+    ):
+        '''
+        Constructs an instance of the Timer class object.
+
+        Args:
+            stopwatch_name, str: The unique name of the Stopwatch to record into, 
+                it is created on first use if the manager does not have it.
+            stopwatch_manager, StopwatchManager: The manager that holds the Stopwatch.
+        '''
+
+        self.__timer_name: str = stopwatch_name
+        self.__timer_manager: StopwatchManager = stopwatch_manager
+        self.__timer_start_counts: contextvars.ContextVar = contextvars.ContextVar('timer_start_counts', default = ())
+
+
+    # define get_stopwatch function
+
+    def get_stopwatch(self) -> Stopwatch:
+        '''
+        Get the Stopwatch that the timer records into, creating it if needed.
+
+        Returns:
+            Returns the Stopwatch instance.
+        '''
+
+        try:
+            return self.__timer_manager.get(self.__timer_name)
+        except StopwatchNameError:
+            pass
+
+        try:
+            return self.__timer_manager.create(self.__timer_name)
+        except StopwatchNameError:
+            return self.__timer_manager.get(self.__timer_name)
+
+
+    # define __enter__ function
+
+    def __enter__(self) -> 'Timer':
+        '''
+        Remember the time when entering a with block.
+        '''
+
+        timer_stopwatch: Stopwatch = self.get_stopwatch()
+        timer_weight: float = timer_stopwatch.sample()
+
+        self.__timer_start_counts.set(self.__timer_start_counts.get() + ((timer_stopwatch, timer_weight, 
+            time.perf_counter_ns() if timer_weight else 0),))
+        return self
+
+
+    # define __exit__ function
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        '''
+        Record the time spent in the with block.
+        '''
+
+        timer_start_counts: tuple = self.__timer_start_counts.get()
+        timer_stopwatch, timer_weight, timer_start_count = timer_start_counts[-1]
+        self.__timer_start_counts.set(timer_start_counts[:-1])
+
+        if timer_weight:
+            timer_stopwatch.record(time.perf_counter_ns() - timer_start_count, lap_weight = timer_weight)
+
+
+    # define __call__ function
+
+    def __call__(self,
+        timed_function
+    ):
+        '''
+        Decorate a function (or a coroutine function) so that every call is recorded.
+
+        Args:
+            timed_function, callable: The function to be decorated.
+
+        Returns:
+            Returns the decorated function.
+        '''
+
+        if inspect.iscoroutinefunction(timed_function):
+            @functools.wraps(timed_function)
+            async def timed_coroutine_function(*args, **kwargs):
+                timer_stopwatch: Stopwatch = self.get_stopwatch()
+                timer_weight: float = timer_stopwatch.sample()
+
+                if not timer_weight:
+                    return await timed_function(*args, **kwargs)
+
+                timer_start_count: int = time.perf_counter_ns()
+
+                try:
+                    return await timed_function(*args, **kwargs)
+                finally:
+                    timer_stopwatch.record(time.perf_counter_ns() - timer_start_count, lap_weight = timer_weight)
+
+            return timed_coroutine_function
+
+        @functools.wraps(timed_function)
+        def timed_wrapper_function(*args, **kwargs):
+            timer_stopwatch: Stopwatch = self.get_stopwatch()
+            timer_weight: float = timer_stopwatch.sample()
+
+            if not timer_weight:
+                return timed_function(*args, **kwargs)
+
+            timer_start_count: int = time.perf_counter_ns()
+
+            try:
+                return timed_function(*args, **kwargs)
+            finally:
+                timer_stopwatch.record(time.perf_counter_ns() - timer_start_count, lap_weight = timer_weight)
+
+        return timed_wrapper_function
+
+
+# define NullTimer class
+
+class NullTimer:
+    '''
+    The timer returned by timed while timing is disabled, it records nothing.
+    '''
+
+    __slots__ = ()
+
+    # define __enter__ function
+
+    def __enter__(self) -> 'NullTimer':
+        '''
+        Do nothing when entering a with block.
+        '''
+
+        return self
+
+
+    # define __exit__ function
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        '''
+        Do nothing when leaving a with block.
+        '''
+
+        pass
+
+
+    # define __call__ function
+
+    def __call__(self,
+        timed_function
+    ):
+        '''
+        Return the function unchanged.
+
+        Args:
+            timed_function, callable: The function to be decorated.
+
+        Returns:
+            Returns the same function.
+        '''
+
+        return timed_function
+
+
+# define NULL_TIMER const
+
+NULL_TIMER: NullTimer = NullTimer()    # The shared timer returned while timing is disabled.
+
+
+# define timed function
+
+def timed(
+    stopwatch_name: str,
+    stopwatch_manager: StopwatchManager = None
+):
+    '''
+    Time a function or a block into the named Stopwatch of a manager.
+
+    Use it as a decorator (@timed('name')) or as a context manager 
+        (with timed('name'):). While timing is disabled, the shared 
+        NULL_TIMER is returned and decorated functions are left unchanged.
+
+    Args:
+        stopwatch_name, str: The unique name of the Stopwatch to record into, 
+            it is created on first use if the manager does not have it.
+        stopwatch_manager, StopwatchManager: The manager that holds the Stopwatch. 
+            If this parameter is not supplied or the value is None, 
+            stopwatch.default_manager is used.
+
+    Returns:
+        Returns a Timer, or NULL_TIMER if timing is disabled.
+
+    Raises:
+        ValueError: The data type or value of the parameter is invalid.
+    '''
+
+    if not timing_enabled:
+        return NULL_TIMER
+
+    if not stopwatch_name or not isinstance(stopwatch_name, str):
+        raise ValueError('<stopwatch_name> value invalid')
+
+    if not stopwatch_manager:
+        stopwatch_manager = stopwatch.default_manager
+    elif not isinstance(stopwatch_manager, StopwatchManager):
+        raise ValueError('<stopwatch_manager> value invalid')
+
+    return Timer(stopwatch_name, stopwatch_manager)
@@ -25,9 +25,46 @@ The current module definition package Stopwatch's Stopwatch class implementation
 '''
 
 import time
+import array
 
 from stopwatch.errors import StatusError
 from stopwatch.errors import LapNameError
+from stopwatch.errors import FormatError
+
+from stopwatch.laps import LapStorage
+from stopwatch.laps import CompactLapStorage
+from stopwatch.laps import ReservoirLapStorage
+from stopwatch.laps import to_lap_array
+
+from stopwatch.statistics import LapStatistics
+from stopwatch.statistics import get_percentile
+
+from stopwatch.sketch import LapSketch
+
+from stopwatch.window import RollingWindow
+from stopwatch.window import NANOSECONDS_PER_SECOND
+
+from stopwatch.histogram import LapHistogram
+
+from stopwatch.journal import LapJournal
+
+from stopwatch.persist import PersistKind
+from stopwatch.persist import PersistFlag
+from stopwatch.persist import PERSIST_STOPWATCH
+from stopwatch.persist import PERSIST_SKETCH
+from stopwatch.persist import PERSIST_HISTOGRAM
+from stopwatch.persist import PERSIST_INDEX
+from stopwatch.persist import read_exact
+from stopwatch.persist import read_header
+from stopwatch.persist import read_name
+from stopwatch.persist import read_array
+from stopwatch.persist import write_header
+from stopwatch.persist import write_name
+from stopwatch.persist import write_array
+
+from stopwatch.sampling import FixedRateSampler
+from stopwatch.sampling import AdaptiveSampler
+from stopwatch.sampling import ReservoirSampler
 
 
 # define MAX_STOPWATCH_PRECISION const
@@ -58,12 +95,51 @@ class Stopwatch:
 
     By using Stopwatch, you can quickly and easily 
     count the running time of each process.
+
+    All internal counts are integer nanoseconds read from time.perf_counter_ns, 
+        they are only converted to seconds when they are returned, so repeated 
+        start and stop cycles accumulate without floating point drift.
+
+    Instances use __slots__, and the lap storage and lap statistics are only 
+        allocated by the first lap, so stopwatches that never record a lap 
+        stay small and cheap to construct.
     '''
 
+    __slots__ = (
+        '__stopwatch_precision',
+        '__stopwatch_compact_laps',
+        '__stopwatch_max_laps',
+        '__stopwatch_percentile_accuracy',
+        '__stopwatch_sampler',
+        '__stopwatch_sample_count',
+        '__stopwatch_sample_total',
+        '__stopwatch_window_seconds',
+        '__stopwatch_window',
+        '__stopwatch_journal',
+        '__stopwatch_histogram_bounds',
+        '__stopwatch_histogram',
+        '__stopwatch_generation',
+        '__stopwatch_observer',
+        '__stopwatch_laps',
+        '__stopwatch_statistics',
+        '__stopwatch_sketch',
+        '__stopwatch_start_count',
+        '__stopwatch_last_count',
+        '__stopwatch_total_count',
+        '__stopwatch_status',
+    )
+
     # define __init__ function
 
     def __init__(self,
-        default_precision: int = 3
+        default_precision: int = 3,
+        compact_laps: bool = False,
+        percentile_accuracy: float = None,
+        max_laps: int = None,
+        sampler = None,
+        window_seconds: int = None,
+        lap_journal: LapJournal = None,
+        histogram_buckets: list = None
     ):
         '''
         Constructs an instance of the Stopwatch class object.
@@ -72,6 +148,35 @@ class Stopwatch:
             default_precision, int: The default precision (number of decimal places) 
                 of the stopwatch, whose value should be less than or equal to the 
                 constant MAX_STOPWATCH_PRECISION.
+            compact_laps, bool: Whether to keep records in an array-backed storage 
+                (about 8 bytes per record) instead of a dictionary. This suits 
+                stopwatches that hold millions of mostly anonymous records.
+            percentile_accuracy, float: The relative accuracy (for example: 0.01) of 
+                the streaming percentile estimation. If this parameter is not supplied 
+                or the value is None, percentiles are computed exactly from the records.
+            max_laps, int: The maximum number of records that are kept. Older records 
+                are evicted from a fixed-size ring buffer (compact storage is implied), 
+                while the lap statistics still cover every record since the last reset. 
+                If this parameter is not supplied or the value is None, the number of 
+                records is not limited.
+            sampler, FixedRateSampler, AdaptiveSampler or ReservoirSampler: Decides which 
+                timing records are kept (see the stopwatch.sampling module). Skipped 
+                records cost a clock read and a sampling decision, and the kept 
+                records are weighted so that the total time, get_estimated_lap_count 
+                and get_average_of_laps stay unbiased. If this parameter is not 
+                supplied or the value is None, every record is kept.
+            window_seconds, int: The length (in seconds) of the rolling window of 
+                one-second buckets behind get_window_count, get_window_rate, 
+                get_window_average and get_window_percentile. If this parameter is 
+                not supplied or the value is None, no rolling window is kept.
+            lap_journal, LapJournal: A memory-mapped journal that every kept record 
+                is also appended to, so that the records survive a crash and can be 
+                read by another process while the Stopwatch runs. The journal is 
+                not cleared by reset, and it is owned (and closed) by the caller.
+            histogram_buckets, list: The upper bounds (in seconds, strictly increasing) 
+                of the lap histogram buckets kept for the OpenMetrics exposition (see 
+                get_histogram). If this parameter is not supplied or the value is None, 
+                no histogram is kept.
         
         Raises:
             ValueError: The data type or value of the parameter is invalid.
@@ -83,16 +188,108 @@ class Stopwatch:
         if default_precision > MAX_STOPWATCH_PRECISION:
             raise ValueError('<default_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
 
+        if not isinstance(compact_laps, bool):
+            raise ValueError('<compact_laps> value invalid')
+
+        if percentile_accuracy is not None and (not isinstance(percentile_accuracy, float) 
+            or percentile_accuracy <= 0 or percentile_accuracy >= 1):
+            raise ValueError('<percentile_accuracy> value invalid')
+
+        if max_laps is not None and (not isinstance(max_laps, int) or max_laps < 1):
+            raise ValueError('<max_laps> value invalid')
+
+        if sampler is not None and not isinstance(sampler, (FixedRateSampler, AdaptiveSampler, ReservoirSampler)):
+            raise ValueError('<sampler> value invalid')
+
+        if window_seconds is not None and (not isinstance(window_seconds, int) or window_seconds < 1):
+            raise ValueError('<window_seconds> value invalid')
+
+        if lap_journal is not None and not isinstance(lap_journal, LapJournal):
+            raise ValueError('<lap_journal> value invalid')
+
+        if histogram_buckets is not None:
+            if not histogram_buckets or not isinstance(histogram_buckets, (list, tuple)) or not all(
+                isinstance(histogram_bucket, (int, float)) and histogram_bucket > 0 for histogram_bucket in histogram_buckets):
+                raise ValueError('<histogram_buckets> value invalid')
+
+            histogram_buckets = [round(histogram_bucket * NANOSECONDS_PER_SECOND) for histogram_bucket in histogram_buckets]
+
+            if any(histogram_buckets[bucket_index] >= histogram_buckets[bucket_index + 1] 
+                for bucket_index in range(len(histogram_buckets) - 1)):
+                raise ValueError('<histogram_buckets> value invalid')
+
         self.__stopwatch_precision: int = default_precision
-        self.__stopwatch_laps: dict = dict()
+        self.__stopwatch_compact_laps: bool = compact_laps or bool(max_laps)
+        self.__stopwatch_max_laps: int = max_laps
+        self.__stopwatch_percentile_accuracy: float = percentile_accuracy
+        self.__stopwatch_sampler = sampler
+
+        self.__stopwatch_sample_count: float = 0.0
+        self.__stopwatch_sample_total: float = 0.0
+
+        self.__stopwatch_window_seconds: int = window_seconds
+        self.__stopwatch_window: RollingWindow = None
+
+        self.__stopwatch_journal: LapJournal = lap_journal
+
+        self.__stopwatch_histogram_bounds: list = histogram_buckets
+        self.__stopwatch_histogram: LapHistogram = None
 
-        self.__stopwatch_start_count: float = None
-        self.__stopwatch_last_count: float = None
-        self.__stopwatch_total_count: float = float()
+        self.__stopwatch_generation: int = 0
+        self.__stopwatch_observer: set = None
+
+        self.__stopwatch_laps: LapStorage = None
+        self.__stopwatch_statistics: LapStatistics = None
+        self.__stopwatch_sketch: LapSketch = None
+
+        self.__stopwatch_start_count: int = None
+        self.__stopwatch_last_count: int = None
+        self.__stopwatch_total_count: int = 0
 
         self.__stopwatch_status: int = StopwatchStatus.Stopped
 
 
+    # define __getstate__ function
+
+    def __getstate__(self) -> dict:
+        '''
+        Get the slot values of the Stopwatch for pickle, without the observer of 
+            the manager exposition cache, which is not carried over.
+
+        Returns:
+            Returns a dictionary of mangled slot names to values.
+        '''
+
+        stopwatch_state: dict = dict()
+
+        for stopwatch_class in type(self).__mro__:
+            for slot_name in stopwatch_class.__dict__.get('__slots__', ()):
+                if slot_name.startswith('__') and not slot_name.endswith('__'):
+                    slot_name = '_' + stopwatch_class.__name__.lstrip('_') + slot_name
+
+                if hasattr(self, slot_name):
+                    stopwatch_state[slot_name] = getattr(self, slot_name)
+
+        stopwatch_state['_Stopwatch__stopwatch_observer'] = None
+        return stopwatch_state
+
+
+    # define __setstate__ function
+
+    def __setstate__(self,
+        stopwatch_state: dict
+    ):
+        '''
+        Restore the slot values of the Stopwatch from pickle.
+
+        Args:
+            stopwatch_state, dict: The dictionary returned by __getstate__.
+        '''
+
+        for slot_name, slot_value in stopwatch_state.items():
+            setattr(self, slot_name, slot_value)
+
+
     # define get_status function
 
     def get_status(self) -> int:
@@ -107,12 +304,32 @@ class Stopwatch:
         return self.__stopwatch_status
 
 
+    # define get_precision function
+
+    def get_precision(self) -> int:
+        '''
+        Get the default precision (number of decimal places) of the Stopwatch.
+
+        Returns:
+            Returns the default precision.
+        '''
+
+        return self.__stopwatch_precision
+
+
     # define start function
 
-    def start(self):
+    def start(self,
+        start_count: int = None
+    ):
         '''
         Start running Stopwatch.
 
+        Args:
+            start_count, int: A time.perf_counter_ns reading to start from, which 
+                lets a batch of Stopwatch instances share one clock read. If this 
+                parameter is not supplied or the value is None, the clock is read.
+
         Raises:
             StatusError: Stopwatch has started.
         '''
@@ -120,16 +337,25 @@ class Stopwatch:
         if self.__stopwatch_status != StopwatchStatus.Stopped:
             raise StatusError('stopwatch has started')
 
-        self.__stopwatch_start_count = float(time.perf_counter())
+        self.__stopwatch_start_count = time.perf_counter_ns() if start_count is None else start_count
         self.__stopwatch_status = StopwatchStatus.Started
 
+        self.__change()
+
 
     # define stop function
 
-    def stop(self) -> float:
+    def stop(self,
+        stop_count: int = None
+    ) -> float:
         '''
         Stop running Stopwatch.
 
+        Args:
+            stop_count, int: A time.perf_counter_ns reading to stop at, which 
+                lets a batch of Stopwatch instances share one clock read. If this 
+                parameter is not supplied or the value is None, the clock is read.
+
         Returns:
             Returns the total time (in seconds) that Stopwatch will count 
                 from the first time to the stop time.
@@ -138,7 +364,31 @@ class Stopwatch:
             StatusError: Stopwatch has stopped or never started.
         '''
 
-        stopwatch_stop_count: float = float(time.perf_counter())
+        self.stop_ns(stop_count)
+        return self.get_watch(None)
+
+
+    # define stop_ns function
+
+    def stop_ns(self,
+        stop_count: int = None
+    ) -> int:
+        '''
+        Stop running Stopwatch without rounding the result.
+
+        Args:
+            stop_count, int: A time.perf_counter_ns reading to stop at. If this 
+                parameter is not supplied or the value is None, the clock is read.
+
+        Returns:
+            Returns the total time (in nanoseconds) that Stopwatch will count 
+                from the first time to the stop time.
+
+        Raises:
+            StatusError: Stopwatch has stopped or never started.
+        '''
+
+        stopwatch_stop_count: int = time.perf_counter_ns() if stop_count is None else stop_count
 
         if self.__stopwatch_status != StopwatchStatus.Started:
             raise StatusError('stopwatch has stopped')
@@ -146,7 +396,9 @@ class Stopwatch:
         self.__stopwatch_total_count += (stopwatch_stop_count - self.__stopwatch_start_count)
         self.__stopwatch_status = StopwatchStatus.Stopped
 
-        return self.get_watch(None)
+        self.__change()
+
+        return self.__stopwatch_total_count
 
 
     # define lap function
@@ -173,26 +425,176 @@ class Stopwatch:
             LapNameError: The same record name already exists.
         '''
 
-        stopwatch_lap_count: float = float(time.perf_counter())
+        stopwatch_lap_count: int = time.perf_counter_ns()
 
         if lap_name:
             if not isinstance(lap_name, str):
                 raise ValueError('<lap_name> value invalid')
             
-            if lap_name in self.__stopwatch_laps:
+            if self.__stopwatch_laps and self.__stopwatch_laps.has(lap_name):
                 raise LapNameError('lap name already exists: ' + lap_name)
 
         if self.__stopwatch_status != StopwatchStatus.Started:
             raise StatusError('stopwatch did not start')
 
-        if not self.__stopwatch_last_count:
+        if self.__stopwatch_last_count is None:
             self.__stopwatch_last_count = self.__stopwatch_start_count
-        
-        self.__stopwatch_laps[lap_name if lap_name else 'lap_' + str(len(
-            self.__stopwatch_laps) + 1)] = stopwatch_lap_count - self.__stopwatch_last_count
-        
+
+        if self.__stopwatch_sampler is None:
+            self.__append_lap(lap_name, stopwatch_lap_count - self.__stopwatch_last_count, 
+                lap_time = stopwatch_lap_count)
+        else:
+            lap_weight: float = self.__stopwatch_sampler.sample()
+
+            if lap_weight:
+                self.__append_lap(lap_name, stopwatch_lap_count - self.__stopwatch_last_count, 
+                    lap_weight, stopwatch_lap_count)
+
         self.__stopwatch_last_count = stopwatch_lap_count
-        return stopwatch_lap_count
+        return stopwatch_lap_count / NANOSECONDS_PER_SECOND
+
+
+    # define record function
+
+    def record(self,
+        lap_count: int,
+        lap_name: str = None,
+        lap_weight: float = None
+    ):
+        '''
+        Record an interval that was measured outside of the Stopwatch.
+
+        The interval is added to the total time and kept as a timing record, 
+            the Stopwatch does not need to be started.
+
+        Args:
+            lap_count, int: The interval (in nanoseconds).
+            lap_name, str: Record name.
+            lap_weight, float: The weight returned by sample, if the caller sampled 
+                before measuring the interval. If not provided or not, the sampler 
+                decides whether the record is kept. It is ignored if the Stopwatch 
+                has no sampler.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+            LapNameError: The same record name already exists.
+        '''
+
+        if not isinstance(lap_count, int) or lap_count < 0:
+            raise ValueError('<lap_count> value invalid')
+
+        if lap_name:
+            if not isinstance(lap_name, str):
+                raise ValueError('<lap_name> value invalid')
+            
+            if self.__stopwatch_laps and self.__stopwatch_laps.has(lap_name):
+                raise LapNameError('lap name already exists: ' + lap_name)
+
+        if self.__stopwatch_sampler is None:
+            self.__stopwatch_total_count += lap_count
+            self.__append_lap(lap_name, lap_count)
+            return
+
+        if lap_weight is None:
+            lap_weight = self.__stopwatch_sampler.sample()
+
+        if lap_weight:
+            self.__stopwatch_total_count += round(lap_count * lap_weight)
+            self.__append_lap(lap_name, lap_count, lap_weight)
+
+
+    # define sample function
+
+    def sample(self) -> float:
+        '''
+        Ask the sampler of the Stopwatch whether to keep the next record.
+
+        A caller that measures the interval itself (for example timed) can 
+            skip reading the clock when the record will not be kept, and pass 
+            the weight to record.
+
+        Returns:
+            Returns 0 if the record should be skipped, otherwise its weight.
+        '''
+
+        if self.__stopwatch_sampler is None:
+            return 1.0
+
+        return self.__stopwatch_sampler.sample()
+
+
+    # define __append_lap function
+
+    def __append_lap(self,
+        lap_name: str,
+        lap_count: int,
+        lap_weight: float = None,
+        lap_time: int = None
+    ):
+        '''
+        Keep a record and add it to the lap statistics, the percentile sketch, 
+            the rolling window, the lap histogram and the lap journal.
+
+        Args:
+            lap_name, str: Record name. If the value is None, the record is anonymous.
+            lap_count, int: Record duration (in nanoseconds).
+            lap_weight, float: The sampling weight of the record, if sampling is enabled.
+            lap_time, int: The clock reading when the record ended, if it is known.
+        '''
+
+        if lap_weight is not None:
+            self.__stopwatch_sample_count += lap_weight
+            self.__stopwatch_sample_total += lap_weight * lap_count
+
+        if self.__stopwatch_laps is None:
+            self.__create_laps()
+
+        self.__stopwatch_laps.append(lap_name, lap_count)
+        self.__stopwatch_statistics.update(lap_count)
+
+        if self.__stopwatch_sketch:
+            self.__stopwatch_sketch.update(lap_count)
+
+        if self.__stopwatch_window:
+            self.__stopwatch_window.update(lap_count, lap_time, 1 if lap_weight is None else lap_weight)
+
+        if self.__stopwatch_histogram:
+            self.__stopwatch_histogram.update(lap_count, lap_weight)
+
+        if self.__stopwatch_journal:
+            self.__stopwatch_journal.append(lap_count, lap_time, lap_name)
+
+        self.__stopwatch_generation += 1
+
+        if self.__stopwatch_observer is not None:
+            self.__stopwatch_observer.add(self)
+
+
+    # define __create_laps function
+
+    def __create_laps(self):
+        '''
+        Allocate the lap storage, the lap statistics, the percentile sketch, 
+            the rolling window and the lap histogram.
+        '''
+
+        if isinstance(self.__stopwatch_sampler, ReservoirSampler):
+            self.__stopwatch_laps = ReservoirLapStorage(self.__stopwatch_sampler.get_reservoir_size())
+        elif self.__stopwatch_compact_laps:
+            self.__stopwatch_laps = CompactLapStorage(self.__stopwatch_max_laps)
+        else:
+            self.__stopwatch_laps = LapStorage()
+        self.__stopwatch_statistics = LapStatistics()
+
+        if self.__stopwatch_percentile_accuracy:
+            self.__stopwatch_sketch = LapSketch(self.__stopwatch_percentile_accuracy)
+
+        if self.__stopwatch_window_seconds:
+            self.__stopwatch_window = RollingWindow(self.__stopwatch_window_seconds, 
+                NANOSECONDS_PER_SECOND, self.__stopwatch_percentile_accuracy or 0.01)
+
+        if self.__stopwatch_histogram_bounds:
+            self.__stopwatch_histogram = LapHistogram(self.__stopwatch_histogram_bounds)
 
 
     # define reset function
@@ -210,10 +612,81 @@ class Stopwatch:
         if self.__stopwatch_status != StopwatchStatus.Stopped:
             raise StatusError('stopwatch has started')
         
-        self.__stopwatch_laps.clear()
+        if self.__stopwatch_laps:
+            self.__stopwatch_laps.clear()
+            self.__stopwatch_statistics.clear()
+
+        if self.__stopwatch_sketch:
+            self.__stopwatch_sketch.clear()
+
+        if self.__stopwatch_window:
+            self.__stopwatch_window.clear()
+
+        if self.__stopwatch_histogram:
+            self.__stopwatch_histogram.clear()
+
         self.__stopwatch_start_count = None
         self.__stopwatch_last_count = None
-        self.__stopwatch_total_count = float()
+        self.__stopwatch_total_count = 0
+
+        self.__stopwatch_sample_count = 0.0
+        self.__stopwatch_sample_total = 0.0
+
+        self.__change()
+
+
+    # define __change function
+
+    def __change(self):
+        '''
+        Advance the generation of the Stopwatch and notify its observer.
+        '''
+
+        self.__stopwatch_generation += 1
+
+        if self.__stopwatch_observer is not None:
+            self.__stopwatch_observer.add(self)
+
+
+    # define get_generation function
+
+    def get_generation(self) -> int:
+        '''
+        Get the generation of the Stopwatch, which advances whenever it starts, 
+            stops, keeps a record or is reset.
+
+        Two equal generations of the same instance mean that nothing but the 
+            elapsed time of a running Stopwatch has changed in between.
+
+        Returns:
+            Returns the generation.
+        '''
+
+        return self.__stopwatch_generation
+
+
+    # define _observe function
+
+    def _observe(self,
+        stopwatch_observer: set
+    ) -> bool:
+        '''
+        Register a set that the Stopwatch adds itself to whenever its generation 
+            advances, which lets a manager find the changed instances without 
+            visiting all of them. An instance has at most one observer.
+
+        Args:
+            stopwatch_observer, set: The observer set.
+
+        Returns:
+            Returns True if the set observes the Stopwatch, or False if another 
+                set already does.
+        '''
+
+        if self.__stopwatch_observer is None:
+            self.__stopwatch_observer = stopwatch_observer
+
+        return self.__stopwatch_observer is stopwatch_observer
 
 
     # define has_lap function
@@ -238,7 +711,7 @@ class Stopwatch:
         if not lap_name or not isinstance(lap_name, str):
             raise ValueError('<lap_name> value invalid')
         
-        return lap_name in self.__stopwatch_laps
+        return bool(self.__stopwatch_laps) and self.__stopwatch_laps.has(lap_name)
 
 
     # define get_lap function
@@ -276,8 +749,11 @@ class Stopwatch:
         elif lap_precision > MAX_STOPWATCH_PRECISION:
             raise ValueError('<lap_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
 
+        if not self.__stopwatch_laps:
+            raise LapNameError('no such lap: ' + lap_name)
+
         try:
-            return round(self.__stopwatch_laps[lap_name], lap_precision)
+            return round(self.__stopwatch_laps.get(lap_name) / NANOSECONDS_PER_SECOND, lap_precision)
         except KeyError:
             raise LapNameError('no such lap: ' + lap_name)
 
@@ -306,7 +782,20 @@ class Stopwatch:
             LapNameError: There is no such record.
         '''
 
-        return self.get_lap('lap_' + str(lap_number), lap_precision)
+        if not lap_precision:
+            lap_precision = self.__stopwatch_precision
+        elif not isinstance(lap_precision, int):
+            raise ValueError('<lap_precision> value invalid')
+        elif lap_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<lap_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        if not self.__stopwatch_laps:
+            raise LapNameError('no such lap: ' + str(lap_number))
+
+        try:
+            return round(self.__stopwatch_laps.get_by_number(lap_number) / NANOSECONDS_PER_SECOND, lap_precision)
+        except KeyError:
+            raise LapNameError('no such lap: ' + str(lap_number))
 
 
     # define get_average_of_laps function
@@ -317,6 +806,9 @@ class Stopwatch:
         '''
         Get the average (in seconds) of all timing records.
 
+        The average is maintained as records are added, so the call 
+            takes constant time regardless of the number of records.
+
         Args:
             average_precision, int: average precision (number of decimal places).
                 If not provided or not, the default precision value of the 
@@ -338,76 +830,819 @@ class Stopwatch:
         if average_precision > MAX_STOPWATCH_PRECISION:
             raise ValueError('<average_precision> value should be less than: ' + str(MAX_STOPWATCH_PRECISION))
 
-        if len(self.__stopwatch_laps) == 0:
+        if not self.__stopwatch_statistics or self.__stopwatch_statistics.get_count() == 0:
             return 0
 
-        total_of_laps: float = 0
+        if self.__stopwatch_sampler is not None:
+            return round(self.__stopwatch_sample_total / self.__stopwatch_sample_count / 
+                NANOSECONDS_PER_SECOND, average_precision)
 
-        for lap_name in self.__stopwatch_laps:
-            total_of_laps += self.__stopwatch_laps[lap_name]
-        
-        return round(total_of_laps / len(self.__stopwatch_laps), average_precision)
+        return round(self.__stopwatch_statistics.get_mean() / NANOSECONDS_PER_SECOND, average_precision)
 
 
-    # define get_laps function
+    # define get_min_of_laps function
 
-    def get_laps(self) -> list:
+    def get_min_of_laps(self,
+        min_precision: int = None
+    ) -> float:
         '''
-        Get all timing record names.
+        Get the minimum (in seconds) of all timing records.
 
+        Args:
+            min_precision, int: min precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+        
         Returns:
-            Returns a list of all the timed record names.
+            Returns the minimum (in seconds) of all timing records.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
         '''
 
-        return list(self.__stopwatch_laps.keys())
+        if not min_precision:
+            min_precision = self.__stopwatch_precision
+        if not isinstance(min_precision, int):
+            raise ValueError('<min_precision> value invalid')
+        if min_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<min_precision> value should be less than: ' + str(MAX_STOPWATCH_PRECISION))
+
+        if not self.__stopwatch_statistics or self.__stopwatch_statistics.get_count() == 0:
+            return 0
 
+        return round(self.__stopwatch_statistics.get_min() / NANOSECONDS_PER_SECOND, min_precision)
 
-    # define get_lap_count function
 
-    def get_lap_count(self) -> int:
+    # define get_max_of_laps function
+
+    def get_max_of_laps(self,
+        max_precision: int = None
+    ) -> float:
         '''
-        Get the number of timed records.
+        Get the maximum (in seconds) of all timing records.
 
+        Args:
+            max_precision, int: max precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+        
         Returns:
-            The number of timed records.
+            Returns the maximum (in seconds) of all timing records.
+        
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
         '''
 
-        return len(self.__stopwatch_laps)
+        if not max_precision:
+            max_precision = self.__stopwatch_precision
+        if not isinstance(max_precision, int):
+            raise ValueError('<max_precision> value invalid')
+        if max_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<max_precision> value should be less than: ' + str(MAX_STOPWATCH_PRECISION))
+
+        if not self.__stopwatch_statistics or self.__stopwatch_statistics.get_count() == 0:
+            return 0
 
+        return round(self.__stopwatch_statistics.get_max() / NANOSECONDS_PER_SECOND, max_precision)
 
-    # define get_watch function
 
-    def get_watch(self,
-        watch_precision: int = None
+    # define get_stddev_of_laps function
+
+    def get_stddev_of_laps(self,
+        stddev_precision: int = None
     ) -> float:
         '''
-        Gets the statistical time (in seconds) that Stopwatch is from start to finish.
+        Get the population standard deviation (in seconds) of all timing records.
 
         Args:
-            watch_precision, int: Watch precision (number of decimal places).
+            stddev_precision, int: stddev precision (number of decimal places).
                 If not provided or not, the default precision value of the 
                 stopwatch will be used.  whose value should be less than or 
                 equal to the constant MAX_STOPWATCH_PRECISION.
         
         Returns:
-            Returns the statistical time (in seconds) that Stopwatch is from start to finish.
+            Returns the population standard deviation (in seconds) of all timing records.
         
         Raises:
-            StatusError: Stopwatch has not stopped.
             ValueError: The data type or value of the parameter is invalid.
         '''
 
-        if not watch_precision:
-            watch_precision = self.__stopwatch_precision
-        elif not isinstance(watch_precision, int):
-            raise ValueError('<watch_precision> value invalid')
-        elif watch_precision > MAX_STOPWATCH_PRECISION:
-            raise ValueError('<watch_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
-        
-        if self.__stopwatch_status == StopwatchStatus.Started:
-            return round(self.__stopwatch_total_count + 
-                ((float(time.perf_counter()) - self.__stopwatch_start_count)), watch_precision)
-        elif self.__stopwatch_status == StopwatchStatus.Stopped:
-            return round(self.__stopwatch_total_count, watch_precision)
-        else:
-            raise StatusError('stopwatch status is invalid')
+        if not stddev_precision:
+            stddev_precision = self.__stopwatch_precision
+        if not isinstance(stddev_precision, int):
+            raise ValueError('<stddev_precision> value invalid')
+        if stddev_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<stddev_precision> value should be less than: ' + str(MAX_STOPWATCH_PRECISION))
+
+        if not self.__stopwatch_statistics or self.__stopwatch_statistics.get_count() == 0:
+            return 0
+
+        return round(self.__stopwatch_statistics.get_stddev() / NANOSECONDS_PER_SECOND, stddev_precision)
+
+
+    # define get_percentile_of_laps function
+
+    def get_percentile_of_laps(self,
+        percentile: float,
+        percentile_precision: int = None
+    ) -> float:
+        '''
+        Get a percentile (in seconds) of all timing records, for example: 
+            get_percentile_of_laps(99) returns the p99 duration.
+
+        If the stopwatch was constructed with percentile_accuracy, the value is 
+            estimated from a bounded-memory sketch within that relative accuracy, 
+            otherwise it is computed exactly by sorting all records.
+
+        Args:
+            percentile, float: The percentile, whose value should be between 0 and 100.
+            percentile_precision, int: percentile precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+
+        Returns:
+            Returns the percentile (in seconds) of all timing records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(percentile, (int, float)) or percentile < 0 or percentile > 100:
+            raise ValueError('<percentile> value invalid')
+
+        if not percentile_precision:
+            percentile_precision = self.__stopwatch_precision
+        if not isinstance(percentile_precision, int):
+            raise ValueError('<percentile_precision> value invalid')
+        if percentile_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<percentile_precision> value should be less than: ' + str(MAX_STOPWATCH_PRECISION))
+
+        if not self.__stopwatch_statistics or self.__stopwatch_statistics.get_count() == 0:
+            return 0
+
+        if self.__stopwatch_sketch:
+            return round(self.__stopwatch_sketch.get_percentile(percentile) / 
+                NANOSECONDS_PER_SECOND, percentile_precision)
+
+        return round(get_percentile(self.__stopwatch_laps.get_counts(), percentile) / 
+            NANOSECONDS_PER_SECOND, percentile_precision)
+
+
+    # define __get_window_ns function
+
+    def __get_window_ns(self,
+        window_seconds: int
+    ) -> int:
+        '''
+        Validate a window length parameter.
+
+        Args:
+            window_seconds, int: The window length (in seconds), or None for the whole window.
+
+        Returns:
+            Returns the window length (in nanoseconds).
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if window_seconds is None:
+            return self.__stopwatch_window_seconds * NANOSECONDS_PER_SECOND
+
+        if not isinstance(window_seconds, int) or window_seconds < 1 or window_seconds > self.__stopwatch_window_seconds:
+            raise ValueError('<window_seconds> value invalid')
+
+        return window_seconds * NANOSECONDS_PER_SECOND
+
+
+    # define get_window_count function
+
+    def get_window_count(self,
+        window_seconds: int = None
+    ) -> int:
+        '''
+        Get the number of timing records in the last seconds.
+
+        Args:
+            window_seconds, int: The window length (in seconds), which should not exceed 
+                the window_seconds given to the constructor. If not provided or None, 
+                the whole rolling window is used.
+
+        Returns:
+            Returns the number of records (estimated if sampling is enabled), 
+                or 0 if the stopwatch was constructed without window_seconds.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not self.__stopwatch_window:
+            return 0
+
+        return round(self.__stopwatch_window.get_count(self.__get_window_ns(window_seconds)))
+
+
+    # define get_window_rate function
+
+    def get_window_rate(self,
+        window_seconds: int = None,
+        rate_precision: int = None
+    ) -> float:
+        '''
+        Get the number of timing records per second in the last seconds.
+
+        Args:
+            window_seconds, int: The window length (in seconds), which should not exceed 
+                the window_seconds given to the constructor. If not provided or None, 
+                the whole rolling window is used.
+            rate_precision, int: Rate precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.
+
+        Returns:
+            Returns the rate (records per second), or 0 if the stopwatch was 
+                constructed without window_seconds.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        rate_precision = self.__get_precision(rate_precision, 'rate_precision')
+
+        if not self.__stopwatch_window:
+            return 0
+
+        return round(self.__stopwatch_window.get_rate(self.__get_window_ns(window_seconds)), rate_precision)
+
+
+    # define get_window_average function
+
+    def get_window_average(self,
+        window_seconds: int = None,
+        average_precision: int = None
+    ) -> float:
+        '''
+        Get the average (in seconds) of the timing records in the last seconds.
+
+        Args:
+            window_seconds, int: The window length (in seconds), which should not exceed 
+                the window_seconds given to the constructor. If not provided or None, 
+                the whole rolling window is used.
+            average_precision, int: average precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.
+
+        Returns:
+            Returns the average (in seconds), or 0 if there are no records or the 
+                stopwatch was constructed without window_seconds.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        average_precision = self.__get_precision(average_precision, 'average_precision')
+
+        if not self.__stopwatch_window:
+            return 0
+
+        return round(self.__stopwatch_window.get_mean(self.__get_window_ns(window_seconds)) / 
+            NANOSECONDS_PER_SECOND, average_precision)
+
+
+    # define get_window_percentile function
+
+    def get_window_percentile(self,
+        percentile: float,
+        window_seconds: int = None,
+        percentile_precision: int = None
+    ) -> float:
+        '''
+        Estimate a percentile (in seconds) of the timing records in the last seconds.
+
+        Args:
+            percentile, float: The percentile, whose value should be between 0 and 100.
+            window_seconds, int: The window length (in seconds), which should not exceed 
+                the window_seconds given to the constructor. If not provided or None, 
+                the whole rolling window is used.
+            percentile_precision, int: percentile precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.
+
+        Returns:
+            Returns the percentile (in seconds), or 0 if there are no records or 
+                the stopwatch was constructed without window_seconds.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(percentile, (int, float)) or percentile < 0 or percentile > 100:
+            raise ValueError('<percentile> value invalid')
+
+        percentile_precision = self.__get_precision(percentile_precision, 'percentile_precision')
+
+        if not self.__stopwatch_window:
+            return 0
+
+        return round(self.__stopwatch_window.get_percentile(percentile, 
+            self.__get_window_ns(window_seconds)) / NANOSECONDS_PER_SECOND, percentile_precision)
+
+
+    # define __get_precision function
+
+    def __get_precision(self,
+        precision: int,
+        precision_name: str
+    ) -> int:
+        '''
+        Validate a precision parameter, falling back to the default precision.
+
+        Args:
+            precision, int: The precision (number of decimal places) or None.
+            precision_name, str: The parameter name used in error messages.
+
+        Returns:
+            Returns the precision to be used.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not precision:
+            return self.__stopwatch_precision
+        if not isinstance(precision, int):
+            raise ValueError('<' + precision_name + '> value invalid')
+        if precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<' + precision_name + '> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+
+        return precision
+
+
+    # define get_laps function
+
+    def get_laps(self) -> list:
+        '''
+        Get all timing record names.
+
+        Returns:
+            Returns a list of all the timed record names.
+        '''
+
+        if not self.__stopwatch_laps:
+            return list()
+
+        return self.__stopwatch_laps.get_names()
+
+
+    # define get_lap_counts function
+
+    def get_lap_counts(self) -> list:
+        '''
+        Get all timing record durations (in nanoseconds), in the same order as get_laps.
+
+        Returns:
+            Returns a list of all the timed record durations (in nanoseconds).
+        '''
+
+        if not self.__stopwatch_laps:
+            return list()
+
+        return self.__stopwatch_laps.get_counts()
+
+
+    # define laps_as_array function
+
+    def laps_as_array(self):
+        '''
+        Get all timing record durations (in nanoseconds) as an array, 
+            in the same order as get_laps.
+
+        With compact_laps or max_laps the array shares memory with the 
+            stopwatch instead of being copied (see CompactLapStorage.get_array), 
+            so it should be used before the stopwatch is reset.
+
+        Returns:
+            Returns an int64 NumPy array if NumPy is installed, 
+                otherwise a memoryview of format 'q'.
+        '''
+
+        if not self.__stopwatch_laps:
+            return to_lap_array(memoryview(array.array('q')))
+
+        return to_lap_array(self.__stopwatch_laps.get_array())
+
+
+    # define get_lap_statistics function
+
+    def get_lap_statistics(self) -> LapStatistics:
+        '''
+        Get a copy of the running statistics of all timing records.
+
+        The copy can be merged with the statistics of other Stopwatch instances.
+
+        Returns:
+            Returns a LapStatistics instance.
+        '''
+
+        lap_statistics: LapStatistics = LapStatistics()
+
+        if self.__stopwatch_statistics:
+            lap_statistics.merge(self.__stopwatch_statistics)
+
+        return lap_statistics
+
+
+    # define get_histogram function
+
+    def get_histogram(self) -> LapHistogram:
+        '''
+        Get a copy of the lap histogram.
+
+        Returns:
+            Returns a LapHistogram instance, or None if the stopwatch was 
+                constructed without histogram_buckets.
+        '''
+
+        if not self.__stopwatch_histogram_bounds:
+            return None
+
+        lap_histogram: LapHistogram = LapHistogram(self.__stopwatch_histogram_bounds)
+
+        if self.__stopwatch_histogram:
+            lap_histogram.merge(self.__stopwatch_histogram)
+
+        return lap_histogram
+
+
+    # define get_lap_sketch function
+
+    def get_lap_sketch(self) -> LapSketch:
+        '''
+        Get a copy of the percentile sketch of all timing records.
+
+        Returns:
+            Returns a LapSketch instance, or None if the stopwatch was 
+                constructed without percentile_accuracy.
+        '''
+
+        if not self.__stopwatch_percentile_accuracy:
+            return None
+
+        lap_sketch: LapSketch = LapSketch(self.__stopwatch_percentile_accuracy)
+
+        if self.__stopwatch_sketch:
+            lap_sketch.merge(self.__stopwatch_sketch)
+
+        return lap_sketch
+
+
+    # define get_lap_count function
+
+    def get_lap_count(self) -> int:
+        '''
+        Get the number of timed records.
+
+        If the stopwatch was constructed with max_laps, only the 
+            records that are still kept are counted.
+
+        Returns:
+            The number of timed records.
+        '''
+
+        if not self.__stopwatch_laps:
+            return 0
+
+        return self.__stopwatch_laps.get_count()
+
+
+    # define get_estimated_lap_count function
+
+    def get_estimated_lap_count(self) -> int:
+        '''
+        Get the estimated number of timing records, including the records 
+            skipped by the sampler.
+
+        Without a sampler, this is the number of records since the last 
+            reset, including those evicted by max_laps.
+
+        Returns:
+            Returns the estimated number of records.
+        '''
+
+        if self.__stopwatch_sampler is not None:
+            return round(self.__stopwatch_sample_count)
+
+        if not self.__stopwatch_statistics:
+            return 0
+
+        return self.__stopwatch_statistics.get_count()
+
+
+    # define get_watch function
+
+    def get_watch(self,
+        watch_precision: int = None
+    ) -> float:
+        '''
+        Gets the statistical time (in seconds) that Stopwatch is from start to finish.
+
+        Args:
+            watch_precision, int: Watch precision (number of decimal places).
+                If not provided or not, the default precision value of the 
+                stopwatch will be used.  whose value should be less than or 
+                equal to the constant MAX_STOPWATCH_PRECISION.
+        
+        Returns:
+            Returns the statistical time (in seconds) that Stopwatch is from start to finish.
+        
+        Raises:
+            StatusError: Stopwatch has not stopped.
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not watch_precision:
+            watch_precision = self.__stopwatch_precision
+        elif not isinstance(watch_precision, int):
+            raise ValueError('<watch_precision> value invalid')
+        elif watch_precision > MAX_STOPWATCH_PRECISION:
+            raise ValueError('<watch_precision> value should be less than ' + str(MAX_STOPWATCH_PRECISION))
+        
+        return round(self.get_watch_ns() / NANOSECONDS_PER_SECOND, watch_precision)
+
+
+    # define get_watch_ns function
+
+    def get_watch_ns(self,
+        watch_count: int = None
+    ) -> int:
+        '''
+        Gets the statistical time (in nanoseconds) that Stopwatch is from start to finish.
+
+        Unlike get_watch, the value is not rounded and is exact, which makes it suitable 
+            for summing the totals of many Stopwatch instances.
+
+        Args:
+            watch_count, int: A time.perf_counter_ns reading at which the time of a 
+                running Stopwatch is measured, which lets a batch of Stopwatch instances 
+                share one clock read. If this parameter is not supplied or the value 
+                is None, the clock is read.
+
+        Returns:
+            Returns the statistical time (in nanoseconds) with a data type of int.
+
+        Raises:
+            StatusError: Stopwatch status is invalid.
+        '''
+
+        if self.__stopwatch_status == StopwatchStatus.Started:
+            if watch_count is None:
+                watch_count = time.perf_counter_ns()
+
+            return self.__stopwatch_total_count + max(watch_count - self.__stopwatch_start_count, 0)
+        elif self.__stopwatch_status == StopwatchStatus.Stopped:
+            return self.__stopwatch_total_count
+        else:
+            raise StatusError('stopwatch status is invalid')
+
+
+    # define _snapshot function
+
+    def _snapshot(self,
+        snapshot_count: int
+    ) -> tuple:
+        '''
+        Capture the state of the Stopwatch for a StopwatchSnapshot.
+
+        Args:
+            snapshot_count, int: The time.perf_counter_ns reading of the snapshot.
+
+        Returns:
+            Returns a record tuple, whose fields are indicated using the 
+                SnapshotField enumerator.
+        '''
+
+        lap_statistics: LapStatistics = self.get_lap_statistics()
+
+        return (
+            self.get_status(),
+            self.get_watch_ns(snapshot_count),
+            self.get_estimated_lap_count(),
+            lap_statistics.get_total(),
+            lap_statistics.get_min(),
+            lap_statistics.get_max(),
+            lap_statistics.get_mean(),
+        )
+
+
+    # define _get_lap_names function
+
+    def _get_lap_names(self) -> dict:
+        '''
+        Get the timing records whose name is not the anonymous name of their position.
+
+        Returns:
+            Returns a dictionary of position (in laps_as_array order) to record name.
+        '''
+
+        if not self.__stopwatch_laps:
+            return dict()
+
+        return self.__stopwatch_laps.get_named()
+
+
+    # define dump function
+
+    def dump(self,
+        dump_file
+    ):
+        '''
+        Save the Stopwatch to a binary file (see the stopwatch.persist module).
+
+        The options, the total time, the kept timing records, the lap statistics, 
+            the percentile sketch and the lap histogram are saved. A started Stopwatch is saved with 
+            its total time so far and loads as stopped, the sampler and the 
+            contents of the rolling window are not saved.
+
+        Args:
+            dump_file, file: A binary file object open for writing.
+        '''
+
+        write_header(dump_file, PersistKind.Stopwatch)
+        self._dump_record(dump_file)
+
+
+    # define _dump_record function
+
+    def _dump_record(self,
+        dump_file
+    ):
+        '''
+        Write the stopwatch record, without the file header.
+
+        Args:
+            dump_file, file: A binary file object open for writing.
+        '''
+
+        lap_counts = self.laps_as_array()
+        lap_names: dict = self._get_lap_names()
+        lap_first: int = 0
+
+        if isinstance(self.__stopwatch_laps, CompactLapStorage):
+            lap_first = self.__stopwatch_laps.get_first_index()
+        lap_sketch: LapSketch = self.get_lap_sketch()
+        lap_histogram: LapHistogram = self.get_histogram()
+
+        persist_flags: int = 0
+
+        if self.__stopwatch_compact_laps:
+            persist_flags |= PersistFlag.CompactLaps
+
+        if lap_sketch:
+            persist_flags |= PersistFlag.Sketch
+
+        if lap_histogram:
+            persist_flags |= PersistFlag.Histogram
+
+        dump_file.write(PERSIST_STOPWATCH.pack(
+            self.__stopwatch_precision,
+            persist_flags,
+            0,
+            self.__stopwatch_max_laps or 0,
+            self.__stopwatch_window_seconds or 0,
+            self.__stopwatch_percentile_accuracy or 0.0,
+            self.get_watch_ns(),
+            *self.get_lap_statistics().get_state(),
+            lap_first,
+            len(lap_counts),
+            len(lap_names)
+        ))
+
+        if lap_sketch:
+            sketch_zero_count, sketch_count, sketch_buckets = lap_sketch.get_state()
+
+            dump_file.write(PERSIST_SKETCH.pack(sketch_zero_count, sketch_count, len(sketch_buckets)))
+            write_array(dump_file, array.array('q', sketch_buckets.keys()))
+            write_array(dump_file, array.array('q', sketch_buckets.values()))
+
+        if lap_histogram:
+            histogram_bounds, histogram_counts, histogram_count, histogram_total = lap_histogram.get_state()
+
+            dump_file.write(PERSIST_HISTOGRAM.pack(len(histogram_bounds), histogram_count, histogram_total))
+            write_array(dump_file, array.array('q', histogram_bounds))
+            write_array(dump_file, array.array('d', histogram_counts), 'd')
+
+        write_array(dump_file, lap_counts)
+
+        for lap_index in sorted(lap_names):
+            dump_file.write(PERSIST_INDEX.pack(lap_index))
+            write_name(dump_file, lap_names[lap_index])
+
+
+    # define load function
+
+    @staticmethod
+    def load(
+        load_file
+    ) -> 'Stopwatch':
+        '''
+        Load a Stopwatch saved by dump.
+
+        Args:
+            load_file, file: A binary file object open for reading.
+
+        Returns:
+            Returns a new, stopped Stopwatch instance.
+
+        Raises:
+            FormatError: The file is invalid or truncated.
+        '''
+
+        read_header(load_file, PersistKind.Stopwatch)
+        return Stopwatch._load_record(load_file)
+
+
+    # define _load_record function
+
+    @staticmethod
+    def _load_record(
+        load_file
+    ) -> 'Stopwatch':
+        '''
+        Read a stopwatch record, without the file header.
+
+        Args:
+            load_file, file: A binary file object open for reading.
+
+        Returns:
+            Returns a new, stopped Stopwatch instance.
+
+        Raises:
+            FormatError: The record is invalid or truncated.
+        '''
+
+        stopwatch_precision, persist_flags, persist_reserved, stopwatch_max_laps, stopwatch_window_seconds, \
+            stopwatch_percentile_accuracy, stopwatch_total_count, *lap_state, lap_first, lap_count, named_count = \
+            PERSIST_STOPWATCH.unpack(read_exact(load_file, PERSIST_STOPWATCH.size))
+
+        try:
+            new_stopwatch: Stopwatch = Stopwatch(
+                default_precision = stopwatch_precision,
+                compact_laps = bool(persist_flags & PersistFlag.CompactLaps),
+                percentile_accuracy = stopwatch_percentile_accuracy or None,
+                max_laps = stopwatch_max_laps or None,
+                window_seconds = stopwatch_window_seconds or None
+            )
+        except ValueError:
+            raise FormatError('invalid stopwatch options')
+
+        sketch_state: tuple = None
+        histogram_state: tuple = None
+
+        if persist_flags & PersistFlag.Sketch:
+            sketch_zero_count, sketch_count, bucket_count = PERSIST_SKETCH.unpack(
+                read_exact(load_file, PERSIST_SKETCH.size))
+            bucket_indexes: array.array = read_array(load_file, bucket_count)
+
+            sketch_state = (sketch_zero_count, sketch_count, 
+                dict(zip(bucket_indexes.tolist(), read_array(load_file, bucket_count).tolist())))
+
+        if persist_flags & PersistFlag.Histogram:
+            bound_count, histogram_count, histogram_total = PERSIST_HISTOGRAM.unpack(
+                read_exact(load_file, PERSIST_HISTOGRAM.size))
+
+            histogram_state = (read_array(load_file, bound_count).tolist(), 
+                read_array(load_file, bound_count + 1, 'd').tolist(), histogram_count, histogram_total)
+
+            if not histogram_state[0] or any(histogram_state[0][bound_index] >= histogram_state[0][bound_index + 1] 
+                for bound_index in range(bound_count - 1)) or histogram_state[0][0] <= 0:
+                raise FormatError('invalid stopwatch options')
+
+            new_stopwatch.__stopwatch_histogram_bounds = histogram_state[0]
+
+        lap_counts: array.array = read_array(load_file, lap_count)
+        lap_names: dict = dict()
+
+        for named_index in range(named_count):
+            lap_index: int = PERSIST_INDEX.unpack(read_exact(load_file, PERSIST_INDEX.size))[0]
+            lap_names[lap_index] = read_name(load_file)
+
+        new_stopwatch.__stopwatch_total_count = stopwatch_total_count
+
+        if lap_count or lap_state[0]:
+            new_stopwatch.__create_laps()
+            if isinstance(new_stopwatch.__stopwatch_laps, CompactLapStorage):
+                new_stopwatch.__stopwatch_laps.load(lap_counts, lap_names, lap_first)
+            else:
+                new_stopwatch.__stopwatch_laps.load(lap_counts, lap_names)
+            new_stopwatch.__stopwatch_statistics.set_state(tuple(lap_state))
+
+            if sketch_state and new_stopwatch.__stopwatch_sketch:
+                new_stopwatch.__stopwatch_sketch.set_state(sketch_state)
+
+            if histogram_state:
+                new_stopwatch.__stopwatch_histogram.set_state(histogram_state)
+
+        return new_stopwatch
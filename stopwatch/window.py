@@ -0,0 +1,381 @@
+# stopwatch.window.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+The current module implements the rolling time window used by the Stopwatch 
+    class to report statistics over the last seconds rather than since reset.
+'''
+
+import time
+
+from stopwatch.sketch import LapSketch
+
+
+# define NANOSECONDS_PER_SECOND const
+
+NANOSECONDS_PER_SECOND: int = 1000000000    # Number of nanoseconds per second.
+
+
+# define WINDOW_BUCKET_WIDTH const
+
+WINDOW_BUCKET_WIDTH: int = 1000000000    # Default width (in nanoseconds) of a bucket.
+
+
+# define RollingWindow class
+
+class RollingWindow:
+    '''
+    A ring of fixed-width time buckets holding the count, sum, min, max and a 
+        percentile sketch of the records that fell into each bucket.
+
+    A record updates only the bucket of its time, and a bucket that is reused 
+        for a later period is cleared first, so updates take constant time and 
+        memory is bounded by the number of buckets. A query over a trailing 
+        window covers the current (partial) bucket and the whole buckets 
+        before it.
+    '''
+
+    __slots__ = (
+        '__bucket_count',
+        '__bucket_width',
+        '__percentile_accuracy',
+        '__bucket_epochs',
+        '__bucket_counts',
+        '__bucket_totals',
+        '__bucket_mins',
+        '__bucket_maxs',
+        '__bucket_sketches',
+    )
+
+    # define __init__ function
+
+    def __init__(self,
+        bucket_count: int = 60,
+        bucket_width_ns: int = WINDOW_BUCKET_WIDTH,
+        percentile_accuracy: float = 0.01
+    ):
+        '''
+        Constructs an instance of the RollingWindow class object.
+
+        Args:
+            bucket_count, int: The number of buckets, the longest window that can 
+                be queried is bucket_count * bucket_width_ns.
+            bucket_width_ns, int: The width (in nanoseconds) of a bucket.
+            percentile_accuracy, float: The relative accuracy of the per-bucket 
+                percentile sketches.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(bucket_count, int) or bucket_count < 1:
+            raise ValueError('<bucket_count> value invalid')
+
+        if not isinstance(bucket_width_ns, int) or bucket_width_ns < 1:
+            raise ValueError('<bucket_width_ns> value invalid')
+
+        if not isinstance(percentile_accuracy, float) or percentile_accuracy <= 0 or percentile_accuracy >= 1:
+            raise ValueError('<percentile_accuracy> value invalid')
+
+        self.__bucket_count: int = bucket_count
+        self.__bucket_width: int = bucket_width_ns
+        self.__percentile_accuracy: float = percentile_accuracy
+
+        self.__bucket_epochs: list = [-1] * bucket_count
+        self.__bucket_counts: list = [0] * bucket_count
+        self.__bucket_totals: list = [0] * bucket_count
+        self.__bucket_mins: list = [0] * bucket_count
+        self.__bucket_maxs: list = [0] * bucket_count
+        self.__bucket_sketches: list = [None] * bucket_count
+
+
+    # define update function
+
+    def update(self,
+        lap_count: int,
+        lap_time: int = None,
+        lap_weight: float = 1
+    ):
+        '''
+        Add a record to the bucket of its time.
+
+        Args:
+            lap_count, int: Record duration (in nanoseconds).
+            lap_time, int: A time.perf_counter_ns() reading of when the record ended. 
+                If not provided or not, the clock is read.
+            lap_weight, float: The sampling weight of the record.
+        '''
+
+        bucket_epoch: int = (time.perf_counter_ns() if lap_time is None else lap_time) // self.__bucket_width
+        bucket_index: int = bucket_epoch % self.__bucket_count
+
+        if self.__bucket_epochs[bucket_index] != bucket_epoch:
+            self.__bucket_epochs[bucket_index] = bucket_epoch
+            self.__bucket_counts[bucket_index] = lap_weight
+            self.__bucket_totals[bucket_index] = lap_count * lap_weight
+            self.__bucket_mins[bucket_index] = lap_count
+            self.__bucket_maxs[bucket_index] = lap_count
+
+            if self.__bucket_sketches[bucket_index] is None:
+                self.__bucket_sketches[bucket_index] = LapSketch(self.__percentile_accuracy)
+            else:
+                self.__bucket_sketches[bucket_index].clear()
+        else:
+            self.__bucket_counts[bucket_index] += lap_weight
+            self.__bucket_totals[bucket_index] += lap_count * lap_weight
+
+            if lap_count < self.__bucket_mins[bucket_index]:
+                self.__bucket_mins[bucket_index] = lap_count
+            elif lap_count > self.__bucket_maxs[bucket_index]:
+                self.__bucket_maxs[bucket_index] = lap_count
+
+        self.__bucket_sketches[bucket_index].update(lap_count)
+
+
+    # define __select_buckets function
+
+    def __select_buckets(self,
+        window_ns: int,
+        window_time: int
+    ) -> list:
+        '''
+        Select the buckets of a trailing window.
+
+        Args:
+            window_ns, int: The window length (in nanoseconds), or None for all buckets.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window, 
+                or None to read the clock.
+
+        Returns:
+            Returns a list of bucket indexes.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if window_ns is None:
+            window_bucket_count: int = self.__bucket_count
+        elif not isinstance(window_ns, int) or window_ns < 1:
+            raise ValueError('<window_ns> value invalid')
+        else:
+            window_bucket_count: int = min(self.__bucket_count, -(-window_ns // self.__bucket_width))
+
+        window_epoch: int = (time.perf_counter_ns() if window_time is None else window_time) // self.__bucket_width
+
+        return [bucket_index for bucket_index in range(self.__bucket_count) 
+            if window_epoch - window_bucket_count < self.__bucket_epochs[bucket_index] <= window_epoch]
+
+
+    # define get_count function
+
+    def get_count(self,
+        window_ns: int = None,
+        window_time: int = None
+    ) -> float:
+        '''
+        Get the (weighted) number of records in a trailing window.
+
+        Args:
+            window_ns, int: The window length (in nanoseconds), rounded up to whole 
+                buckets. If not provided or None, the whole ring is used.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window. 
+                If not provided or None, the clock is read.
+
+        Returns:
+            Returns the number of records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        return sum(self.__bucket_counts[bucket_index] 
+            for bucket_index in self.__select_buckets(window_ns, window_time))
+
+
+    # define get_rate function
+
+    def get_rate(self,
+        window_ns: int = None,
+        window_time: int = None
+    ) -> float:
+        '''
+        Get the number of records per second in a trailing window.
+
+        The rate divides by the time the window actually covers: the whole 
+            buckets before the current bucket plus the elapsed part of it.
+
+        Args:
+            window_ns, int: The window length (in nanoseconds), rounded up to whole 
+                buckets. If not provided or None, the whole ring is used.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window. 
+                If not provided or None, the clock is read.
+
+        Returns:
+            Returns the number of records per second.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if window_time is None:
+            window_time = time.perf_counter_ns()
+
+        window_count: float = self.get_count(window_ns, window_time)
+
+        window_bucket_count: int = self.__bucket_count if window_ns is None else \
+            min(self.__bucket_count, -(-window_ns // self.__bucket_width))
+        window_length: int = (window_bucket_count - 1) * self.__bucket_width + \
+            window_time % self.__bucket_width + 1
+
+        return window_count * NANOSECONDS_PER_SECOND / window_length
+
+
+    # define get_mean function
+
+    def get_mean(self,
+        window_ns: int = None,
+        window_time: int = None
+    ) -> float:
+        '''
+        Get the mean record duration (in nanoseconds) in a trailing window.
+
+        Args:
+            window_ns, int: The window length (in nanoseconds), rounded up to whole 
+                buckets. If not provided or None, the whole ring is used.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window. 
+                If not provided or None, the clock is read.
+
+        Returns:
+            Returns the mean duration (in nanoseconds), or 0 if there are no records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        bucket_indexes: list = self.__select_buckets(window_ns, window_time)
+        window_count: float = sum(self.__bucket_counts[bucket_index] for bucket_index in bucket_indexes)
+
+        if not window_count:
+            return 0.0
+
+        return sum(self.__bucket_totals[bucket_index] for bucket_index in bucket_indexes) / window_count
+
+
+    # define get_min function
+
+    def get_min(self,
+        window_ns: int = None,
+        window_time: int = None
+    ) -> int:
+        '''
+        Get the shortest record duration (in nanoseconds) in a trailing window.
+
+        Args:
+            window_ns, int: The window length (in nanoseconds), rounded up to whole 
+                buckets. If not provided or None, the whole ring is used.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window. 
+                If not provided or None, the clock is read.
+
+        Returns:
+            Returns the shortest duration (in nanoseconds), or 0 if there are no records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        return min((self.__bucket_mins[bucket_index] 
+            for bucket_index in self.__select_buckets(window_ns, window_time)), default = 0)
+
+
+    # define get_max function
+
+    def get_max(self,
+        window_ns: int = None,
+        window_time: int = None
+    ) -> int:
+        '''
+        Get the longest record duration (in nanoseconds) in a trailing window.
+
+        Args:
+            window_ns, int: The window length (in nanoseconds), rounded up to whole 
+                buckets. If not provided or None, the whole ring is used.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window. 
+                If not provided or None, the clock is read.
+
+        Returns:
+            Returns the longest duration (in nanoseconds), or 0 if there are no records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        return max((self.__bucket_maxs[bucket_index] 
+            for bucket_index in self.__select_buckets(window_ns, window_time)), default = 0)
+
+
+    # define get_percentile function
+
+    def get_percentile(self,
+        percentile: float,
+        window_ns: int = None,
+        window_time: int = None
+    ) -> float:
+        '''
+        Estimate a percentile of the record durations (in nanoseconds) in a trailing window.
+
+        The sketches of the selected buckets are merged, so the estimate is 
+            within the relative accuracy given to the constructor.
+
+        Args:
+            percentile, float: The percentile, whose value should be between 0 and 100.
+            window_ns, int: The window length (in nanoseconds), rounded up to whole 
+                buckets. If not provided or None, the whole ring is used.
+            window_time, int: A time.perf_counter_ns() reading of the end of the window. 
+                If not provided or None, the clock is read.
+
+        Returns:
+            Returns the estimated duration (in nanoseconds), or 0 if there are no records.
+
+        Raises:
+            ValueError: The data type or value of the parameter is invalid.
+        '''
+
+        if not isinstance(percentile, (int, float)) or percentile < 0 or percentile > 100:
+            raise ValueError('<percentile> value invalid')
+
+        window_sketch: LapSketch = LapSketch(self.__percentile_accuracy)
+
+        for bucket_index in self.__select_buckets(window_ns, window_time):
+            window_sketch.merge(self.__bucket_sketches[bucket_index])
+
+        return window_sketch.get_percentile(percentile)
+
+
+    # define clear function
+
+    def clear(self):
+        '''
+        Remove all records, keeping the allocated sketches.
+        '''
+
+        for bucket_index in range(self.__bucket_count):
+            self.__bucket_epochs[bucket_index] = -1
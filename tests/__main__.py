@@ -26,14 +26,42 @@ The main module of tests tests implements functional unit tests
 '''
 
 import watch
+import fast
+import local
 import manager
+import threadsafe
+import shared
+import timing
+import columnar
+import spans
+import sampling
+import window
+import persist
+import journal
+import export
+import exposition
+import snapshot
 
 
 # define main function
 
 def main():
     watch.tests()
+    fast.tests()
+    local.tests()
     manager.tests()
+    threadsafe.tests()
+    shared.tests()
+    timing.tests()
+    columnar.tests()
+    spans.tests()
+    sampling.tests()
+    window.tests()
+    persist.tests()
+    journal.tests()
+    export.tests()
+    exposition.tests()
+    snapshot.tests()
 
 
 # define virtual main function
@@ -0,0 +1,150 @@
+# tests.columnar.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block columnar.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import time
+import types
+
+from errors import TestError
+
+from stopwatch import ColumnarStopwatchManager
+from stopwatch import StopwatchStatus
+from stopwatch import StatusError
+from stopwatch import StopwatchNameError
+from stopwatch import columnar
+from stopwatch.columnar import numpy
+
+
+# define run_tests function
+
+def run_tests(
+    use_numpy: bool
+):
+    test_manager: ColumnarStopwatchManager = ColumnarStopwatchManager(use_numpy = use_numpy)
+
+    for count in range(100):
+        test_manager.create('tests::watch' + str(count))
+
+    if test_manager.get_count() != 100 or test_manager.get_slot_count() != 100:
+        raise TestError('create() error')
+
+    if test_manager.starts() != 100 or test_manager.starts() != 0:
+        raise TestError('starts() return value is unexpected')
+
+    test_view = test_manager.get('tests::watch7')
+
+    if test_view.get_status() != StopwatchStatus.Started:
+        raise TestError('get_status() return value is unexpected')
+
+    try:
+        test_view.start()
+        raise TestError('start() error')
+    except StatusError:
+        pass
+
+    if test_view.lap() <= 0 or test_view.lap() <= 0 or test_view.get_lap_count() != 2:
+        raise TestError('lap() error')
+
+    if test_manager.stops(['tests::watch7', 'tests::watch8']) != 2:
+        raise TestError('stops() return value is unexpected')
+
+    if test_manager.stops() != 98:
+        raise TestError('stops() return value is unexpected')
+
+    test_total: int = sum(test_manager.get(stopwatch_name).get_watch_ns() 
+        for stopwatch_name in test_manager.get_names())
+
+    if test_manager.get_watchs_ns() != test_total or test_total <= 0:
+        raise TestError('get_watchs_ns() return value is unexpected')
+
+    if test_manager.get_watchs_ns(['tests::watch7']) != test_view.get_watch_ns():
+        raise TestError('get_watchs_ns() return value is unexpected')
+
+    if test_manager.get_watchs() != round(test_total / 1000000000, 3):
+        raise TestError('get_watchs() return value is unexpected')
+
+    test_manager.remove('tests::watch3')
+
+    try:
+        test_manager.get('tests::watch3')
+        raise TestError('remove() error')
+    except StopwatchNameError:
+        pass
+
+    test_manager.create_and_start('tests::reused')
+
+    if test_manager.get_slot('tests::reused') != 3 or test_manager.get_slot_count() != 100:
+        raise TestError('create() did not reuse the freed slot')
+
+    for count in range(100, 200):
+        test_manager.create('tests::watch' + str(count))
+
+    if test_manager.get('tests::reused').get_status() != StopwatchStatus.Started:
+        raise TestError('columns lost state when growing')
+
+    test_manager.resets()
+
+    if test_manager.get_watchs_ns() != 0 or test_view.get_lap_count() != 0:
+        raise TestError('resets() error')
+
+    test_manager.clear()
+
+    if test_manager.get_count() != 0:
+        raise TestError('clear() error')
+
+
+# define run_clock_tests function
+
+def run_clock_tests(
+    use_numpy: bool
+):
+    test_manager: ColumnarStopwatchManager = ColumnarStopwatchManager(use_numpy = use_numpy)
+    test_clock: list = [30 * 86400 * 1000000000]
+
+    # Replace the clock of the module with one that reads 30 days of uptime.
+    columnar.time = types.SimpleNamespace(perf_counter_ns = lambda: test_clock[0])
+
+    try:
+        for count in range(5000):
+            test_manager.create_and_start('tests::watch' + str(count))
+
+        test_clock[0] += 1000000000
+
+        if test_manager.get_watchs_ns() != 5000 * 1000000000 or test_manager.get_watchs() != 5000.0:
+            raise TestError('get_watchs_ns() overflowed with large start counts')
+    finally:
+        columnar.time = time
+
+
+# define tests function
+
+def tests():
+    run_tests(False)
+    run_clock_tests(False)
+
+    if numpy is not None:
+        run_tests(True)
+        run_clock_tests(True)
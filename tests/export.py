@@ -0,0 +1,257 @@
+# tests.export.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block export.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import os
+import json
+import time
+import socket
+import asyncio
+import tempfile
+import threading
+
+from errors import TestError
+
+from stopwatch import StopwatchManager
+from stopwatch import StopwatchExporter
+from stopwatch import AsyncStopwatchExporter
+from stopwatch import ExportSink
+from stopwatch import FileSink
+from stopwatch import StatsdSink
+from stopwatch import PrometheusSink
+from stopwatch import StatusError
+
+from stopwatch.export import ExportField
+from stopwatch.export import collect_batch
+from stopwatch.export import render_prometheus
+
+
+# define MemorySink class
+
+class MemorySink(ExportSink):
+    '''
+    An export sink that keeps the batches, optionally waiting for an event first.
+    '''
+
+    def __init__(self, sink_event: threading.Event = None):
+        self.sink_batches: list = list()
+        self.sink_event: threading.Event = sink_event
+        self.sink_closed: bool = False
+
+    def write(self, export_batch):
+        if self.sink_event:
+            self.sink_event.wait()
+
+        self.sink_batches.append(export_batch)
+
+    def close(self):
+        self.sink_closed = True
+
+
+# define FailingSink class
+
+class FailingSink(ExportSink):
+    '''
+    An export sink that always fails.
+    '''
+
+    def write(self, export_batch):
+        raise OSError('sink failed')
+
+
+# define FailingManager class
+
+class FailingManager(StopwatchManager):
+    '''
+    A manager whose first selections fail.
+    '''
+
+    def __init__(self, failure_count: int):
+        super().__init__()
+        self.failure_count: int = failure_count
+
+    def _select(self, stopwatch_names = None):
+        if self.failure_count > 0:
+            self.failure_count -= 1
+            raise RuntimeError('select failed')
+
+        return super()._select(stopwatch_names)
+
+
+# define tests function
+
+def tests():
+    test_manager: StopwatchManager = StopwatchManager()
+    test_manager.create('a "b"')
+    test_manager.get('a "b"').record(2000000)
+    test_manager.get('a "b"').record(4000000)
+    test_manager.create('c')
+
+    test_batch = collect_batch(test_manager)
+    test_record: tuple = test_batch.get_records()[0]
+
+    if len(test_batch.get_records()) != 2 or test_record[ExportField.Watch] != 6000000 or (
+        test_record[ExportField.LapCount] != 2 or test_record[ExportField.LapMax] != 4000000):
+        raise TestError('collect_batch() return value is unexpected')
+
+    if [test_record[ExportField.Name] for test_record in collect_batch(test_manager, ['c', 'd', 'a "b"']).get_records()] != ['c', 'a "b"']:
+        raise TestError('collect_batch() did not skip a missing stopwatch')
+
+    test_text: str = render_prometheus(test_batch)
+
+    if 'stopwatch_watch_seconds_total{stopwatch="a \\"b\\""} 0.006\n' not in test_text or (
+        'stopwatch_laps_total{stopwatch="c"} 0\n' not in test_text or '# TYPE stopwatch_laps_total counter\n' not in test_text) or (
+        'stopwatch_lap_seconds_total{stopwatch="c"} 0.0\n' not in test_text or '# TYPE stopwatch_lap_seconds_max gauge\n' not in test_text):
+        raise TestError('render_prometheus() return value is unexpected')
+
+    test_directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+
+    test_socket: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    test_socket.bind(('127.0.0.1', 0))
+    test_socket.settimeout(5)
+
+    test_memory: MemorySink = MemorySink()
+    test_exporter: StopwatchExporter = StopwatchExporter(test_manager, [
+        test_memory,
+        FailingSink(),
+        FileSink(os.path.join(test_directory.name, 'export.jsonl')),
+        StatsdSink('127.0.0.1', test_socket.getsockname()[1], max_packet_size = 64),
+        PrometheusSink(os.path.join(test_directory.name, 'export.prom')),
+    ], export_interval = 0.01)
+
+    test_exporter.start()
+
+    try:
+        test_exporter.start()
+        raise TestError('start() did not raise a StatusError')
+    except StatusError:
+        pass
+
+    time.sleep(0.1)
+    test_exporter.stop()
+
+    for test_method in (test_exporter.start, test_exporter.stop):
+        try:
+            test_method()
+            raise TestError('a stopped StopwatchExporter did not raise a StatusError')
+        except StatusError as error:
+            if str(error) != 'exporter has stopped':
+                raise TestError('a stopped StopwatchExporter raised an unexpected StatusError')
+
+    if test_exporter.get_export_count() < 2 or len(test_memory.sink_batches) != test_exporter.get_export_count():
+        raise TestError('StopwatchExporter did not export periodically')
+
+    if not test_memory.sink_closed or test_exporter.get_error_count() != test_exporter.get_export_count():
+        raise TestError('StopwatchExporter did not close or isolate the sinks')
+
+    with open(os.path.join(test_directory.name, 'export.jsonl'), encoding = 'utf-8') as test_file:
+        test_lines: list = test_file.readlines()
+
+    if len(test_lines) != test_exporter.get_export_count() or json.loads(test_lines[-1])['records'][0]['watch_ns'] != 6000000:
+        raise TestError('FileSink did not write the batches')
+
+    with open(os.path.join(test_directory.name, 'export.prom'), encoding = 'utf-8') as test_file:
+        if test_file.read() != render_prometheus(test_memory.sink_batches[-1]):
+            raise TestError('PrometheusSink did not write the last batch')
+
+    test_packet: bytes = test_socket.recv(65536)
+
+    if len(test_packet) > 64 or not test_packet.startswith(b'stopwatch.a_"b".watch:6.0|g'):
+        raise TestError('StatsdSink did not send the batch')
+
+    test_socket.close()
+
+    test_event: threading.Event = threading.Event()
+    test_memory = MemorySink(test_event)
+    test_exporter = StopwatchExporter(test_manager, [test_memory], export_interval = 60, queue_size = 2)
+    test_exporter.start()
+
+    test_results: list = [test_exporter.export() for count in range(10)]
+
+    if test_results.count(False) < 7 or test_exporter.get_drop_count() != test_results.count(False):
+        raise TestError('export() did not drop batches of a full queue')
+
+    test_event.set()
+    test_exporter.stop()
+
+    if len(test_memory.sink_batches) + test_exporter.get_drop_count() != test_exporter.get_export_count():
+        raise TestError('StopwatchExporter lost batches that were not dropped')
+
+    test_memory = MemorySink()
+    test_exporter = AsyncStopwatchExporter(test_manager, [test_memory, FailingSink()], export_interval = 0.01)
+
+    async def run_exporter():
+        test_exporter.start()
+        await asyncio.sleep(0.1)
+        await test_exporter.stop()
+
+    asyncio.run(run_exporter())
+
+    if test_exporter.get_export_count() < 2 or len(test_memory.sink_batches) != test_exporter.get_export_count():
+        raise TestError('AsyncStopwatchExporter did not export periodically')
+
+    if not test_memory.sink_closed or test_exporter.get_error_count() != test_exporter.get_export_count():
+        raise TestError('AsyncStopwatchExporter did not close or isolate the sinks')
+
+    try:
+        test_exporter.start()
+        raise TestError('a stopped AsyncStopwatchExporter did not raise a StatusError')
+    except StatusError:
+        pass
+
+    test_failing: FailingManager = FailingManager(2)
+    test_failing.create('c').record(1000)
+    test_memory = MemorySink()
+    test_exporter = StopwatchExporter(test_failing, [test_memory], export_interval = 0.01)
+    test_exporter.start()
+    time.sleep(0.1)
+    test_exporter.stop()
+
+    if test_exporter.get_error_count() != 2 or not test_memory.sink_batches or test_memory.sink_batches[-1].get_records()[0][ExportField.Watch] != 1000:
+        raise TestError('StopwatchExporter did not survive a failed collection')
+
+    test_failing = FailingManager(2)
+    test_memory = MemorySink()
+    test_exporter = AsyncStopwatchExporter(test_failing, [test_memory], export_interval = 0.01)
+
+    asyncio.run(run_exporter())
+
+    if test_exporter.get_error_count() != 2 or not test_memory.sink_batches:
+        raise TestError('AsyncStopwatchExporter did not survive a failed collection')
+
+    try:
+        ExportSink()
+        raise TestError('ExportSink is not abstract')
+    except TypeError:
+        pass
+
+    try:
+        StopwatchExporter(test_manager, [])
+        raise TestError('StopwatchExporter did not reject an empty sink list')
+    except ValueError:
+        pass
+
+    test_directory.cleanup()
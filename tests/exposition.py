@@ -0,0 +1,198 @@
+# tests.exposition.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the blocks histogram.py and 
+    exposition.py for stopwatch to ensure they work correctly.
+'''
+
+import time
+import pickle
+import threading
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import ThreadLocalStopwatch
+from stopwatch import StopwatchManager
+from stopwatch import ConcurrentStopwatchManager
+from stopwatch.histogram import LapHistogram
+
+
+# define tests function
+
+def tests():
+    test_histogram: LapHistogram = LapHistogram([10, 100])
+
+    for lap_count in (5, 10, 11, 100, 1000):
+        test_histogram.update(lap_count)
+
+    test_histogram.update(50, 2.0)
+
+    if test_histogram.get_counts() != [2, 6, 7] or test_histogram.get_count() != 7 or test_histogram.get_total() != 1226:
+        raise TestError('LapHistogram.update() did not count the records')
+
+    try:
+        test_histogram.merge(LapHistogram([10]))
+        raise TestError('LapHistogram.merge() did not reject different bounds')
+    except ValueError:
+        pass
+
+    test_histogram.clear()
+
+    if test_histogram.get_counts() != [0, 0, 0] or test_histogram.get_bounds() != [10, 100]:
+        raise TestError('LapHistogram.clear() did not clear the counts')
+
+    for histogram_buckets in ([], [0.1, 0.1], [0.2, 0.1], [-1], 'a'):
+        try:
+            Stopwatch(histogram_buckets = histogram_buckets)
+            raise TestError('Stopwatch did not reject <histogram_buckets>: ' + repr(histogram_buckets))
+        except ValueError:
+            pass
+
+    test_stopwatch: Stopwatch = Stopwatch(histogram_buckets = [0.001, 0.01])
+
+    if test_stopwatch.get_histogram().get_counts() != [0, 0, 0] or Stopwatch().get_histogram() is not None:
+        raise TestError('get_histogram() return value is unexpected')
+
+    test_generation: int = test_stopwatch.get_generation()
+    test_stopwatch.record(2000000)
+    test_stopwatch.start()
+    test_stopwatch.stop()
+
+    if test_stopwatch.get_generation() != test_generation + 3 or test_stopwatch.get_histogram().get_counts() != [0, 1, 1]:
+        raise TestError('Stopwatch did not advance the generation or histogram')
+
+    test_stopwatch.reset()
+
+    if test_stopwatch.get_generation() != test_generation + 4 or test_stopwatch.get_histogram().get_count() != 0:
+        raise TestError('reset() did not clear the histogram')
+
+    test_manager: StopwatchManager = StopwatchManager(stopwatch_histogram_buckets = [0.001, 0.01])
+    test_manager.create('a').record(2000000)
+    test_manager.add('b "c"', Stopwatch())
+
+    test_text: str = test_manager.render_openmetrics()
+
+    if test_text != (
+        '# TYPE stopwatch_seconds counter\n'
+        '# UNIT stopwatch_seconds seconds\n'
+        '# HELP stopwatch_seconds Total time measured by the stopwatch.\n'
+        'stopwatch_seconds_total{stopwatch="a"} 0.002\n'
+        'stopwatch_seconds_total{stopwatch="b \\"c\\""} 0.0\n'
+        '# TYPE stopwatch_lap_seconds histogram\n'
+        '# UNIT stopwatch_lap_seconds seconds\n'
+        '# HELP stopwatch_lap_seconds Durations of the timing records.\n'
+        'stopwatch_lap_seconds_bucket{stopwatch="a",le="0.001"} 0\n'
+        'stopwatch_lap_seconds_bucket{stopwatch="a",le="0.01"} 1\n'
+        'stopwatch_lap_seconds_bucket{stopwatch="a",le="+Inf"} 1\n'
+        'stopwatch_lap_seconds_count{stopwatch="a"} 1\n'
+        'stopwatch_lap_seconds_sum{stopwatch="a"} 0.002\n'
+        'stopwatch_lap_seconds_bucket{stopwatch="b \\"c\\"",le="+Inf"} 0\n'
+        'stopwatch_lap_seconds_count{stopwatch="b \\"c\\""} 0\n'
+        'stopwatch_lap_seconds_sum{stopwatch="b \\"c\\""} 0.0\n'
+        '# EOF\n'
+    ):
+        raise TestError('render_openmetrics() return value is unexpected')
+
+    if test_manager.render_openmetrics() is not test_text:
+        raise TestError('render_openmetrics() did not reuse the cached text')
+
+    test_manager.get('b "c"').record(1000000)
+    test_text = test_manager.render_openmetrics()
+
+    if 'stopwatch_lap_seconds_count{stopwatch="b \\"c\\""} 1\n' not in test_text:
+        raise TestError('render_openmetrics() did not render a changed stopwatch')
+
+    test_manager.get('a').start()
+    test_text = test_manager.render_openmetrics()
+    time.sleep(0.01)
+
+    if test_manager.render_openmetrics() == test_text:
+        raise TestError('render_openmetrics() did not render a running stopwatch again')
+
+    test_manager.get('a').stop()
+    test_manager.remove('b "c"')
+    test_manager.add('d', ThreadLocalStopwatch())
+    test_manager.get('d').record(3000000)
+
+    test_text = test_manager.render_openmetrics(['d'], 'app_timer')
+
+    if 'app_timer_lap_seconds_count{stopwatch="d"} 1\n' not in test_text or 'stopwatch="a"' in test_text:
+        raise TestError('render_openmetrics() did not render the selection')
+
+    test_manager.get('d').record(3000000)
+
+    if 'app_timer_lap_seconds_count{stopwatch="d"} 2\n' not in test_manager.render_openmetrics(['d'], 'app_timer'):
+        raise TestError('render_openmetrics() did not render an unobserved stopwatch again')
+
+    if 'b \\"c\\"' in test_manager.render_openmetrics():
+        raise TestError('render_openmetrics() rendered a removed stopwatch')
+
+    try:
+        test_manager.render_openmetrics(metric_prefix = '1 bad')
+        raise TestError('render_openmetrics() did not reject <metric_prefix>')
+    except ValueError:
+        pass
+
+    test_manager = StopwatchManager(stopwatch_histogram_buckets = [0.001])
+    test_manager.create('a').record(2000)
+    test_text = test_manager.render_openmetrics()
+
+    test_loaded: StopwatchManager = pickle.loads(pickle.dumps(test_manager))
+
+    if test_loaded.render_openmetrics() != test_text or test_loaded.get('a').get_histogram().get_counts() != [1, 1]:
+        raise TestError('pickle did not round-trip a rendered manager')
+
+    test_loaded.get('a').record(3000000)
+
+    if 'stopwatch_lap_seconds_count{stopwatch="a"} 2\n' not in test_loaded.render_openmetrics():
+        raise TestError('render_openmetrics() did not observe an unpickled stopwatch')
+
+    test_loaded.create('c')
+
+    if 'stopwatch="c"' not in test_loaded.render_openmetrics():
+        raise TestError('render_openmetrics() did not observe an unpickled manager')
+
+    test_manager = ConcurrentStopwatchManager(stopwatch_histogram_buckets = [0.001])
+    test_manager.create('a')
+    test_text = test_manager.render_openmetrics()
+    test_manager.create('b')
+
+    if 'stopwatch="b"' not in test_manager.render_openmetrics() or 'stopwatch="b"' in test_text:
+        raise TestError('ConcurrentStopwatchManager did not invalidate the selection')
+
+    def run_creator(thread_index: int):
+        for count in range(50):
+            test_manager.create('t' + str(thread_index) + '_' + str(count))
+            test_manager.render_openmetrics()
+
+    test_threads: list = [threading.Thread(target = run_creator, args = (thread_index,)) for thread_index in range(8)]
+
+    for test_thread in test_threads:
+        test_thread.start()
+
+    for test_thread in test_threads:
+        test_thread.join()
+
+    if test_manager.render_openmetrics().count('_count{') != 402:
+        raise TestError('ConcurrentStopwatchManager lost a revision')
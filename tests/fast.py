@@ -0,0 +1,87 @@
+# tests.fast.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block fast.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import time
+
+from errors import TestError
+
+from stopwatch import FastStopwatch
+from stopwatch import StopwatchStatus
+from stopwatch import LapNameError
+
+
+# define tests function
+
+def tests():
+    test_stopwatch: FastStopwatch = FastStopwatch(
+        default_precision = 3
+    )
+
+    if test_stopwatch.get_status() != StopwatchStatus.Stopped:
+        raise TestError('get_status() return value is unexpected')
+
+    test_stopwatch.start()
+
+    if test_stopwatch.get_status() != StopwatchStatus.Started:
+        raise TestError('get_status() return value is unexpected')
+
+    test_stopwatch.lap()
+    time.sleep(0.1)
+    test_stopwatch.lap()
+    test_stopwatch.stop()
+
+    if test_stopwatch.get_lap_count() != 2:
+        raise TestError('get_lap_count() return value is unexpected')
+
+    if test_stopwatch.get_lap_by_number(2) < 0.09 or test_stopwatch.get_lap_by_number(2) > 0.5:
+        raise TestError('get_lap_by_number() return value is error')
+
+    if test_stopwatch.get_lap_ns(1) + test_stopwatch.get_lap_ns(2) > test_stopwatch.get_watch_ns():
+        raise TestError('get_lap_ns() return value is error')
+
+    if not isinstance(test_stopwatch.get_average_of_laps(), float):
+        raise TestError('get_average_of_laps() return value is unexpected')
+
+    if not isinstance(test_stopwatch.get_watch(), float):
+        raise TestError('get_watch() return value is unexpected')
+
+    try:
+        test_stopwatch.get_lap_ns(3)
+        raise TestError('get_lap_ns() error')
+    except LapNameError:
+        pass
+
+    try:
+        test_stopwatch.unexpected_attribute = None
+        raise TestError('__slots__ error')
+    except AttributeError:
+        pass
+
+    test_stopwatch.reset()
+
+    if test_stopwatch.get_watch_ns() != 0 or test_stopwatch.get_lap_count() != 0:
+        raise TestError('reset() error')
@@ -0,0 +1,146 @@
+# tests.journal.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block journal.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import os
+import tempfile
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import FormatError
+from stopwatch import LapJournal
+from stopwatch import LapJournalReader
+
+
+# define tests function
+
+def tests():
+    test_directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+    test_path: str = os.path.join(test_directory.name, 'laps.journal')
+
+    test_journal: LapJournal = LapJournal(test_path, chunk_count = 4)
+
+    test_reader: LapJournalReader = LapJournalReader(test_path)
+
+    if test_reader.get_count() != 0 or len(test_reader.get_records()) != 0 or len(test_reader.get_durations()) != 0:
+        raise TestError('LapJournalReader did not read an empty journal')
+
+    test_reader.close()
+
+    for count in range(10):
+        test_journal.append(count + 1, 1000 * count, 'a' if count % 2 else None)
+
+    if test_journal.get_count() != 10:
+        raise TestError('append() did not grow the journal')
+
+    test_reader = LapJournalReader(test_path)
+
+    if test_reader.get_count() != 10 or test_reader.get_names() != ['a']:
+        raise TestError('LapJournalReader did not read a running journal')
+
+    test_records = test_reader.get_records()
+
+    if [int(test_records[count, 1]) for count in range(10)] != list(range(1, 11)):
+        raise TestError('get_records() return value is unexpected')
+
+    if int(test_records[0, 2]) != -1 or int(test_records[1, 2]) != 0:
+        raise TestError('get_records() name ids are unexpected')
+
+    if int(test_records[1, 0]) - int(test_records[0, 0]) != 1000:
+        raise TestError('get_records() times are unexpected')
+
+    test_journal.append(11, lap_name = 'b')
+
+    if test_reader.get_count() != 10 or test_reader.refresh() != 11 or test_reader.get_names() != ['a', 'b']:
+        raise TestError('refresh() did not follow the writer')
+
+    if [int(count) for count in test_reader.get_durations()] != list(range(1, 12)):
+        raise TestError('get_durations() return value is unexpected')
+
+    test_journal.close()
+
+    test_journal = LapJournal(test_path)
+    test_journal.append(12, lap_name = 'a')
+    test_journal.append(13, lap_name = 'c')
+    test_journal.close()
+
+    test_reader.refresh()
+
+    if test_reader.get_count() != 13 or test_reader.get_names() != ['a', 'b', 'c']:
+        raise TestError('LapJournal did not resume an existing journal')
+
+    if int(test_reader.get_records()[11, 2]) != 0:
+        raise TestError('LapJournal did not reuse an existing name id')
+
+    del test_records
+    test_reader.close()
+
+    test_journal = LapJournal(os.path.join(test_directory.name, 'watch.journal'))
+
+    test_stopwatch: Stopwatch = Stopwatch(
+        lap_journal = test_journal
+    )
+
+    test_stopwatch.start()
+    test_stopwatch.lap('first')
+    test_stopwatch.lap()
+    test_stopwatch.stop()
+    test_stopwatch.record(5000, 'second')
+
+    test_reader = LapJournalReader(test_journal.get_path())
+
+    if test_reader.get_count() != 3 or test_reader.get_names() != ['first', 'second']:
+        raise TestError('Stopwatch did not write to the lap journal')
+
+    if int(test_reader.get_durations()[2]) != 5000 or round(int(test_reader.get_durations()[0]) / 1e9, 3) != test_stopwatch.get_lap('first'):
+        raise TestError('Stopwatch journal records are unexpected')
+
+    test_reader.close()
+    test_journal.close()
+
+    with open(test_path, 'wb') as test_file:
+        test_file.write(b'not a journal')
+
+    try:
+        LapJournalReader(test_path)
+        raise TestError('LapJournalReader did not reject an invalid file')
+    except FormatError:
+        pass
+
+    try:
+        LapJournal(test_path)
+        raise TestError('LapJournal did not reject an invalid file')
+    except FormatError:
+        pass
+
+    try:
+        Stopwatch(lap_journal = test_path)
+        raise TestError('Stopwatch did not reject an invalid journal')
+    except ValueError:
+        pass
+
+    test_directory.cleanup()
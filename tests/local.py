@@ -0,0 +1,233 @@
+# tests.local.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block local.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import io
+import asyncio
+import threading
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import StopwatchManager
+from stopwatch import StatusError
+from stopwatch import StopwatchStatus
+from stopwatch import ThreadLocalStopwatch
+from stopwatch import TaskLocalStopwatch
+
+
+# define run_worker function
+
+def run_worker(
+    test_stopwatch: ThreadLocalStopwatch
+):
+    test_stopwatch.start()
+
+    for count in range(100):
+        test_stopwatch.lap()
+
+    test_stopwatch.lap('tests::test1')
+    test_stopwatch.stop()
+
+
+# define run_task function
+
+async def run_task(
+    test_stopwatch: TaskLocalStopwatch
+):
+    test_stopwatch.start()
+
+    for count in range(10):
+        test_stopwatch.lap()
+        await asyncio.sleep(0)
+
+    if test_stopwatch.get_lap_by_number(10) > test_stopwatch.get_watch():
+        raise TestError('get_lap_by_number() return value is error')
+
+    test_stopwatch.stop()
+
+
+# define run_tasks function
+
+async def run_tasks(
+    test_stopwatch: TaskLocalStopwatch
+):
+    @test_stopwatch.measure
+    async def run_measured_task():
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*[run_task(test_stopwatch) for count in range(8)])
+    await asyncio.gather(*[run_measured_task() for count in range(8)])
+
+    if test_stopwatch.get_status() != StopwatchStatus.Stopped:
+        raise TestError('get_status() return value is unexpected')
+
+
+# define run_nested function
+
+async def run_nested(
+    test_stopwatch: TaskLocalStopwatch
+):
+    @test_stopwatch.measure
+    async def run_inner_task():
+        await asyncio.sleep(0)
+
+    @test_stopwatch.measure
+    async def run_outer_task():
+        await run_inner_task()
+
+        async with test_stopwatch:
+            await run_inner_task()
+
+    await run_outer_task()
+
+    test_counts: list = test_stopwatch.get_lap_counts()
+
+    if len(test_counts) != 4 or not test_counts[3] >= test_counts[2] >= test_counts[1]:
+        raise TestError('measure() did not record nested coroutines')
+
+
+# define tests function
+
+def tests():
+    test_stopwatch: ThreadLocalStopwatch = ThreadLocalStopwatch(
+        percentile_accuracy = 0.01
+    )
+
+    test_manager: StopwatchManager = StopwatchManager()
+    test_manager.add('tests::test1', test_stopwatch)
+
+    test_threads: list = [threading.Thread(target = run_worker, 
+        args = (test_stopwatch,)) for worker_index in range(4)]
+
+    for test_thread in test_threads:
+        test_thread.start()
+
+    for test_thread in test_threads:
+        test_thread.join()
+
+    if test_stopwatch.get_status() != StopwatchStatus.Stopped:
+        raise TestError('get_status() return value is unexpected')
+
+    if test_stopwatch.get_lap_count() != 404 or test_stopwatch.get_laps().count('tests::test1') != 4:
+        raise TestError('get_lap_count() lost the records of exited threads')
+
+    if test_stopwatch.has_lap('tests::test1'):
+        raise TestError('has_lap() return value is error')
+
+    if test_stopwatch.get_lap_statistics().get_count() != 404:
+        raise TestError('get_lap_statistics() return value is unexpected')
+
+    if sum(test_stopwatch.get_lap_counts()) != test_stopwatch.get_lap_statistics().get_total() or \
+        test_stopwatch.get_lap_statistics().get_total() > test_stopwatch.get_watch_ns():
+        raise TestError('get_lap_counts() return value is error')
+
+    if test_stopwatch.get_percentile_of_laps(100, 8) > test_stopwatch.get_max_of_laps(8) * 1.02:
+        raise TestError('get_percentile_of_laps() return value is error')
+
+    if test_manager.get_watchs(watch_precision = 8) != test_stopwatch.get_watch(8):
+        raise TestError('get_watchs() return value is error')
+
+    test_generation: int = test_stopwatch.get_generation()
+    run_worker(test_stopwatch)
+
+    if test_stopwatch.get_lap('tests::test1') > test_stopwatch.get_watch():
+        raise TestError('get_lap() return value is error')
+
+    if test_stopwatch.get_lap_count() != 505 or test_stopwatch.get_lap_statistics().get_count() != 505:
+        raise TestError('get_lap_count() return value is unexpected')
+
+    if sum(test_stopwatch.get_lap_counts()) > test_stopwatch.get_watch_ns():
+        raise TestError('get_lap_counts() return value is error')
+
+    if test_stopwatch.get_generation() <= test_generation:
+        raise TestError('get_generation() did not advance')
+
+    test_stopwatch.reset()
+
+    if test_stopwatch.get_lap_count() != 0 or test_stopwatch.get_watch_ns() != 0 or (
+        test_stopwatch.get_lap_statistics().get_count() != 0):
+        raise TestError('reset() error')
+
+    test_stopwatch = ThreadLocalStopwatch(
+        max_laps = 3,
+        histogram_buckets = [1.0]
+    )
+
+    for count in range(2):
+        test_thread = threading.Thread(target = run_worker, args = (test_stopwatch,))
+        test_thread.start()
+        test_thread.join()
+
+    if test_stopwatch.get_laps() != ['lap_1', 'lap_2', 'tests::test1'] or len(test_stopwatch.laps_as_array()) != 3:
+        raise TestError('max_laps did not bound the records of exited threads')
+
+    if test_stopwatch.get_percentile_of_laps(50, 8) <= 0 or test_stopwatch.get_estimated_lap_count() != 202:
+        raise TestError('get_percentile_of_laps() lost the records of exited threads')
+
+    if test_stopwatch.get_histogram().get_count() != 202:
+        raise TestError('get_histogram() did not merge the per-thread histograms')
+
+    try:
+        test_stopwatch.get_window_count()
+        raise TestError('get_window_count() did not raise a StatusError')
+    except StatusError:
+        pass
+
+    test_file: io.BytesIO = io.BytesIO()
+    test_stopwatch.dump(test_file)
+    test_file.seek(0)
+
+    test_loaded: Stopwatch = Stopwatch.load(test_file)
+
+    if test_loaded.get_lap_counts() != test_stopwatch.get_lap_counts() or test_loaded.get_histogram().get_count() != 202:
+        raise TestError('dump() lost the records of exited threads')
+
+    test_stopwatch = TaskLocalStopwatch(
+        percentile_accuracy = 0.01
+    )
+
+    test_manager.add('tests::test2', test_stopwatch)
+    asyncio.run(run_tasks(test_stopwatch))
+
+    if test_stopwatch.get_lap_count() != 88:
+        raise TestError('get_lap_count() return value is unexpected')
+
+    if test_stopwatch.get_lap_statistics().get_count() != 88:
+        raise TestError('get_lap_statistics() return value is unexpected')
+
+    if test_stopwatch.get_watch_ns() <= 0 or test_stopwatch.get_average_of_laps(8) <= 0:
+        raise TestError('get_watch_ns() return value is error')
+
+    if test_stopwatch.get_percentile_of_laps(50, 8) > test_stopwatch.get_max_of_laps(8) * 1.02:
+        raise TestError('get_percentile_of_laps() return value is error')
+
+    test_stopwatch.reset()
+
+    if test_stopwatch.get_watch_ns() != 0:
+        raise TestError('reset() error')
+
+    asyncio.run(run_nested(TaskLocalStopwatch()))
@@ -68,9 +68,80 @@ def tests():
     if test_manager.get_count() != 100:
         raise TestError('get_count() return value is unexpected')
     
-    test_manager.starts()
+    if test_manager.starts() != 100:
+        raise TestError('starts() return value is unexpected')
+
     test_manager.get_watchs()
-    test_manager.stops()
+
+    if test_manager.stops() != 100:
+        raise TestError('stops() return value is unexpected')
+
+    if len(set(test_manager.get('tests::test' + str(count)).get_watch_ns() for count in range(100))) != 1:
+        raise TestError('starts() and stops() did not share one clock reading')
+
+    test_total: int = sum(test_manager.get('tests::test' + str(count)).get_watch_ns() for count in range(100))
+
+    if test_manager.get_watchs_ns() != test_total or test_manager.get_watchs(watch_precision = 8) != round(test_total / 1e9, 8):
+        raise TestError('get_watchs() return value is not exact')
+
+    test_groups: dict = test_manager.get_watchs_by_prefix(['tests::test1', 'tests::test2'], watch_precision = 8)
+
+    if list(test_groups.keys()) != ['tests'] or test_groups['tests']['count'] != 2:
+        raise TestError('get_watchs_by_prefix() return value is unexpected')
+
+    if test_groups['tests']['sum'] != test_manager.get_watchs(['tests::test1', 'tests::test2'], 8):
+        raise TestError('get_watchs_by_prefix() return value is unexpected')
+
+    if test_manager.get_watchs_by_prefix(prefix_depth = 2)['tests::test7']['max'] != test_manager.get('tests::test7').get_watch():
+        raise TestError('get_watchs_by_prefix() return value is unexpected')
+
     test_manager.resets()
     
     test_manager.clear()
+
+    test_manager = StopwatchManager(
+        max_pool_count = 2
+    )
+
+    test_stopwatch: Stopwatch = test_manager.create_and_start('tests::test1')
+    test_stopwatch.lap()
+
+    test_manager.remove('tests::test1')
+
+    if test_manager.get_pool_count() != 1:
+        raise TestError('get_pool_count() return value is unexpected')
+
+    if test_manager.create('tests::test2') is not test_stopwatch:
+        raise TestError('create() did not reuse the pooled instance')
+
+    if test_stopwatch.get_lap_count() != 0 or test_stopwatch.get_watch_ns() != 0:
+        raise TestError('remove() did not reset the pooled instance')
+
+    if test_manager.get_pool_hits() != 1 or test_manager.get_pool_misses() != 1:
+        raise TestError('get_pool_hits() return value is unexpected')
+
+    test_manager.add('tests::test3', Stopwatch())
+
+    for count in range(3):
+        test_manager.create('tests::test' + str(count + 4))
+
+    test_manager.remove('tests::test3')
+
+    if test_manager.get_pool_count() != 0:
+        raise TestError('remove() recycled an instance it did not create')
+
+    test_manager.clear()
+
+    if test_manager.get_pool_count() != 2:
+        raise TestError('clear() did not respect max_pool_count')
+
+    test_manager.create_and_start('tests::test1').lap()
+    test_manager.create('tests::test2')
+
+    test_arrays: dict = test_manager.to_arrays(['tests::test1', 'tests::test2'])
+
+    if test_arrays['names'] != ['tests::test1', 'tests::test2'] or list(test_arrays['lap_offsets']) != [0, 1, 1]:
+        raise TestError('to_arrays() return value is unexpected')
+
+    if list(test_arrays['lap_counts']) != test_manager.get('tests::test1').get_lap_counts():
+        raise TestError('to_arrays() return value is unexpected')
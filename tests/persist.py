@@ -0,0 +1,147 @@
+# tests.persist.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block persist.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import io
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import StopwatchManager
+from stopwatch import FormatError
+
+
+# define tests function
+
+def tests():
+    test_stopwatch: Stopwatch = Stopwatch(
+        default_precision = 6,
+        percentile_accuracy = 0.01
+    )
+
+    test_stopwatch.start()
+    test_stopwatch.lap('tests::test1')
+
+    for count in range(100):
+        test_stopwatch.lap()
+
+    test_stopwatch.lap('tests::test2')
+    test_stopwatch.stop()
+
+    test_file: io.BytesIO = io.BytesIO()
+    test_stopwatch.dump(test_file)
+    test_file.seek(0)
+
+    test_loaded: Stopwatch = Stopwatch.load(test_file)
+
+    if test_loaded.get_laps() != test_stopwatch.get_laps() or test_loaded.get_lap_counts() != test_stopwatch.get_lap_counts():
+        raise TestError('load() lost timing records')
+
+    if test_loaded.get_watch_ns() != test_stopwatch.get_watch_ns() or test_loaded.get_precision() != 6:
+        raise TestError('load() lost the total time')
+
+    if test_loaded.get_stddev_of_laps(8) != test_stopwatch.get_stddev_of_laps(8) or \
+        test_loaded.get_percentile_of_laps(90) != test_stopwatch.get_percentile_of_laps(90):
+        raise TestError('load() lost the lap statistics')
+
+    test_stopwatch = Stopwatch(histogram_buckets = [0.001, 0.01])
+    test_stopwatch.record(500000)
+    test_stopwatch.record(5000000)
+
+    test_file = io.BytesIO()
+    test_stopwatch.dump(test_file)
+    test_file.seek(0)
+
+    test_loaded = Stopwatch.load(test_file)
+
+    if test_loaded.get_histogram() is None or test_loaded.get_histogram().get_state() != test_stopwatch.get_histogram().get_state():
+        raise TestError('load() lost the lap histogram')
+
+    test_loaded.record(50000000)
+
+    if test_loaded.get_histogram().get_counts() != [1, 2, 3]:
+        raise TestError('load() did not restore a working lap histogram')
+
+    test_stopwatch = Stopwatch(max_laps = 3)
+    test_stopwatch.start()
+
+    for count in range(5):
+        test_stopwatch.lap('n3' if count == 2 else None)
+
+    test_stopwatch.stop()
+
+    test_file = io.BytesIO()
+    test_stopwatch.dump(test_file)
+    test_file.seek(0)
+
+    test_loaded = Stopwatch.load(test_file)
+
+    if test_loaded.get_laps() != ['n3', 'lap_4', 'lap_5'] or test_loaded.get_lap_counts() != test_stopwatch.get_lap_counts():
+        raise TestError('load() renumbered ring buffer timing records')
+
+    if test_loaded.get_lap('lap_5') != test_stopwatch.get_lap('lap_5') or test_loaded.has_lap('lap_2'):
+        raise TestError('load() lost the ring buffer record numbers')
+
+    test_loaded.record(7)
+
+    if test_loaded.get_laps() != ['lap_4', 'lap_5', 'lap_6'] or test_loaded.get_lap_counts()[-1] != 7:
+        raise TestError('load() did not continue the ring buffer record numbers')
+
+    test_manager: StopwatchManager = StopwatchManager()
+
+    for count in range(10):
+        test_manager.create_and_start('tests::test' + str(count)).lap()
+
+    test_manager.add('tests::compact', Stopwatch(max_laps = 4))
+    test_manager.get('tests::compact').record(5)
+
+    test_file = io.BytesIO()
+    test_manager.dump(test_file)
+    test_file.seek(0)
+
+    test_names: list = [stopwatch_name for stopwatch_name, stopwatch_instance in StopwatchManager.iter_load(test_file)]
+
+    if test_names != ['tests::test' + str(count) for count in range(10)] + ['tests::compact']:
+        raise TestError('iter_load() return value is unexpected')
+
+    test_file.seek(0)
+    test_loaded_manager: StopwatchManager = StopwatchManager()
+
+    if test_loaded_manager.load(test_file) != 11:
+        raise TestError('load() return value is unexpected')
+
+    if test_loaded_manager.get('tests::test3').get_lap_counts() != test_manager.get('tests::test3').get_lap_counts():
+        raise TestError('load() lost timing records')
+
+    if test_loaded_manager.get('tests::compact').get_lap_counts() != [5]:
+        raise TestError('load() lost compact timing records')
+
+    for test_bytes in (b'', b'XXXX\x01\x00\x01\x00', test_file.getvalue()[:-5]):
+        try:
+            StopwatchManager().load(io.BytesIO(test_bytes))
+            raise TestError('load() accepted invalid data')
+        except FormatError:
+            pass
@@ -0,0 +1,131 @@
+# tests.sampling.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block sampling.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import random
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import StopwatchManager
+from stopwatch import FixedRateSampler
+from stopwatch import AdaptiveSampler
+from stopwatch import ReservoirSampler
+from stopwatch import timed
+
+from stopwatch.laps import ReservoirLapStorage
+
+
+# define tests function
+
+def tests():
+    random.seed(1)
+
+    test_stopwatch: Stopwatch = Stopwatch(
+        sampler = FixedRateSampler(0.1)
+    )
+
+    for count in range(20000):
+        test_stopwatch.record(1000)
+
+    if abs(test_stopwatch.get_estimated_lap_count() - 20000) > 1000:
+        raise TestError('get_estimated_lap_count() is biased')
+
+    if abs(test_stopwatch.get_watch_ns() - 20000000) > 1000000:
+        raise TestError('get_watch_ns() is biased')
+
+    if test_stopwatch.get_lap_count() > 3000 or test_stopwatch.get_average_of_laps(8) != 0.000001:
+        raise TestError('get_average_of_laps() return value is unexpected')
+
+    test_stopwatch = Stopwatch(
+        sampler = ReservoirSampler(100)
+    )
+
+    test_stopwatch.record(1, 'tests::test1')
+
+    for count in range(10000):
+        test_stopwatch.record(count)
+
+    if test_stopwatch.get_lap_count() != 100 or test_stopwatch.get_estimated_lap_count() != 10001:
+        raise TestError('get_lap_count() return value is unexpected')
+
+    if abs(sum(test_stopwatch.get_lap_counts()) / 100 - 5000) > 1000:
+        raise TestError('get_lap_counts() is not a uniform sample')
+
+    for lap_name, lap_count in zip(test_stopwatch.get_laps(), test_stopwatch.get_lap_counts()):
+        if test_stopwatch.get_lap(lap_name, 8) != round(lap_count / 1e9, 8):
+            raise TestError('get_lap() return value is unexpected')
+
+    test_storage: ReservoirLapStorage = ReservoirLapStorage(50)
+
+    for count in range(5000):
+        test_storage.append('tests::test' + str(count) if count % 7 == 0 else None, count)
+
+    test_names: list = test_storage.get_names()
+
+    if [test_storage.find(lap_name) for lap_name in test_names] != list(range(50)):
+        raise TestError('find() return value is unexpected')
+
+    if sum(test_storage.has('tests::test' + str(count)) or test_storage.has('lap_' + str(count + 1)) 
+        for count in range(5000)) != 50:
+        raise TestError('has() found a replaced record')
+
+    test_storage.clear()
+    test_storage.append(None, 5)
+
+    if test_storage.get_by_number(1) != 5 or test_storage.has('lap_2'):
+        raise TestError('clear() did not reset the record positions')
+
+    test_sampler: AdaptiveSampler = AdaptiveSampler(
+        cpu_budget = 0.001,
+        record_cost_ns = 100000,
+        adjust_count = 64
+    )
+
+    for count in range(10000):
+        test_sampler.sample()
+
+    if test_sampler.get_rate() >= 1:
+        raise TestError('AdaptiveSampler did not lower the rate')
+
+    test_manager: StopwatchManager = StopwatchManager(
+        stopwatch_sampler = FixedRateSampler(0.5)
+    )
+
+    test_timer = timed('tests::test1', test_manager)
+
+    for count in range(1000):
+        with test_timer:
+            pass
+
+    if abs(test_manager.get('tests::test1').get_estimated_lap_count() - 1000) > 150:
+        raise TestError('timed() is biased')
+
+    try:
+        Stopwatch(sampler = 0.5)
+        raise TestError('Stopwatch() did not check the sampler')
+    except ValueError:
+        pass
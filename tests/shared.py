@@ -0,0 +1,130 @@
+# tests.shared.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block shared.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import multiprocessing
+
+from errors import TestError
+
+from stopwatch import SharedStopwatchManager
+from stopwatch import StopwatchNameError
+
+
+# define run_worker function
+
+def run_worker(
+    test_manager: SharedStopwatchManager
+):
+    test_stopwatch = test_manager.get('tests::test1')
+    test_stopwatch.start()
+
+    for count in range(100):
+        test_stopwatch.lap()
+
+    test_stopwatch.stop()
+
+
+# define tests function
+
+def tests():
+    test_manager: SharedStopwatchManager = SharedStopwatchManager(
+        stopwatch_names = ['tests::test1', 'tests::test2'],
+        max_worker_count = 8
+    )
+
+    try:
+        run_worker(test_manager)
+
+        if 'fork' in multiprocessing.get_all_start_methods():
+            test_processes: list = [multiprocessing.get_context('fork').Process(
+                target = run_worker, args = (test_manager,)) for count in range(4)]
+
+            for test_process in test_processes:
+                test_process.start()
+
+            for test_process in test_processes:
+                test_process.join()
+
+            worker_count: int = 5
+        else:
+            worker_count: int = 1
+
+        if test_manager.get_worker_count() != worker_count:
+            raise TestError('get_worker_count() return value is unexpected')
+
+        if test_manager.get_watch_count('tests::test1') != worker_count:
+            raise TestError('get_watch_count() return value is unexpected')
+
+        lap_statistics = test_manager.get_lap_statistics('tests::test1')
+
+        if lap_statistics.get_count() != worker_count * 100:
+            raise TestError('get_lap_statistics() return value is unexpected')
+
+        if lap_statistics.get_total() > test_manager.get_watch_ns('tests::test1'):
+            raise TestError('get_lap_statistics() return value is error')
+
+        if test_manager.get_watch_ns('tests::test2') != 0:
+            raise TestError('get_watch_ns() return value is error')
+
+        if not isinstance(test_manager.get_watchs(), float):
+            raise TestError('get_watchs() return value is unexpected')
+
+        try:
+            test_manager.get('tests::test3')
+            raise TestError('get() error')
+        except StopwatchNameError:
+            pass
+    finally:
+        test_manager.close()
+        test_manager.unlink()
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return
+
+    test_manager = SharedStopwatchManager(
+        stopwatch_names = ['tests::test1'],
+        max_worker_count = 2
+    )
+
+    try:
+        for count in range(6):
+            test_process = multiprocessing.get_context('fork').Process(
+                target = run_worker, args = (test_manager,))
+
+            test_process.start()
+            test_process.join()
+
+            if test_process.exitcode != 0:
+                raise TestError('a respawned worker could not claim a slot')
+
+        if test_manager.get_worker_count() != 2 or test_manager.get_watch_count('tests::test1') != 6:
+            raise TestError('respawned workers did not take over the slots of exited workers')
+
+        if test_manager.get_lap_statistics('tests::test1').get_count() != 600:
+            raise TestError('a taken over slot lost its totals')
+    finally:
+        test_manager.close()
+        test_manager.unlink()
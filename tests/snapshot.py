@@ -0,0 +1,102 @@
+# tests.snapshot.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block snapshot.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import time
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import StopwatchStatus
+from stopwatch import ThreadLocalStopwatch
+from stopwatch import StopwatchManager
+from stopwatch import StopwatchNameError
+from stopwatch import StopwatchSnapshot
+from stopwatch import SnapshotField
+
+
+# define tests function
+
+def tests():
+    test_manager: StopwatchManager = StopwatchManager()
+    test_manager.create('a').record(1000)
+    test_manager.get('a').record(3000)
+    test_manager.create_and_start('b')
+    test_manager.add('c', ThreadLocalStopwatch())
+    test_manager.get('c').record(5000)
+
+    test_snapshot: StopwatchSnapshot = test_manager.snapshot()
+
+    if test_snapshot.get_names() != ('a', 'b', 'c') or test_snapshot.get_count() != 3:
+        raise TestError('snapshot() did not capture every stopwatch')
+
+    if test_snapshot.get('a') != (StopwatchStatus.Stopped, 4000, 2, 4000, 1000, 3000, 2000.0):
+        raise TestError('snapshot() record is unexpected')
+
+    if test_snapshot.get_status('b') != StopwatchStatus.Started or test_snapshot.get_started_count() != 1:
+        raise TestError('snapshot() did not capture the status')
+
+    if test_snapshot.get_watch_ns('b') != test_manager.get('b').get_watch_ns(test_snapshot.get_count_ns()):
+        raise TestError('snapshot() did not measure at the snapshot clock reading')
+
+    if test_snapshot.get_lap_count('c') != 1 or test_snapshot.get_watchs_ns() != 9000 + test_snapshot.get_watch_ns('b'):
+        raise TestError('snapshot() did not capture a ThreadLocalStopwatch')
+
+    time.sleep(0.001)
+    test_manager.get('a').record(2000)
+
+    test_next: StopwatchSnapshot = test_manager.snapshot()
+
+    if test_next.get_records()[2] is not test_snapshot.get_records()[2]:
+        raise TestError('snapshot() did not reuse an unchanged record')
+
+    if test_next.get_lap_count('a') != 3 or test_snapshot.get_lap_count('a') != 2:
+        raise TestError('snapshot() did not capture a changed record')
+
+    if test_next.get_watch_ns('b') <= test_snapshot.get_watch_ns('b'):
+        raise TestError('snapshot() did not measure a running stopwatch again')
+
+    test_manager.get('b').stop()
+    test_manager.remove('a')
+    test_manager.add('a', Stopwatch())
+
+    test_next = test_manager.snapshot(['a', 'b', 'missing'])
+
+    if test_next.get_names() != ('b', 'a') or test_next.has('missing') or test_next.get_lap_count('a') != 0:
+        raise TestError('snapshot() did not capture the selection')
+
+    if test_next.get_status('b') != StopwatchStatus.Stopped or test_next.get_watch('b', 6) != round(
+        test_manager.get('b').get_watch_ns() / 1e9, 6):
+        raise TestError('snapshot() did not capture a stopped stopwatch')
+
+    try:
+        test_next.get('c')
+        raise TestError('get() did not raise a StopwatchNameError')
+    except StopwatchNameError:
+        pass
+
+    if len(test_next.get('b')) != SnapshotField.Count:
+        raise TestError('snapshot() record length is unexpected')
@@ -0,0 +1,99 @@
+# tests.spans.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block spans.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+from errors import TestError
+
+from stopwatch import SpanStopwatch
+from stopwatch import SpanNode
+from stopwatch import StatusError
+
+
+# define run_request function
+
+def run_request(
+    test_stopwatch: SpanStopwatch
+):
+    test_stopwatch.enter('request', 0)
+    test_stopwatch.enter('db', 10)
+
+    for count in range(3):
+        test_stopwatch.enter('query', 20 + count * 10)
+        test_stopwatch.exit(25 + count * 10)
+
+    test_stopwatch.exit(60)
+    test_stopwatch.exit(100)
+
+
+# define tests function
+
+def tests():
+    test_stopwatch: SpanStopwatch = SpanStopwatch()
+
+    run_request(test_stopwatch)
+
+    test_request: SpanNode = test_stopwatch.get_root().get_child('request')
+    test_db: SpanNode = test_request.get_child('db')
+
+    if test_request.get_total_ns() != 100 or test_request.get_self_ns() != 50:
+        raise TestError('get_self_ns() return value is unexpected')
+
+    if test_db.get_self_ns() != 35 or test_db.get_child('query').get_count() != 3:
+        raise TestError('get_child() return value is unexpected')
+
+    if [(span_depth, span_node.get_name()) for span_depth, span_node in test_stopwatch.get_root().walk()] != \
+        [(0, None), (1, 'request'), (2, 'db'), (3, 'query')]:
+        raise TestError('walk() return value is unexpected')
+
+    try:
+        test_stopwatch.exit()
+        raise TestError('exit() error')
+    except StatusError:
+        pass
+
+    test_tree: SpanNode = SpanNode()
+
+    for count in range(4):
+        test_stopwatch.reset()
+        run_request(test_stopwatch)
+        test_tree.merge(test_stopwatch.get_root())
+
+    if test_tree.get_child('request').get_count() != 4 or test_tree.get_child('request').get_self_ns() != 200:
+        raise TestError('merge() error')
+
+    with test_stopwatch.span('tests::span'):
+        with test_stopwatch.span('tests::child'):
+            if test_stopwatch.get_depth() != 2:
+                raise TestError('get_depth() return value is unexpected')
+
+        try:
+            test_stopwatch.reset()
+            raise TestError('reset() error')
+        except StatusError:
+            pass
+
+    if not test_stopwatch.get_root().get_child('tests::span').has_child('tests::child'):
+        raise TestError('span() error')
@@ -0,0 +1,108 @@
+# tests.threadsafe.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block threadsafe.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import threading
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch import ConcurrentStopwatchManager
+from stopwatch import StopwatchNameError
+from stopwatch.errors import MaxLimitError
+
+
+# define run_worker function
+
+def run_worker(
+    test_manager: ConcurrentStopwatchManager,
+    worker_index: int
+):
+    for count in range(200):
+        stopwatch_name: str = 'tests::worker' + str(worker_index) + '::' + str(count)
+
+        test_manager.create_and_start(stopwatch_name)
+        test_manager.get(stopwatch_name).lap()
+        test_manager.get_watchs()
+
+        if count % 2:
+            test_manager.remove(stopwatch_name)
+
+
+# define tests function
+
+def tests():
+    test_manager: ConcurrentStopwatchManager = ConcurrentStopwatchManager(
+        shard_count = 4
+    )
+
+    test_threads: list = [threading.Thread(target = run_worker, 
+        args = (test_manager, worker_index)) for worker_index in range(8)]
+
+    for test_thread in test_threads:
+        test_thread.start()
+
+    for test_thread in test_threads:
+        test_thread.join()
+
+    if test_manager.get_count() != 800:
+        raise TestError('get_count() return value is unexpected')
+
+    if test_manager.stops() != 800:
+        raise TestError('stops() return value is unexpected')
+
+    if not isinstance(test_manager.get_watchs(), float):
+        raise TestError('get_watchs() return value is unexpected')
+
+    try:
+        test_manager.get('tests::worker0::1')
+        raise TestError('get() error')
+    except StopwatchNameError:
+        pass
+
+    test_manager.clear()
+
+    if test_manager.get_count() != 0:
+        raise TestError('clear() error')
+
+    test_manager = ConcurrentStopwatchManager(
+        max_stopwatch_count = 2
+    )
+
+    test_manager.add('tests::test1', Stopwatch())
+    test_manager.create('tests::test2')
+
+    try:
+        test_manager.create('tests::test3')
+        raise TestError('create() did not respect max_stopwatch_count')
+    except MaxLimitError:
+        pass
+
+    test_manager.remove('tests::test1')
+    test_manager.create('tests::test3')
+
+    if test_manager.get_count() != 2:
+        raise TestError('get_count() return value is unexpected')
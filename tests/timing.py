@@ -0,0 +1,139 @@
+# tests.timing.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block timing.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+import time
+import asyncio
+import threading
+
+from errors import TestError
+
+import stopwatch.timing
+
+from stopwatch import timed
+from stopwatch import StopwatchManager
+
+
+# define tests function
+
+def tests():
+    test_manager: StopwatchManager = StopwatchManager()
+
+    @timed('tests::test1', test_manager)
+    def run_timed_function(test_value: int) -> int:
+        time.sleep(0.01)
+        return test_value
+
+    @timed('tests::test2', test_manager)
+    async def run_timed_coroutine_function():
+        await asyncio.sleep(0.01)
+
+    if run_timed_function(1) != 1 or run_timed_function.__name__ != 'run_timed_function':
+        raise TestError('timed() decorator error')
+
+    asyncio.run(run_timed_coroutine_function())
+
+    with timed('tests::test1', test_manager):
+        time.sleep(0.01)
+
+    if test_manager.get('tests::test1').get_lap_count() != 2:
+        raise TestError('timed() did not record the calls')
+
+    if test_manager.get('tests::test1').get_watch() < 0.02:
+        raise TestError('timed() recorded an unexpected total')
+
+    if test_manager.get('tests::test2').get_lap_count() != 1:
+        raise TestError('timed() did not record the coroutine call')
+
+    test_timer = timed('tests::test4', test_manager)
+    test_entered: threading.Event = threading.Event()
+    test_exited: threading.Event = threading.Event()
+
+    def run_first_worker():
+        with test_timer:
+            test_entered.set()
+            time.sleep(0.05)
+
+        test_exited.set()
+
+    def run_second_worker():
+        test_entered.wait()
+        time.sleep(0.01)
+
+        with test_timer:
+            test_exited.wait()
+            time.sleep(0.05)
+
+    test_threads: list = [threading.Thread(target = run_first_worker), threading.Thread(target = run_second_worker)]
+
+    for test_thread in test_threads:
+        test_thread.start()
+
+    for test_thread in test_threads:
+        test_thread.join()
+
+    if min(test_manager.get('tests::test4').get_lap_counts()) < 40000000:
+        raise TestError('timed() mixed up the with blocks of different threads')
+
+    async def run_timed_block(test_delay: float):
+        await asyncio.sleep(test_delay)
+
+        with test_timer:
+            await asyncio.sleep(0.05)
+
+    async def run_timed_blocks():
+        await asyncio.gather(run_timed_block(0), run_timed_block(0.01))
+
+    asyncio.run(run_timed_blocks())
+
+    if test_manager.get('tests::test4').get_lap_count() != 4 or \
+        min(test_manager.get('tests::test4').get_lap_counts()) < 40000000:
+        raise TestError('timed() mixed up the with blocks of different tasks')
+
+    stopwatch.timing.disable()
+
+    try:
+        if stopwatch.timing.is_enabled():
+            raise TestError('is_enabled() return value is unexpected')
+
+        def run_function():
+            pass
+
+        if timed('tests::test3', test_manager)(run_function) is not run_function:
+            raise TestError('timed() decorated a function while disabled')
+
+        with timed('tests::test3', test_manager):
+            pass
+
+        if test_manager.has('tests::test3'):
+            raise TestError('timed() recorded while disabled')
+
+        run_timed_function(1)
+    finally:
+        stopwatch.timing.enable()
+
+    if test_manager.get('tests::test1').get_lap_count() != 3:
+        raise TestError('timed() stopped recording an already decorated function')
@@ -31,6 +31,7 @@ from errors import TestError
 
 from stopwatch import Stopwatch
 from stopwatch import StopwatchStatus
+from stopwatch import LapNameError
 
 
 # define tests function
@@ -42,6 +43,18 @@ def tests():
         default_precision = 3
     )
 
+    if test_stopwatch.get_laps() != [] or test_stopwatch.get_lap_count() != 0:
+        raise TestError('get_laps() return value is unexpected')
+
+    if test_stopwatch.has_lap('tests::test1') or test_stopwatch.get_average_of_laps() != 0:
+        raise TestError('has_lap() return value is error')
+
+    try:
+        test_stopwatch.unexpected_attribute = None
+        raise TestError('__slots__ error')
+    except AttributeError:
+        pass
+
     test_stopwatch.start()
 
     if not isinstance(test_stopwatch.lap('tests::test1'), float):
@@ -62,6 +75,14 @@ def tests():
 
     if total_of_watch < 0.9 or total_of_watch > 1.5:
         raise TestError('get_watch() return value is error')
+
+    total_of_watch_ns: int = test_stopwatch.get_watch_ns()
+
+    if not isinstance(total_of_watch_ns, int):
+        raise TestError('get_watch_ns() return value is unexpected')
+
+    if total_of_watch_ns < 900000000 or total_of_watch_ns > 1500000000:
+        raise TestError('get_watch_ns() return value is error')
     
     is_has: bool = test_stopwatch.has_lap('tests::test1')
 
@@ -99,8 +120,144 @@ def tests():
     
     if not isinstance(test_stopwatch.get_laps(), list):
         raise TestError('get_laps() return value is unexpected')
+
+    if test_stopwatch.get_min_of_laps(8) > test_stopwatch.get_average_of_laps(8):
+        raise TestError('get_min_of_laps() return value is error')
+
+    if test_stopwatch.get_max_of_laps(8) < test_stopwatch.get_average_of_laps(8):
+        raise TestError('get_max_of_laps() return value is error')
+
+    if not isinstance(test_stopwatch.get_stddev_of_laps(), float):
+        raise TestError('get_stddev_of_laps() return value is unexpected')
     
     test_stopwatch.reset()
 
     if test_stopwatch.has_lap('tests::test1'):
         raise TestError('reset() error')
+
+    if test_stopwatch.get_watch_ns() != 0:
+        raise TestError('reset() error')
+
+    for count in range(1000):
+        test_stopwatch.start()
+        test_stopwatch.stop()
+
+    if test_stopwatch.get_watch_ns() <= 0:
+        raise TestError('get_watch_ns() return value is error')
+
+    test_stopwatch = Stopwatch(
+        compact_laps = True
+    )
+
+    test_stopwatch.start()
+    test_stopwatch.lap()
+    test_stopwatch.lap('tests::test1')
+
+    for count in range(1000):
+        test_stopwatch.lap()
+
+    test_stopwatch.stop()
+
+    if test_stopwatch.get_lap_count() != 1002:
+        raise TestError('get_lap_count() return value is unexpected')
+
+    if test_stopwatch.get_laps()[:3] != ['lap_1', 'tests::test1', 'lap_3']:
+        raise TestError('get_laps() return value is unexpected')
+
+    if not test_stopwatch.has_lap('lap_1') or test_stopwatch.has_lap('lap_2'):
+        raise TestError('has_lap() return value is error')
+
+    if test_stopwatch.get_lap('tests::test1') != test_stopwatch.get_lap_by_number(2):
+        raise TestError('get_lap_by_number() return value is error')
+
+    if not isinstance(test_stopwatch.get_average_of_laps(), float):
+        raise TestError('get_average_of_laps() return value is unexpected')
+
+    if test_stopwatch.get_percentile_of_laps(50, 8) > test_stopwatch.get_max_of_laps(8):
+        raise TestError('get_percentile_of_laps() return value is error')
+
+    try:
+        test_stopwatch.get_lap_by_number(1003)
+        raise TestError('get_lap_by_number() error')
+    except LapNameError:
+        pass
+
+    test_stopwatch.reset()
+
+    if test_stopwatch.get_lap_count() != 0:
+        raise TestError('reset() error')
+
+    test_stopwatch = Stopwatch(
+        default_precision = 8,
+        percentile_accuracy = 0.01
+    )
+
+    test_stopwatch.start()
+
+    for count in range(1000):
+        test_stopwatch.lap()
+
+    test_stopwatch.stop()
+
+    if not isinstance(test_stopwatch.get_percentile_of_laps(99), float):
+        raise TestError('get_percentile_of_laps() return value is unexpected')
+
+    if test_stopwatch.get_percentile_of_laps(100) > test_stopwatch.get_max_of_laps() * 1.02:
+        raise TestError('get_percentile_of_laps() return value is error')
+
+    if test_stopwatch.get_percentile_of_laps(0) < test_stopwatch.get_min_of_laps() * 0.98:
+        raise TestError('get_percentile_of_laps() return value is error')
+
+    test_stopwatch = Stopwatch(
+        max_laps = 10
+    )
+
+    test_stopwatch.start()
+    test_stopwatch.lap('tests::test1')
+
+    for count in range(99):
+        test_stopwatch.lap()
+
+    test_stopwatch.lap('tests::test2')
+
+    if test_stopwatch.get_lap_count() != 10:
+        raise TestError('get_lap_count() return value is unexpected')
+
+    if test_stopwatch.get_laps() != ['lap_' + str(count) for count in range(92, 101)] + ['tests::test2']:
+        raise TestError('get_laps() return value is unexpected')
+
+    if test_stopwatch.has_lap('tests::test1') or test_stopwatch.has_lap('lap_91'):
+        raise TestError('has_lap() return value is error')
+
+    if test_stopwatch.get_lap('tests::test2') != test_stopwatch.get_lap_by_number(101):
+        raise TestError('get_lap_by_number() return value is error')
+
+    test_stopwatch.lap('tests::test1')
+    test_stopwatch.stop()
+
+    if test_stopwatch.get_laps()[-2:] != ['tests::test2', 'tests::test1']:
+        raise TestError('get_laps() return value is unexpected')
+
+    if test_stopwatch.get_percentile_of_laps(100, 8) > test_stopwatch.get_max_of_laps(8):
+        raise TestError('get_percentile_of_laps() return value is error')
+
+    if list(test_stopwatch.laps_as_array()) != test_stopwatch.get_lap_counts():
+        raise TestError('laps_as_array() return value is unexpected')
+
+    test_stopwatch = Stopwatch(
+        compact_laps = True
+    )
+
+    if len(test_stopwatch.laps_as_array()) != 0:
+        raise TestError('laps_as_array() return value is unexpected')
+
+    test_stopwatch.start()
+
+    for count in range(10):
+        test_stopwatch.lap()
+
+    test_laps = test_stopwatch.laps_as_array()
+    test_stopwatch.lap()
+
+    if list(test_laps) != test_stopwatch.get_lap_counts()[:10]:
+        raise TestError('lap() invalidated the laps_as_array() view')
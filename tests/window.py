@@ -0,0 +1,88 @@
+# tests.window.py is python-3.7.4 source file
+
+# Copyright (c) 2019 SmallSO Labs.
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+'''
+This module implements unit testing of the block window.py 
+    for stopwatch to ensure it works correctly.
+'''
+
+from errors import TestError
+
+from stopwatch import Stopwatch
+from stopwatch.window import RollingWindow
+
+
+# define tests function
+
+def tests():
+    test_window: RollingWindow = RollingWindow(
+        bucket_count = 10,
+        bucket_width_ns = 1000
+    )
+
+    for count in range(100):
+        test_window.update(count + 1, count * 100)
+
+    if test_window.get_count(window_time = 9999) != 100 or test_window.get_count(1000, 9999) != 10:
+        raise TestError('get_count() return value is unexpected')
+
+    if test_window.get_mean(2000, 9999) != 90.5 or test_window.get_max(2000, 9999) != 100:
+        raise TestError('get_mean() return value is unexpected')
+
+    if abs(test_window.get_percentile(50, None, 9999) - 50.5) > 1:
+        raise TestError('get_percentile() return value is unexpected')
+
+    test_window.update(1000, 10500)
+
+    if test_window.get_count(window_time = 10500) != 91 or test_window.get_min(1000, 10500) != 1000:
+        raise TestError('update() did not clear the reused bucket')
+
+    if test_window.get_count(window_time = 30000) != 0 or test_window.get_mean(window_time = 30000) != 0:
+        raise TestError('get_count() counted expired buckets')
+
+    if test_window.get_rate(1000, 10999) != 1000000:
+        raise TestError('get_rate() return value is unexpected')
+
+    test_stopwatch: Stopwatch = Stopwatch(
+        window_seconds = 10
+    )
+
+    if test_stopwatch.get_window_count() != 0 or test_stopwatch.get_window_average() != 0:
+        raise TestError('get_window_count() return value is unexpected')
+
+    for count in range(100):
+        test_stopwatch.record(1000000)
+
+    if test_stopwatch.get_window_count(10) != 100 or test_stopwatch.get_window_count(1) > 100:
+        raise TestError('get_window_count() return value is unexpected')
+
+    if test_stopwatch.get_window_average(10, 3) != 0.001 or test_stopwatch.get_window_percentile(99, 10, 3) != 0.001:
+        raise TestError('get_window_average() return value is unexpected')
+
+    if test_stopwatch.get_window_rate(10) < 10:
+        raise TestError('get_window_rate() return value is unexpected')
+
+    try:
+        test_stopwatch.get_window_count(60)
+        raise TestError('get_window_count() did not check window_seconds')
+    except ValueError:
+        pass